@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+import price_store
+from drip import simulate_drip
+from timeutil import DAYS_PER_YEAR
+
+# Streamlit 없이 쓸 수 있는 분석 계산 모음
+# 페이지(app_pages/*), streamlit_graph_eunjeong, 배치 CLI(dividend_report.py)가 같은 함수를 쓴다.
+
+REPORT_COLUMNS = [
+    'ticker', 'start', 'end', 'years', 'last_close', 'ttm_dividend', 'dividend_yield',
+    'payment_months', 'payments_per_year', 'price_return', 'total_return', 'price_cagr', 'drip_cagr', 'error',
+]
+
+
+def calculate_total_return(df):
+    """일별 총수익률 (종가 + 배당) / 전일 종가 - 1 을 'Total Return' 컬럼으로 붙인 복사본."""
+    df = df.copy()
+    df['Dividend'] = df['Dividends']
+    df['Total Return'] = (df['Close'] + df['Dividend']) / df['Close'].shift(1) - 1
+    return df
+
+
+def calculate_group_average(df, tickers):
+    """'Ticker' 컬럼이 tickers 에 속하는 행들의 날짜별 평균 총수익률."""
+    df_group = df[df['Ticker'].isin(tickers)]
+    return df_group.groupby(df_group.index)['Total Return'].mean()
+
+
+def cagr(start_value, end_value, years):
+    """연복리 수익률. 기간이 없거나 시작 값이 0 이하이면 NaN."""
+    if years <= 0 or start_value <= 0:
+        return np.nan
+    return (end_value / start_value) ** (1.0 / years) - 1.0
+
+
+def trailing_dividends(dividends, as_of=None):
+    """as_of(기본: 마지막 배당일) 이전 1년 동안의 배당 이벤트."""
+    if dividends.empty:
+        return dividends
+    as_of = dividends.index[-1] if as_of is None else as_of
+    return dividends[(dividends.index > as_of - pd.DateOffset(years=1)) & (dividends.index <= as_of)]
+
+
+def payment_months(dividends, as_of=None):
+    """as_of 이전 1년 동안 배당이 나온 달 (1..12, 오름차순)."""
+    return sorted(set(trailing_dividends(dividends, as_of).index.month))
+
+
+def drip_report(ticker, history=None, start=None, end=None):
+    """한 종목의 배당/재투자 요약 한 줄 (REPORT_COLUMNS 키의 dict).
+
+    history 를 주지 않으면 price_store 에서 읽는다. [start, end) 구간만 계산한다.
+    """
+    ticker = ticker.upper()
+    if history is None:
+        history = price_store.load_history(ticker)
+    history = price_store.slice_history(history, start=start, end=end)
+    row = dict.fromkeys(REPORT_COLUMNS, np.nan)
+    row.update(ticker=ticker, error=None)
+    if history.empty:
+        row['error'] = '시세 데이터 없음'
+        return row
+
+    close = history['Close']
+    dividends = price_store.dividend_events(history)
+    ttm = trailing_dividends(dividends, as_of=history.index[-1])
+    years = (history.index[-1] - history.index[0]).days / DAYS_PER_YEAR
+    drip_value = simulate_drip(close, history['Dividends'])['value']
+
+    row.update(
+        start=history.index[0].date(),
+        end=history.index[-1].date(),
+        years=years,
+        last_close=float(close.iloc[-1]),
+        ttm_dividend=float(ttm.sum()),
+        dividend_yield=float(ttm.sum() / close.iloc[-1]),
+        payment_months=','.join(str(month) for month in payment_months(dividends, as_of=history.index[-1])),
+        payments_per_year=len(ttm),
+        price_return=float(close.iloc[-1] / close.iloc[0] - 1),
+        total_return=float(drip_value.iloc[-1] / close.iloc[0] - 1),
+        price_cagr=cagr(close.iloc[0], close.iloc[-1], years),
+        drip_cagr=cagr(close.iloc[0], drip_value.iloc[-1], years),
+    )
+    return row
@@ -0,0 +1,228 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+import dividend_index
+import perf
+import price_store
+from dividend_calendar import MODES, monthly_dividend_matrix
+from portfolio import Portfolio
+from projection import project_portfolio
+
+# 페이지 1: 포트폴리오 분석
+st.title('나만의 월 배당 포트폴리오 구축')
+
+# 포트폴리오를 저장할 리스트
+if 'portfolio' not in st.session_state:
+    st.session_state.portfolio = Portfolio()
+
+# 초기 자본 입력받기 (단위: 달러)
+initial_capital = st.number_input('초기 자본을 입력하세요 (단위: 달러)', min_value=0.0, value=10000.0)  # 달러 단위로 입력
+
+# 남은 자본 계산 (포트폴리오에 추가된 주식들을 고려)
+if 'remaining_capital' not in st.session_state:
+    st.session_state.remaining_capital = initial_capital
+else:
+    st.session_state.remaining_capital = initial_capital - st.session_state.portfolio.total_investment
+
+# 남은 자본 표시
+st.write(f"남은 자본: ${st.session_state.remaining_capital:.2f}")
+
+# 포트폴리오가 바뀐 직후 다시 실행되었을 때 보여줄 안내
+notice = st.session_state.pop('portfolio_notice', None)
+if notice:
+    st.success(notice)
+
+
+# 종목 검색/매수 입력은 이 부분만 다시 실행된다 (티커 입력이나 금액을 바꿔도 차트는 다시 그리지 않음)
+@st.fragment
+def holding_builder():
+    # 주식 검색 및 주가 정보 가져오기
+    ticker = st.text_input('주식 티커를 입력하세요 (예: AAPL, MSFT):')
+    stock_price = None  # 주가를 저장할 변수 초기화
+
+    # 주식 추가 기능
+    if ticker:
+        try:
+            history = price_store.load_history(ticker.upper())  # 공유 캐시/로컬 저장소에서 전체 시세 가져오기
+            dividends = price_store.load_dividends(ticker.upper())  # 배당금 데이터 가져오기
+            stock_data = history.tail(1)  # 최신 주가 데이터 가져오기
+
+            if not dividends.empty and not stock_data.empty:
+                latest_price = stock_data['Close'].iloc[-1]  # 최근 종가 가져오기
+                st.write(f'현재 {ticker.upper()}의 주가는 ${latest_price:.2f}입니다.')
+
+                if not dividends.empty:
+                    latest_dividend = dividends.iloc[-1]  # 최신 배당금
+                    st.write(f'현재 {ticker.upper()}의 최신 배당금: ${latest_dividend:.2f}')
+                    months = dividend_index.get_index().months(ticker.upper())  # 최근 12개월 실제 지급 월
+                    if months:
+                        st.write(f"{ticker.upper()}의 배당 지급 월: {', '.join(f'{month}월' for month in months)}")
+                else:
+                    st.write(f'{ticker.upper()}의 배당금 정보가 없습니다.')
+
+
+                # 매수할 금액 입력받기
+                investment_amount = st.number_input('매수할 금액을 입력하세요 (단위: 달러)', min_value=0.0, max_value=float(st.session_state.remaining_capital), step=100.0)
+
+                # 남은 자본을 업데이트하여 표시
+                st.write(f"매수 후 남은 자본: ${st.session_state.remaining_capital - investment_amount:.2f}")
+
+                if investment_amount > 0 and investment_amount <= st.session_state.remaining_capital:
+                    num_shares = investment_amount // latest_price  # 매수 가능한 주식 수
+                    total_investment = num_shares * latest_price  # 총 투자 금액
+
+                    st.write(f'{investment_amount:.2f} 달러로 {num_shares:.2f} 주를 매수할 수 있습니다. (총 투자: ${total_investment:.2f})')
+
+                    if st.button("매수"):
+                        # 포트폴리오에 해당 주식 추가
+                        # (배당 이력은 복사하지 않고 티커, 주식 수, 총 투자 금액만 저장)
+                        st.session_state.portfolio.add(ticker.upper(), num_shares, total_investment)
+                        st.session_state.remaining_capital -= total_investment  # 남은 자본에서 차감
+                        st.session_state.portfolio_notice = f'{ticker.upper()} 주식 {num_shares:.2f} 주가 포트폴리오에 추가되었습니다.'
+                        st.rerun()  # 남은 자본, 배당 차트, 사이드바 목록까지 바로 반영되도록 페이지 전체를 다시 실행합니다.
+                else:
+                    st.warning(f"투자할 금액이 남은 자본을 초과하거나 유효하지 않습니다.")
+            else:
+                st.error(f'{ticker.upper()} 주식에 대한 배당금 데이터가 없습니다.')
+        except Exception as e:
+            st.error(f"데이터를 가져오는 중 오류 발생: {e}")
+
+
+def monthly_dividend_figure(portfolio, mode):
+    # 보유 내역(version)과 집계 기준이 그대로면 지난번 그래프를 재사용한다
+    key = (id(portfolio), portfolio.version, mode)
+    cached = st.session_state.get('monthly_dividend_figure')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # 각 주식의 배당금을 월별로 한 번에 집계
+    matrix = monthly_dividend_matrix(portfolio.dividend_streams(), mode=mode)
+
+    # X축에 12개월을 명시적으로 표시하도록 설정
+    months = [str(i) for i in range(1, 13)]  # 1월부터 12월까지
+
+    # 월별 배당금 누적 막대그래프 (티커마다 12개 값짜리 막대 하나, px.bar 의 그룹 분할 단계를 건너뛴다)
+    fig = go.Figure([
+        go.Bar(x=months, y=matrix.loc[ticker].to_numpy(), name=ticker, hovertemplate='ticker=' + ticker + '<br>월=%{x}<br>배당금 ($)=%{y}<extra></extra>')
+        for ticker in matrix.index
+    ])
+    fig.update_layout(
+        title='포트폴리오의 월별 배당금 흐름',
+        xaxis=dict(title='월', categoryorder='array', categoryarray=months),  # X축에 1~12까지 표시
+        yaxis_title='배당금 ($)',
+        legend_title_text='ticker',
+        barmode='stack'  # 막대를 누적하여 표시
+    )
+    st.session_state.monthly_dividend_figure = (key, fig)
+    return fig
+
+
+# 월별 배당 차트 (집계 기준을 바꾸면 이 부분만 다시 실행된다)
+@st.fragment
+def monthly_dividend_chart():
+    st.subheader('포트폴리오')
+    if st.session_state.portfolio:
+        # 배당 집계 기준 선택 (차트에는 항상 티커 x 12개월 값만 전달)
+        mode_labels = list(MODES.values())
+        selected_mode = st.radio('배당 집계 기준', mode_labels, index=mode_labels.index(MODES['all']), horizontal=True)
+        mode = list(MODES)[mode_labels.index(selected_mode)]
+
+        fig = monthly_dividend_figure(st.session_state.portfolio, mode)
+        with perf.span('plotly_chart', 'render'):
+            st.plotly_chart(fig)
+    else:
+        st.info('포트폴리오에 주식을 추가하세요.')
+
+
+def fan_figure(fan, title, yaxis_title):
+    # 가운데 선은 중앙값, 진한 띠는 25~75%, 옅은 띠는 5~95% 경로
+    fig = go.Figure()
+    for low, high, color in (('p5', 'p95', 'rgba(0, 128, 0, 0.15)'), ('p25', 'p75', 'rgba(0, 128, 0, 0.3)')):
+        fig.add_trace(go.Scatter(x=fan.index, y=fan[high], mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'))
+        fig.add_trace(go.Scatter(x=fan.index, y=fan[low], mode='lines', line=dict(width=0), fill='tonexty', fillcolor=color,
+                                 name=f'{low[1:]}~{high[1:]}%', hoverinfo='skip'))
+    fig.add_trace(go.Scatter(x=fan.index, y=fan['p50'], mode='lines', line=dict(color='green'), name='중앙값',
+                             hovertemplate='%{y:,.0f}<extra></extra>'))
+    fig.update_layout(title=title, yaxis_title=yaxis_title, hovermode='x unified')
+    return fig
+
+
+# 배당 소득 전망 (설정을 바꾸거나 계산 버튼을 누르면 이 부분만 다시 실행된다)
+@st.fragment
+def income_projection():
+    if not st.session_state.portfolio:
+        return
+    st.subheader('배당 소득 전망')
+    st.caption('보유 종목의 과거 12개월 구간(월 수익률과 배당 성장률)을 무작위로 이어 붙인 경로로 앞으로의 배당 소득과 평가액을 계산합니다.')
+    col1, col2, col3 = st.columns(3)
+    years = col1.slider('전망 기간 (년)', min_value=5, max_value=30, value=20)
+    n_paths = col2.select_slider('시뮬레이션 경로 수', options=[1000, 5000, 10000], value=5000)
+    reinvest = col3.checkbox('배당 재투자', value=True)
+
+    # 매수/제거로 페이지가 다시 실행될 때마다 계산하지 않도록 버튼을 눌렀을 때만 계산하고, 그 전까지는 지난 결과를 보여 준다
+    portfolio = st.session_state.portfolio
+    key = (id(portfolio), portfolio.version, years, n_paths, reinvest)
+    cached = st.session_state.get('income_projection')
+    if st.button('전망 계산', key='run_income_projection'):
+        with st.spinner('전망 계산 중...'):
+            result = project_portfolio(portfolio, years=years, n_paths=n_paths, reinvest=reinvest, seed=0)
+        cached = st.session_state.income_projection = (key, result)
+    if cached is None:
+        st.info('전망 계산 버튼을 누르면 계산합니다.')
+        return
+    if cached[0] != key:
+        st.caption('보유 종목이나 설정이 바뀌었습니다. 아래는 지난번 결과이며, 다시 계산하려면 전망 계산 버튼을 누르세요.')
+    result = cached[1]
+    years = cached[0][2]
+
+    for ticker, error in result['errors'].items():
+        st.warning(f"{ticker}의 주가 데이터를 가져오는 데 문제가 발생했습니다. ({error})")
+    if 'annual_income' not in result:
+        st.error('전망에 쓸 주가 데이터가 부족합니다.')
+        return
+
+    annual = result['annual_income']
+    col1, col2 = st.columns(2)
+    col1.metric('첫 해 배당 소득 (중앙값)', f"${annual['p50'].iloc[0]:,.0f}")
+    col2.metric(f'{years}년째 배당 소득 (중앙값)', f"${annual['p50'].iloc[-1]:,.0f}",
+                f"5~95%: ${annual['p5'].iloc[-1]:,.0f} ~ ${annual['p95'].iloc[-1]:,.0f}", delta_color='off')
+    with perf.span('plotly_chart', 'render'):
+        st.plotly_chart(fan_figure(annual, '연간 배당 소득 전망', '배당 소득 ($)').update_layout(xaxis_title='전망 연도'))
+        st.plotly_chart(fan_figure(result['value'], f"평가액 전망 (현재 ${result['start_value']:,.0f})", '평가액 ($)'))
+
+
+# 사이드바 포트폴리오 목록 (제거할 종목을 고르는 동안은 이 부분만 다시 실행된다)
+@st.fragment
+def holdings_sidebar():
+    if not st.session_state.portfolio:
+        return
+    st.subheader('포트폴리오 목록')
+    tickers_in_portfolio = list(dict.fromkeys(st.session_state.portfolio.tickers))
+    st.write(tickers_in_portfolio)
+
+    # 주식 제거 기능 추가
+    stock_to_remove = st.selectbox('제거할 주식을 선택하세요:', tickers_in_portfolio)
+    if st.button('제거'):
+        # 포트폴리오에서 해당 주식을 제거하고 투자 금액을 남은 자본에 다시 추가
+        st.session_state.remaining_capital += st.session_state.portfolio.remove(stock_to_remove)
+        st.session_state.portfolio_notice = f'{stock_to_remove} 주식이 포트폴리오에서 제거되었습니다.'
+        st.rerun()  # 변경사항을 즉시 반영하기 위해 페이지를 다시 실행합니다.
+
+
+# 사이드바 월별 종목 찾기 (배당 지급 월 색인에서 바로 꺼낸다)
+@st.fragment
+def month_screener():
+    index = dividend_index.get_index()
+    if not len(index):
+        return
+    st.subheader('이 달에 배당 주는 종목')
+    month = st.selectbox('월', range(1, 13), format_func=lambda month: f'{month}월', key='screener_month')
+    st.write(list(index.pays_in(month)))
+
+
+holding_builder()
+monthly_dividend_chart()
+income_projection()
+with st.sidebar:
+    holdings_sidebar()
+    month_screener()
@@ -0,0 +1,139 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+import logos
+import perf
+
+# 페이지 5: ETF 성장률 그래프
+st.title("ETF 성장률 그래프")
+years = list(range(2006, 2024))  # 2006년부터 2023년까지, 총 18개
+
+
+
+data33 = {
+    'Year': years,
+    'SCHD_AUM': [None]*5 + [2.5, 4.0, 6.5, 9.2, 13.5, 18.3, 22.5, 27.8, 35.0, 45.5, 52.8, 60.4, 65.0],  # 총 18개로 맞춤
+    'VIG_AUM': [1.5, 3.0, 4.5, 6.0, 7.5, 10.0, 12.5, 15.0, 18.5, 20.0, 22.0, 25.0, 30.0, 35.0, 40.0, 50.0, 60.0, 65.5],  # 총 18개로 맞춤
+    'JEPI_AUM': [None]*14 + [18.7, 25.2, 30.33, 32],  # 총 18개로 맞춤
+    'DGRW_AUM': [None]*7 + [5.0, 7.5, 10.0, 12.5, 15.0, 18.5, 20.3, 24.0, 28.1, 30.4, 32.2],  # 총 18개
+    'NOBL_AUM': [None]*7 + [2.0, 5.0, 7.5, 10.5, 12.0, 15.0, 18.3, 22.1, 25.4, 27.5, 29.0]  # 총 18개
+}
+
+# 모든 리스트의 길이가 동일한지 확인
+for key, value in data33.items():
+    if len(value) != len(years):
+        raise ValueError(f"{key}의 길이가 {len(value)}로 {len(years)}와 일치하지 않습니다.")
+
+df_33 = pd.DataFrame(data33)
+
+# 사이드바에서 기간 설정 슬라이더 추가
+min_year, max_year = 2006, 2023  # 2006년부터 설정 가능
+selected_year = st.sidebar.slider('Select Year', min_value=min_year, max_value=max_year, value=min_year)
+
+# 사이드바에서 ETF 선택
+etf_options = ['SCHD', 'VIG', 'JEPI', 'DGRW', 'NOBL']
+selected_etf = st.sidebar.selectbox("Select an ETF", etf_options)
+
+# 선택한 ETF 열 이름 생성
+aum_column = f'{selected_etf}_AUM'
+
+# 데이터프레임에 해당 열이 있는지 확인
+if aum_column in df_33.columns:
+    # 최초 설정액 및 선택한 연도의 설정액 가져오기
+    initial_aum = df_33[aum_column].dropna().iloc[0]  # 첫 번째 유효값 (최초 설정액)
+    initial_year = df_33['Year'][df_33[aum_column].notna()].iloc[0]  # 첫 번째 유효값의 연도
+
+    # 선택한 연도에 ETF가 존재하지 않으면 문구 출력
+    if selected_year < initial_year:
+        st.write(f"이 ETF는 {initial_year}년에 설정되었습니다.")
+        selected_aum = None
+    else:
+        selected_aum = df_33[df_33['Year'] == selected_year][aum_column].values[0]
+else:
+    st.error(f"{selected_etf}의 데이터가 존재하지 않습니다.")
+    initial_aum = None
+    selected_aum = None
+
+# 두 개의 동그라미를 시각화 (최초 설정액과 선택한 연도의 설정액)
+fig = go.Figure()
+
+# 왼쪽 동그라미 (최초 설정액) - 금액 표시, 글자 크기를 줄여서 표시, 동그라미 크기 9로 설정
+if initial_aum is not None:
+    fig.add_trace(go.Scatter(
+        x=[0.5], y=[0],
+        mode='markers+text',
+        marker=dict(size=initial_aum * 12, color='lightblue'),  # 동그라미 크기를 9로 설정
+        text=[f'{initial_aum}B$'],  # 금액으로 변경
+        textposition='middle center',
+        textfont=dict(color='black', size=14),  # 글자 크기를 줄임
+        name='Initial AUM'
+    ))
+
+# 오른쪽 동그라미 (선택한 연도의 AUM) - 존재할 경우만 표시
+if selected_aum is not None:
+    fig.add_trace(go.Scatter(
+        x=[1.5], y=[0],
+        mode='markers+text',
+        marker=dict(size=selected_aum * 12, color='blue'),
+        text=[f'{selected_aum}B$'],
+        textposition='middle center',
+        textfont=dict(size=selected_aum * 1.5, color='white'),  # 숫자 크기 조정
+        name='Selected AUM'
+    ))
+
+# 두 동그라미 사이에 화살표 추가 (가운데 배치, 크기와 두께 증가, 색상 흰색)
+fig.add_annotation(
+    x=1, y=0,
+    ax=1, ay=0,
+    xref="x", yref="y",
+    axref="x", ayref="y",
+    showarrow=True,
+    arrowhead=2,
+    arrowsize=3,  # 화살표 크기 증가
+    arrowwidth=4,  # 화살표 두께 증가
+    arrowcolor="white"  # 화살표 색상 흰색
+)
+
+# 아래 텍스트 추가 (최초 설정 연도 및 선택한 연도의 설정액)
+if initial_aum is not None:
+    fig.add_annotation(
+        text=f"{initial_year}년 최초 설정액", 
+        x=0.5, y=-0.2, showarrow=False,
+        font=dict(size=14),
+        xanchor='center'
+    )
+
+if selected_aum is not None:
+    fig.add_annotation(
+        text=f"{selected_year}년 설정액", 
+        x=1.5, y=-0.2, showarrow=False,
+        font=dict(size=14),
+        xanchor='center'
+    )
+
+# 레이아웃 설정 - 차트가 잘리지 않도록 높이와 너비 조정
+fig.update_layout(
+    title=f'{selected_etf} AUM Over Time',
+    xaxis=dict(showgrid=False, zeroline=False, showticklabels=False, range=[0, 2]),  # 동그라미가 차트 안에 들어오도록 조정
+    yaxis=dict(showgrid=False, zeroline=False, showticklabels=False, range=[-1, 1]),
+    showlegend=False,
+    height=600,  # 높이 조정
+    width=1000  # 너비 조정
+)
+
+# 그래프 출력
+with perf.span('plotly_chart', 'render'):
+    st.plotly_chart(fig, use_container_width=True)
+
+st.title("3M 로고 이미지 테스트")
+
+# 3M 로고 URL
+logo_url = "https://seeklogo.com/images/A/apple-logo-52C416BDDD-seeklogo.com.png"
+
+# 로고 캐시에서 불러오기 (없으면 제한 시간 안에 다운로드, 비율을 지킨 채 400px 상자 안에 맞춤)
+logo_image = logos.get_logo(logo_url, size=(400, 400), fit=True)
+if not logos.is_placeholder(logo_image):
+    st.image(logo_image, caption="3M Logo", use_column_width=True)
+else:
+    st.error("로고 이미지를 불러올 수 없습니다.")
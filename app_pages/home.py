@@ -0,0 +1,5 @@
+import streamlit as st
+
+# 메인
+st.title('Build Wealth Today, Earn Income Tomorrow: The Power of Dividend Investing.')
+st.image('coin.jpg')
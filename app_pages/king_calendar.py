@@ -0,0 +1,88 @@
+import streamlit as st
+import pandas as pd
+
+from dividend_universe import dividend_king_stocks, dividend_aristocrat_stocks, universe_logo_urls
+import logos
+import optimizer
+from calendar_chart import LOGO_SIZE, render_calendar_png
+
+# 페이지 4: 배당 포트폴리오 구축
+st.title("나만의 배당주 포트폴리오 구성하기")
+
+# 로고 41개를 배당 달력에 그릴 크기로 동시에 미리 받아 두기 (프로세스에서 처음 한 번만, 재실행 때는 바로 넘어감)
+logos.prefetch_once(universe_logo_urls(), size=LOGO_SIZE)
+if 'selected_companies' not in st.session_state:
+    st.session_state['selected_companies'] = []
+
+# Create placeholder for chart area
+chart_placeholder = st.empty()
+
+# Create a mapping of tickers to company names
+ticker_to_name_king = {ticker: name for ticker, (name, _, _) in dividend_king_stocks.items()}
+ticker_to_name_aristocrat = {ticker: name for ticker, (name, _, _) in dividend_aristocrat_stocks.items()}
+
+king_selection = st.selectbox("배당킹주에서 선택", ['선택하세요'] + list(ticker_to_name_king.values()), key='select_king')
+if st.button("추가", key='add_king') and king_selection != '선택하세요':
+    ticker = [ticker for ticker, name in ticker_to_name_king.items() if name == king_selection][0]
+    st.session_state.selected_companies.append((ticker, 'king'))
+
+aristocrat_selection = st.selectbox("배당귀족주에서 선택", ['선택하세요'] + list(ticker_to_name_aristocrat.values()), key='select_aristocrat')
+if st.button("추가", key='add_aristocrat') and aristocrat_selection != '선택하세요':
+    ticker = [ticker for ticker, name in ticker_to_name_aristocrat.items() if name == aristocrat_selection][0]
+    st.session_state.selected_companies.append((ticker, 'aristocrat'))
+
+# Remove stock from portfolio
+remove_company = st.selectbox("제거할 주식 선택", ['선택하세요'] + [ticker_to_name_king.get(company, '') for company, _ in st.session_state.selected_companies] + [ticker_to_name_aristocrat.get(company, '') for company, _ in st.session_state.selected_companies], key='remove_select')
+if st.button("제거", key='remove_company') and remove_company != '선택하세요':
+    ticker_to_remove = [ticker for ticker, name in ticker_to_name_king.items() if name == remove_company] + [ticker for ticker, name in ticker_to_name_aristocrat.items() if name == remove_company]
+    st.session_state.selected_companies = [(company, category) for company, category in st.session_state.selected_companies if company not in ticker_to_remove]
+    st.success(f"{remove_company}이(가) 포트폴리오에서 제거되었습니다.")
+
+# Draw the chart once per rerun, after all add/remove actions (same selection -> cached PNG)
+chart_placeholder.image(render_calendar_png(st.session_state.selected_companies), use_column_width=True)
+
+
+# 12개월을 모두 덮고 월 소득이 가장 고른 조합 자동으로 찾기 (조건을 바꾸면 이 부분만 다시 실행된다)
+@st.fragment
+def coverage_optimizer():
+    st.subheader('매달 배당 받는 조합 찾기')
+    col1, col2 = st.columns(2)
+    capital = col1.number_input('투자 금액 (단위: 달러)', min_value=100.0, value=10000.0, step=1000.0)
+    min_yield = col2.number_input('종목별 최소 배당수익률 (%)', min_value=0.0, max_value=10.0, value=0.0, step=0.5) / 100
+    col3, col4 = st.columns(2)
+    max_names = col3.slider('최대 종목 수', min_value=3, max_value=12, value=6)
+    max_per_sector = col4.slider('섹터당 최대 종목 수', min_value=1, max_value=6, value=2)
+    st.caption('배당 지급 월과 배당수익률은 최근 12개월 배당 이력으로 계산하고, 배당 1회당 받는 금액이 같도록 투자 금액을 나눕니다. '
+               '섹터는 종목 CSV(king_data, ticker_data, etf_companies_info)에 섹터가 있는 종목에만 적용됩니다.')
+
+    candidates, errors = optimizer.load_candidates()
+    untagged = [candidate.ticker for candidate in candidates if candidate.sector is None]
+    if untagged:
+        st.caption('섹터를 몰라 섹터 상한이 적용되지 않는 종목: ' + ', '.join(untagged))
+    if errors:
+        st.caption('제외된 종목: ' + ', '.join(f'{ticker} ({error})' for ticker, error in errors.items()))
+    results = optimizer.optimize(candidates, capital, max_names=max_names, max_per_sector=max_per_sector, min_yield=min_yield)
+    if not results:
+        st.warning('조건을 만족하면서 12개월을 모두 덮는 조합이 없습니다.')
+        return
+
+    sectors = {candidate.ticker: candidate.sector for candidate in candidates}
+    for rank, result in enumerate(results):
+        title = (f"{rank + 1}. {', '.join(result['tickers'])} - 연 배당 ${result['annual_income']:,.0f} "
+                 f"(수익률 {result['dividend_yield']:.2%}, 월별 편차 {result['smoothness']:.0%})")
+        with st.expander(title, expanded=rank == 0):
+            table = pd.DataFrame({
+                '섹터': pd.Series({ticker: sectors.get(ticker) or '모름 (상한 미적용)' for ticker in result['tickers']}),
+                '투자 금액 ($)': pd.Series(result['allocations']).round(2),
+                '배당 월': pd.Series({ticker: ', '.join(map(str, months)) for ticker, months in result['months'].items()}),
+            })
+            st.dataframe(table, use_container_width=True)
+            st.bar_chart(pd.Series(result['monthly_income'], index=range(1, 13), name='월 배당 ($)'))
+            if st.button('달력에 표시', key=f'apply_coverage_{rank}'):
+                st.session_state.selected_companies = [
+                    (ticker, 'king' if ticker in dividend_king_stocks else 'aristocrat') for ticker in result['tickers']
+                ]
+                st.rerun()
+
+
+coverage_optimizer()
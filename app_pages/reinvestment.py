@@ -0,0 +1,164 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from datetime import timedelta
+
+import perf
+import price_store
+from downsample import downsample_positions, point_budget
+
+# 페이지 2: 재투자 분석
+st.title('주식 배당금 및 재투자 분석')
+
+# 사용자 입력 받기
+ticker_for_reinvestment = st.text_input('재투자 분석할 주식의 티커를 입력하세요 (예: AAPL):')
+
+if ticker_for_reinvestment:
+    try:
+        # 주식의 전체 기간 데이터 불러오기
+        # (티커별로 공유 캐시에 올라가 있어 날짜를 바꿀 때는 메모리에서 잘라 쓴다)
+        full_data = price_store.load_history(ticker_for_reinvestment.upper())
+
+        if not full_data.empty:
+            # 날짜 범위 설정 없이 자유롭게 선택 가능하도록 변경
+            earliest_date = full_data.index.min().date()
+            latest_date = pd.Timestamp.today().date() - timedelta(days=1)
+
+            # 기간 선택기 추가 - 시작 날짜는 기업 데이터의 가장 이른 날짜로, 종료 날짜는 어제로 설정
+            start_date = st.date_input("시작 날짜", value=earliest_date, min_value=earliest_date, max_value=latest_date)
+            end_date = st.date_input("종료 날짜", value=latest_date, min_value=earliest_date, max_value=latest_date)
+            if start_date > end_date:
+                st.error("시작 날짜는 종료 날짜보다 이전이어야 합니다.")
+            else:
+                # 선택된 기간 동안의 데이터를 불러오기 (전체 기간 데이터에서 잘라내기, 종료일 제외)
+                stock_data = price_store.slice_history(full_data, start=start_date, end=end_date)
+
+                if stock_data.empty:
+                    st.error(f"티커 '{ticker_for_reinvestment}'에 대한 데이터가 없습니다.")
+                else:
+                    # 배당금 데이터 추출
+                    if 'Dividends' in stock_data.columns:
+                        dividends = stock_data['Dividends'].fillna(0)
+                    else:
+                        st.warning("이 주식에 대한 배당금 데이터가 없습니다.")
+                        dividends = pd.Series(index=stock_data.index, data=0)
+
+                    # 배당금이 있는 데이터만 필터링
+                    dividend_data = dividends[dividends > 0]
+
+                    if dividend_data.empty:
+                        st.warning("이 주식에 대한 배당금 데이터가 없습니다.")
+                    else:
+                        # 배당일 종가로 전액 재투자했을 때의 가치
+                        # (전체 이력의 재투자 누적곱을 한 번 만들어 두고, 날짜를 바꾸면 구간만 잘라 나눈다)
+                        initial_shares = 1  # 초기 투자 시 주식 수
+                        drip_index = price_store.load_drip_index(ticker_for_reinvestment.upper())
+                        investment_value = drip_index.value_path(start_date, end_date, initial_shares=initial_shares)
+
+                        # 차트 폭에 맞춰 점 수 줄이기 (고점/저점과 배당일은 유지, 배당 막대는 그대로)
+                        positions = downsample_positions(stock_data.index, [stock_data['Close'].to_numpy(), investment_value.to_numpy()], point_budget(), keep=dividend_data.index)
+                        chart_close = stock_data['Close'].iloc[positions]
+                        chart_value = investment_value.iloc[positions]
+
+                        # 그래프 생성
+                        fig = go.Figure()
+
+                        # 주가 시계열 (종가) - 선 아래 색칠
+                        fig.add_trace(go.Scatter(
+                            x=chart_close.index,
+                            y=chart_close,
+                            mode='lines',
+                            name='종가',
+                            line=dict(color='blue', width=1),  # 얇은 실선
+                            fill='tozeroy',  # 선 아래 색칠
+                            fillcolor='rgba(0, 0, 255, 0.3)',  # 색상과 투명도 설정
+                            yaxis='y1',
+                            hovertemplate='주가: %{y:.2f}<extra></extra>'
+                        ))
+
+                        # 배당금 시계열 (막대그래프) - 굵기 조정
+                        fig.add_trace(go.Bar(
+                            x=dividend_data.index,
+                            y=dividend_data,
+                            name='배당금',
+                            marker=dict(color='orange'),
+                            opacity=0.6,  # 투명도 조정
+                            width=15,  # 막대 너비 조정
+                            yaxis='y2',
+                            hovertemplate='배당금: %{y:.2f}<extra></extra>'
+                        ))
+
+                        # 재투자 후 주가 시계열 - 선 아래 색칠 및 색상 조정
+                        fig.add_trace(go.Scatter(
+                            x=chart_value.index,
+                            y=chart_value,
+                            mode='lines',
+                            name='재투자 가치',
+                            line=dict(color='green', width=1),  # 얇은 실선
+                            fill='tozeroy',  # 선 아래 색칠
+                            fillcolor='rgba(0, 255, 0, 0.3)',  # 색상과 투명도 설정
+                            yaxis='y1',
+                            hovertemplate='재투자 가치: %{y:.2f}<extra></extra>'
+                        ))
+
+                        # 그래프 레이아웃 설정
+                        fig.update_layout(
+                            title=f'{ticker_for_reinvestment} 주가, 배당금 및 재투자 가치',
+                            xaxis_title='날짜',
+                            yaxis_title='주가',
+                            yaxis=dict(
+                                title='주가',
+                                titlefont=dict(color='black'),
+                                tickfont=dict(color='black'),
+                                range=[0, stock_data['Close'].max() * 1.5],  # 좌측 y축 범위 설정 (조정)
+                                autorange=False,
+                                title_standoff=20,  # 제목과 축 사이의 거리
+                                tickangle=-45  # x축 레이블 회전
+                            ),
+                            yaxis2=dict(
+                                title='배당금',
+                                titlefont=dict(color='black'),
+                                tickfont=dict(color='black'),
+                                overlaying='y',
+                                side='right',
+                                range=[0, 3],  # 오른쪽 y축 범위 설정
+                                title_standoff=20  # 제목과 축 사이의 거리
+                            ),
+                            hovermode='x unified',
+                            barmode='overlay',  # 막대그래프와 선그래프 겹치게 표현
+                            height=800,  # 그래프 높이 설정
+                            margin=dict(t=50, b=150, l=70, r=70),  # 여백 조정
+                            xaxis=dict(
+                                tickangle=-45,  # x축 레이블 회전
+                                tickfont=dict(size=10, color='black')  # x축 레이블 색상 조정
+                            )
+                        )
+
+                        # 배경과 텍스트 색상 조정
+                        fig.update_layout(
+                            plot_bgcolor='white',
+                            paper_bgcolor='lightgray',
+                            font=dict(size=12, color='black')
+                        )
+
+                        # 그래프 보여주기
+                        with perf.span('plotly_chart', 'render'):
+                            st.plotly_chart(fig)
+
+                        # 선택한 구간 요약
+                        summary = drip_index.query(start_date, end_date, initial_shares=initial_shares)
+                        col1, col2, col3 = st.columns(3)
+                        col1.metric('재투자 가치', f"${summary['value']:.2f}", f"{summary['total_return']:.2%}")
+                        col2.metric('받은 배당금 (재투자 포함)', f"${summary['dividends_received']:.2f}")
+                        col3.metric('연평균 수익률', f"{summary['cagr']:.2%}")
+
+                        # 같은 종료일까지 1년 이상 보유했다면 가장 좋았던 / 나빴던 시작일 (모든 시작일을 한 번에 계산)
+                        start_returns = drip_index.scan_starts(end=end_date, min_years=1)
+                        if not start_returns.empty:
+                            best, worst = start_returns.idxmax(), start_returns.idxmin()
+                            st.write(f"{end_date}까지 1년 이상 보유했다면 가장 좋은 시작일은 {best.date()} (연 {start_returns[best]:.2%}), "
+                                     f"가장 나쁜 시작일은 {worst.date()} (연 {start_returns[worst]:.2%}) 입니다.")
+        else:
+            st.error(f"티커 '{ticker_for_reinvestment}'에 대한 데이터가 없습니다.")
+    except Exception as e:
+        st.error(f"데이터를 가져오는 중 오류 발생: {e}")
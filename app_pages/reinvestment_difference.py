@@ -0,0 +1,72 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from datetime import date, timedelta
+
+import perf
+from backtest import MODES, portfolio_backtest
+from downsample import downsample_positions, point_budget
+
+# 페이지 3: 포트폴리오 재투자 금액 차이 분석
+st.title('포트폴리오 재투자 금액 차이 분석')
+
+# 포트폴리오가 존재하지 않으면 메시지 표시
+if 'portfolio' not in st.session_state or not st.session_state.portfolio:
+    st.info('포트폴리오가 없습니다. 먼저 포트폴리오를 구성해 주세요.')
+else:
+    # 포트폴리오 데이터 가져오기
+    portfolio = st.session_state.portfolio
+
+    # 초기 투자 금액 계산
+    initial_investment = portfolio.total_investment
+    st.write(f"초기 투자 금액: ${initial_investment:.2f}")
+
+    # 백테스트 기간과 재투자 방식 선택 (종목별 매수 금액을 시작일 종가로 샀다고 본다)
+    latest_date = pd.Timestamp.today().date() - timedelta(days=1)
+    start_date = st.date_input("시작 날짜", value=latest_date - timedelta(days=365 * 10),
+                               min_value=date(1960, 1, 1), max_value=latest_date)
+    reinvest_mode = st.radio('재투자 방식', ['per_holding', 'pooled'], format_func=MODES.get, horizontal=True)
+
+    # 보유 종목 전체를 같은 날짜 축의 행렬로 맞춰 한 번에 계산 (backtest.portfolio_backtest)
+    results, errors = portfolio_backtest(portfolio, start=start_date, modes=('none', reinvest_mode))
+    for ticker, error in errors.items():
+        st.warning(f"{ticker}의 주가 데이터를 가져오는 데 문제가 발생했습니다. ({error})")
+
+    if not results:
+        st.error("선택한 기간에 포트폴리오의 주가 데이터가 없습니다.")
+    else:
+        cash_path, reinvest_path = results['none'], results[reinvest_mode]
+        if cash_path.index[0].date() > start_date:
+            st.caption(f"모든 종목의 주가가 있는 {cash_path.index[0].date()}부터 계산했습니다.")
+
+        # 차트 폭에 맞춰 점 수 줄이기 (두 선이 같은 날짜를 쓰도록 위치를 합친다)
+        positions = downsample_positions(cash_path.index, [cash_path['total'].to_numpy(), reinvest_path['total'].to_numpy()], point_budget())
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=cash_path.index[positions], y=cash_path['total'].iloc[positions], mode='lines',
+                                 name='재투자 안 함 (주식 + 배당 현금)', line=dict(color='gray', width=1),
+                                 hovertemplate='재투자 안 함: %{y:,.2f}<extra></extra>'))
+        fig.add_trace(go.Scatter(x=reinvest_path.index[positions], y=reinvest_path['total'].iloc[positions], mode='lines',
+                                 name=MODES[reinvest_mode], line=dict(color='green', width=1),
+                                 hovertemplate=f'{MODES[reinvest_mode]}: %{{y:,.2f}}<extra></extra>'))
+        fig.update_layout(title='포트폴리오 가치 추이', xaxis_title='날짜', yaxis_title='가치 ($)', hovermode='x unified')
+        with perf.span('plotly_chart', 'render'):
+            st.plotly_chart(fig)
+
+        # 마지막 날 기준 비교
+        # (시세를 받지 못한 종목은 빠지므로 실제 계산에 들어간 첫날 금액을 기준으로 수익률을 낸다)
+        invested = cash_path['total'].iloc[0]
+        cash_last, reinvest_last = cash_path.iloc[-1], reinvest_path.iloc[-1]
+        col1, col2, col3 = st.columns(3)
+        col1.metric('재투자 안 함', f"${cash_last['total']:,.2f}", f"{cash_last['total'] / invested - 1:.2%}")
+        col2.metric(MODES[reinvest_mode], f"${reinvest_last['total']:,.2f}", f"{reinvest_last['total'] / invested - 1:.2%}")
+        col3.metric('받은 배당금 (재투자 시)', f"${reinvest_last['dividends']:,.2f}")
+
+        re_investment_value = reinvest_last['total'] - cash_last['total']
+        st.write(f"재투자 금액 차이: ${re_investment_value:.2f}")
+
+        if re_investment_value > 0:
+            st.success(f"재투자 금액이 ${re_investment_value:.2f} 증가했습니다.")
+        elif re_investment_value < 0:
+            st.error(f"재투자 금액이 ${abs(re_investment_value):.2f} 감소했습니다.")
+        else:
+            st.info("재투자 금액의 차이가 없습니다.")
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+import perf
+import price_store
+from timeutil import local_dates
+
+# 포트폴리오 단위 배당 재투자 백테스트
+# 보유 종목의 종가/배당을 같은 날짜 축의 (날짜 x 종목) 행렬로 맞춘 뒤, 종목별 루프 없이 행렬 연산으로 계산한다.
+
+MODES = {
+    'none': '재투자 안 함',
+    'per_holding': '종목별 재투자',
+    'pooled': '포트폴리오 전체에 재투자',
+}
+
+
+def align_histories(histories, start=None, end=None):
+    """{티커: 일봉} -> (날짜 인덱스, 종가 행렬, 배당 행렬). 행렬은 (날짜 x 티커) float 배열.
+
+    날짜 축은 모든 종목의 거래일 합집합이고, 모든 종목에 가격이 있는 첫날부터 시작한다 ([start, end)).
+    쉬는 날의 종가는 직전 값으로 채우고 배당은 0 으로 둔다.
+    """
+    indexes = [history.index for history in histories.values()]
+    index = indexes[0]
+    for other in indexes[1:]:
+        if not index.equals(other):
+            index = index.union(other)
+
+    # 종목마다 자기 날짜의 위치에 값만 써 넣는다 (DataFrame 정렬/결합 없이, 열 단위로 쓰므로 열 우선 배열)
+    close = np.full((len(index), len(indexes)), np.nan, order='F')
+    dividends = np.zeros((len(index), len(indexes)), order='F')
+    first = 0
+    for column, (history, local) in enumerate(zip(histories.values(), indexes)):
+        rows = np.arange(len(index)) if local.equals(index) else index.get_indexer(local)
+        values = history['Close'].to_numpy(dtype=float)
+        close[rows, column] = values
+        dividends[rows, column] = np.nan_to_num(history['Dividends'].to_numpy(dtype=float))
+        valid = np.flatnonzero(~np.isnan(values))
+        first = max(first, rows[valid[0]] if len(valid) else len(index))
+
+    index = local_dates(index)
+    lo = first if start is None else max(first, index.searchsorted(pd.Timestamp(start), side='left'))
+    hi = len(index) if end is None else index.searchsorted(pd.Timestamp(end), side='left')
+    close = pd.DataFrame(close[lo:hi]).ffill().to_numpy()
+    return index[lo:hi], close, np.ascontiguousarray(dividends[lo:hi])
+
+
+@perf.timed('backtest.run')
+def run_backtest(index, close, dividends, initial_amounts, mode='per_holding', withholding_tax=0.0):
+    """(날짜 x 종목) 종가/배당 행렬로 포트폴리오 가치 시계열을 계산한다.
+
+    initial_amounts: 종목별 첫날 매수 금액 (달러)
+    mode
+      'none'        : 배당을 현금으로 쌓아 둔다
+      'per_holding' : 각 종목의 배당으로 그 종목을 산다 (종목마다 DRIP)
+      'pooled'      : 모든 배당을 모아 그날 평가액 비중대로 포트폴리오 전체를 산다
+    첫날 배당은 받지 않는다 (drip.simulate_drip 과 같은 기준).
+    반환: 'value'(보유 주식 평가액), 'cash', 'dividends'(세후 누적 수령액), 'total' 컬럼의 DataFrame
+    """
+    if mode not in MODES:
+        raise ValueError(f'알 수 없는 재투자 방식: {mode}')
+    shares0 = np.asarray(initial_amounts, dtype=float) / close[0]
+    net = dividends * (1.0 - withholding_tax)
+    net[0] = 0.0
+
+    if mode == 'per_holding':
+        # 종목마다 1 + 배당/종가 를 날짜 방향으로 누적곱
+        shares = shares0 * np.cumprod(1.0 + net / close, axis=0)
+        value = (shares * close).sum(axis=1)
+        received = np.r_[0.0, ((shares[:-1] * net[1:]).sum(axis=1))].cumsum()
+        cash = np.zeros(len(index))
+    elif mode == 'pooled':
+        # 평가액 비중대로 사면 모든 종목 주식 수가 같은 배율 g_t = 1 + 배당 합계 / 평가액 으로 늘어난다
+        growth = np.cumprod(1.0 + (net @ shares0) / (close @ shares0))
+        value = growth * (close @ shares0)
+        received = np.r_[0.0, growth[:-1] * (net[1:] @ shares0)].cumsum()
+        cash = np.zeros(len(index))
+    else:
+        value = close @ shares0
+        received = np.cumsum(net @ shares0)
+        cash = received
+
+    return pd.DataFrame({'value': value, 'cash': cash, 'dividends': received, 'total': value + cash}, index=index)
+
+
+def portfolio_backtest(holdings, start=None, end=None, modes=('none', 'per_holding'), withholding_tax=0.0):
+    """holdings: (티커, 주식 수, 매수 금액) 목록 -> ({방식: run_backtest 결과}, {티커: 오류}).
+
+    종목별 매수 금액 합계를 시작일 종가로 산 것으로 보고, 같은 날짜 축에서 여러 방식을 한 번에 비교한다.
+    시세를 받지 못한 종목은 빼고 계산하며 오류로 돌려준다.
+    """
+    amounts = {}
+    for ticker, _, cost in holdings:
+        amounts[ticker.upper()] = amounts.get(ticker.upper(), 0.0) + cost
+    histories, errors = price_store.load_histories(list(amounts))
+    if not histories:
+        return {}, errors
+    index, close, dividends = align_histories(histories, start=start, end=end)
+    if len(index) == 0:
+        return {}, errors
+    initial = [amounts[ticker] for ticker in histories]
+    return {mode: run_backtest(index, close, dividends, initial, mode, withholding_tax) for mode in modes}, errors
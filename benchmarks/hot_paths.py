@@ -0,0 +1,233 @@
+"""핫 패스 벤치마크와 기준값(baseline) 비교.
+
+    python benchmarks/hot_paths.py                 # 실행 후 benchmarks/baseline.json 과 비교 (느려지면 종료 코드 1)
+    python benchmarks/hot_paths.py --save          # 지금 결과를 기준값으로 저장
+    python benchmarks/hot_paths.py --quick -k drip # 작은 규모만, 이름에 drip 이 들어간 경우만
+
+합성 데이터(benchmarks/synthetic.py) 규모별로 DRIP 시뮬레이션, 월별 배당 집계(페이지 1), 포트폴리오 백테스트(페이지 3),
+배당 소득 몬테카를로 전망(페이지 1), 배당 월 조합 찾기(페이지 4),
+calculate_total_return / calculate_group_average, Plotly 그림 생성/직렬화 시간을 잰다.
+중앙값이 기준값 * (1 + threshold) 를 넘고 그 차이가 MIN_DELTA_MS 이상이면 회귀로 본다.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+import plotly.graph_objects as go  # noqa: E402
+
+import synthetic  # noqa: E402
+from analytics import calculate_group_average, calculate_total_return  # noqa: E402
+from backtest import align_histories, run_backtest  # noqa: E402
+from dividend_calendar import monthly_dividend_matrix  # noqa: E402
+from dividend_index import DividendIndex, summarize  # noqa: E402
+from downsample import downsample_positions, point_budget  # noqa: E402
+from drip import DripIndex, simulate_drip  # noqa: E402
+from optimizer import candidates_from_index, optimize  # noqa: E402
+from projection import ProjectionInputs, simulate  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 0.30  # 기준값보다 30% 이상 느려지면 실패
+MIN_DELTA_MS = 1.0  # 이보다 작은 차이는 측정 잡음으로 본다
+
+
+def _single(years):
+    history = synthetic.market(years, 1)['SYN000']
+    return history['Close'], history['Dividends']
+
+
+def bench_drip(years):
+    close, dividends = _single(years)
+    return lambda: simulate_drip(close, dividends)
+
+
+def bench_drip_whole_shares(years):
+    close, dividends = _single(years)
+    return lambda: simulate_drip(close, dividends, whole_shares=True, withholding_tax=0.15, commission=1.0)
+
+
+def bench_drip_index_query(years):
+    # 날짜 선택기를 옮길 때: 전체 이력 prefix 배열에서 구간 하나 조회
+    close, dividends = _single(years)
+    index = DripIndex.build(close, dividends)
+    start, end = close.index[len(close) // 4], close.index[-len(close) // 4]
+    return lambda: index.query(start, end)
+
+
+def bench_drip_index_scan(years):
+    # 모든 시작일의 연평균 수익률을 한 번에
+    close, dividends = _single(years)
+    index = DripIndex.build(close, dividends)
+    return lambda: index.scan_starts()
+
+
+def bench_monthly_matrix(years, count, mode):
+    streams = synthetic.dividend_streams(years, count)
+    return lambda: monthly_dividend_matrix(streams, mode=mode, as_of=synthetic.END_DATE)
+
+
+def bench_backtest_align(years, count):
+    histories = synthetic.market(years, count)
+    return lambda: align_histories(histories)
+
+
+def bench_backtest(years, count, mode):
+    # 페이지 3: 정렬된 (날짜 x 종목) 행렬에서 포트폴리오 가치 시계열
+    index, close, dividends = align_histories(synthetic.market(years, count))
+    amounts = [1000.0] * count
+    return lambda: run_backtest(index, close, dividends, amounts, mode, withholding_tax=0.15)
+
+
+def bench_projection(years, count, reinvest, n_paths=10000):
+    # 페이지 1 배당 소득 전망: 경로 x 월 x 종목 (워커 1개로 재서 기계 코어 수와 상관없이 비교)
+    inputs = ProjectionInputs.from_histories(synthetic.market(years, count))
+    shares = [10.0] * count
+    return lambda: simulate(inputs, shares, years=30, n_paths=n_paths, reinvest=reinvest, seed=0, max_workers=1)
+
+
+def bench_coverage_optimizer(count, max_names=12):
+    # 페이지 4 조합 찾기: 지급 월 묶음별 종목 수 나열 + 종목 고르기
+    histories = synthetic.market(1, count)
+    index = DividendIndex(pd.DataFrame.from_dict({ticker: summarize(history) for ticker, history in histories.items()}, orient='index'))
+    candidates, _ = candidates_from_index(index, list(histories), {})
+    return lambda: optimize(candidates, 10000.0, max_names=max_names, max_per_sector=2)
+
+
+def bench_total_return(years, count):
+    frame = synthetic.long_frame(years, count)
+    names = synthetic.tickers(count)
+    return lambda: calculate_group_average(calculate_total_return(frame), names)
+
+
+def _reinvestment_figure(close, value, dividends, downsample):
+    # 페이지 2 그림과 같은 세 트레이스
+    if downsample:
+        positions = downsample_positions(close.index, [close.to_numpy(), value.to_numpy()], point_budget(), keep=dividends.index)
+        close, value = close.iloc[positions], value.iloc[positions]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=close.index, y=close, mode='lines', name='종가', fill='tozeroy'))
+    fig.add_trace(go.Bar(x=dividends.index, y=dividends, name='배당금', yaxis='y2'))
+    fig.add_trace(go.Scatter(x=value.index, y=value, mode='lines', name='재투자 가치', fill='tozeroy'))
+    fig.update_layout(yaxis2=dict(overlaying='y', side='right'), hovermode='x unified', barmode='overlay')
+    return fig.to_json()
+
+
+def bench_figure(years, downsample):
+    close, dividends = _single(years)
+    value = simulate_drip(close, dividends)['value']
+    events = dividends[dividends > 0]
+    return lambda: _reinvestment_figure(close, value, events, downsample)
+
+
+def cases(quick=False):
+    """(이름, 준비 함수) 목록. 준비 함수는 데이터를 만들고 측정할 함수를 돌려준다 (데이터 생성은 측정하지 않는다)."""
+    years = synthetic.YEARS[:2] if quick else synthetic.YEARS
+    counts = synthetic.TICKER_COUNTS[:2] if quick else synthetic.TICKER_COUNTS
+    result = []
+    for y in years:
+        result.append((f'drip/{y}y', lambda y=y: bench_drip(y)))
+        result.append((f'drip_whole_shares/{y}y', lambda y=y: bench_drip_whole_shares(y)))
+        result.append((f'drip_index_query/{y}y', lambda y=y: bench_drip_index_query(y)))
+        result.append((f'drip_index_scan/{y}y', lambda y=y: bench_drip_index_scan(y)))
+        result.append((f'figure_raw/{y}y', lambda y=y: bench_figure(y, downsample=False)))
+        result.append((f'figure_downsampled/{y}y', lambda y=y: bench_figure(y, downsample=True)))
+    # 여러 종목 경우는 30년 이력으로 종목 수만 바꾼다 (500종목 x 60년은 메모리만 많이 쓰고 경향은 같다)
+    for n in counts:
+        for mode in ('all', 'ttm'):
+            result.append((f'monthly_matrix_{mode}/30y/{n}t', lambda n=n, mode=mode: bench_monthly_matrix(30, n, mode)))
+        result.append((f'backtest_align/30y/{n}t', lambda n=n: bench_backtest_align(30, n)))
+        for mode in ('per_holding', 'pooled'):
+            result.append((f'backtest_{mode}/30y/{n}t', lambda n=n, mode=mode: bench_backtest(30, n, mode)))
+        result.append((f'total_return_group_average/30y/{n}t', lambda n=n: bench_total_return(30, n)))
+        result.append((f'coverage_optimizer/{n}t', lambda n=n: bench_coverage_optimizer(n)))
+    # 배당 소득 전망은 10,000 경로 x 30년 x 50종목 기준
+    for reinvest in (True, False):
+        name = 'projection_drip' if reinvest else 'projection'
+        result.append((f'{name}/30y/50t/10000p', lambda reinvest=reinvest: bench_projection(30, 50, reinvest)))
+    return result
+
+
+def measure(fn, repeat, min_time=0.2):
+    """fn 을 한 번 데운 뒤 repeat 번(또는 min_time 초가 찰 때까지) 재서 ms 단위 중앙값/최솟값."""
+    fn()
+    samples = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < repeat or (time.perf_counter() < deadline and len(samples) < repeat * 10):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {'median_ms': round(statistics.median(samples), 3), 'min_ms': round(min(samples), 3), 'runs': len(samples)}
+
+
+def compare(results, baseline):
+    """기준값보다 느려진 경우 (이름, 현재 ms, 기준 ms, 허용 ms) 목록."""
+    regressions = []
+    default_threshold = baseline.get('threshold', DEFAULT_THRESHOLD)
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if base is None:
+            continue
+        allowed = base['median_ms'] * (1 + base.get('threshold', default_threshold))
+        if result['median_ms'] > allowed and result['median_ms'] - base['median_ms'] >= MIN_DELTA_MS:
+            regressions.append((name, result['median_ms'], base['median_ms'], allowed))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='핫 패스 벤치마크')
+    parser.add_argument('-k', '--filter', default='', help='이름에 이 문자열이 들어간 경우만 실행')
+    parser.add_argument('--quick', action='store_true', help='1/30년, 1/50종목 규모만')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save', action='store_true', help='결과를 기준값 파일로 저장')
+    parser.add_argument('--json', help='결과를 따로 저장할 경로')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    base_results = baseline.get('results', {})
+
+    results = {}
+    print(f'{"case":<42}{"median ms":>12}{"min ms":>10}{"baseline":>11}{"ratio":>8}')
+    for name, prepare in cases(args.quick):
+        if args.filter not in name:
+            continue
+        results[name] = measure(prepare(), args.repeat)
+        base = base_results.get(name, {}).get('median_ms')
+        ratio = f'{results[name]["median_ms"] / base:.2f}' if base else '-'
+        print(f'{name:<42}{results[name]["median_ms"]:>12.2f}{results[name]["min_ms"]:>10.2f}{base or float("nan"):>11.2f}{ratio:>8}')
+
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'threshold': baseline.get('threshold', DEFAULT_THRESHOLD),
+        'results': results,
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.save:
+        # 이번에 돌리지 않은 경우(-k, --quick)의 기존 기준값은 그대로 둔다
+        report['results'] = {**base_results, **results}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f'기준값 저장: {args.baseline}')
+        return 0
+
+    regressions = compare(results, baseline)
+    for name, current, base, allowed in regressions:
+        print(f'REGRESSION {name}: {current:.2f} ms (기준 {base:.2f} ms, 허용 {allowed:.2f} ms)')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""앱 시작(cold start) import 시간 측정.
+
+페이지 스크립트가 맨 위에서 가져오는 모듈들을 새 파이썬 프로세스에서 `python -X importtime` 으로 import 하고,
+출력(stderr)을 파싱해 최상위 모듈별 누적 시간을 보여 준다.
+- 전체 시간이 예산(--budget-ms)을 넘거나
+- 특정 페이지에서만 쓰는 무거운 모듈(matplotlib, bs4, yfinance ...)이 시작할 때 올라오면
+종료 코드 1 로 실패한다. CI 나 배포 전에 `python benchmarks/import_time.py` 로 돌린다.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 엔트리포인트(app.py, app_2.py)와 app_pages/*.py 가 모듈 맨 위에서 가져오는 것들
+STARTUP_MODULES = [
+    'streamlit',
+    'pandas',
+    'plotly.graph_objects',
+    'data_provider',
+    'price_store',
+    'frame_cache',
+    'portfolio',
+    'drip',
+    'backtest',
+    'projection',
+    'optimizer',
+    'downsample',
+    'dividend_calendar',
+    'dividend_universe',
+    'dividend_index',
+    'logos',
+    'calendar_chart',
+    'analytics',
+    'perf',
+    'perf_panel',
+    'warmup',
+]
+
+# 시작할 때 올라오면 안 되는 모듈 (쓰는 곳에서 함수 안으로 미뤄 import 한다)
+# (plotly 가 버전 확인용으로 PIL._version 만 읽는 것은 괜찮으므로 PIL.Image 로 본다)
+FORBIDDEN_MODULES = ['matplotlib', 'bs4', 'yfinance', 'pandas_datareader', 'PIL.Image', 'requests']
+
+DEFAULT_BUDGET_MS = float(os.environ.get('SNU_IMPORT_BUDGET_MS', 1500))
+
+LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$')
+
+
+def parse_importtime(text):
+    """`-X importtime` 출력 -> (모듈 이름, 자체 시간 us, 누적 시간 us, 깊이) 목록."""
+    rows = []
+    for line in text.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def measure(modules, cwd=ROOT):
+    """새 프로세스에서 modules 를 import 하고 parse_importtime 결과를 돌려준다."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {", ".join(modules)}'],
+        cwd=cwd, capture_output=True, text=True, env={**os.environ, 'PYTHONPATH': cwd},
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    return parse_importtime(completed.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='앱 시작 import 시간 예산 검사')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help='최상위 import 누적 시간 합계의 상한 (ms)')
+    parser.add_argument('--repeat', type=int, default=5, help='측정 횟수 (중앙값 사용, 첫 .pyc 생성용 1회는 버린다)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 느린 모듈 수')
+    args = parser.parse_args(argv)
+
+    measure(STARTUP_MODULES)  # .pyc 캐시 만들기
+    runs = [measure(STARTUP_MODULES) for _ in range(args.repeat)]
+
+    totals = [sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000 for rows in runs]
+    total_ms = statistics.median(totals)
+    rows = runs[totals.index(sorted(totals)[len(totals) // 2])]
+
+    print(f'{"module":<32}{"cumulative ms":>15}')
+    top_level = sorted((row for row in rows if row[3] == 0), key=lambda row: row[2], reverse=True)
+    for name, _, cumulative, _ in top_level[:args.top]:
+        print(f'{name:<32}{cumulative / 1000:>15.1f}')
+    print(f'{"total (median of %d)" % args.repeat:<32}{total_ms:>15.1f}   budget {args.budget_ms:.0f} ms')
+
+    failed = False
+    loaded = {name for name, _, _, _ in rows}
+    leaked = [name for name in FORBIDDEN_MODULES if name in loaded]
+    if leaked:
+        print(f'FAIL: 시작할 때 불필요한 모듈을 import 함: {", ".join(leaked)}')
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f'FAIL: import 시간 {total_ms:.0f} ms 가 예산 {args.budget_ms:.0f} ms 를 넘음')
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""동시 세션 부하 테스트 (네트워크 없이).
+
+    python benchmarks/load_test.py                       # 1, 5, 10 세션 단계로 실행
+    python benchmarks/load_test.py --sessions 20 --flows 3 --json load.json
+
+Streamlit AppTest 로 세션마다 실제 사용 흐름을 스크립트로 돌린다.
+  포트폴리오 분석(초기 자본, 티커 입력, 매수 x 2) -> 재투자 분석(티커, 날짜 선택 2회)
+  -> 포트폴리오 재투자 금액 차이 -> 배당 달력(배당킹/귀족 추가)
+단계(wave)마다 N 개 세션을 동시에 실행해 재실행 지연 시간 p50/p95/p99, 처리량, 세션당 공급자 호출 수,
+최대 RSS 를 보고한다. 시세는 replay 공급자(녹화 파일이 없으면 합성 시계열), 로고는 오프라인 모드로
+임시 폴더의 새 저장소를 쓰므로 첫 단계에는 콜드 스타트 비용이 포함된다.
+
+AppTest 의 제약과 그에 맞춘 방식
+- 버전에 따라 st.navigation 을 지원하지 않으므로 엔트리포인트 대신 app_pages/*.py 를 직접 열고,
+  페이지를 옮길 때 세션 상태(포트폴리오 등)를 넘겨 페이지 전환을 흉내 낸다.
+- 실행할 때마다 전역 Runtime 을 바꿔 끼우므로 한 프로세스에서 두 재실행을 동시에 돌릴 수 없다.
+  세션들은 동시에 돌지만 재실행은 잠금으로 하나씩 처리한다 (스크립트 스레드가 하나인 서버와 같다).
+  그래서 처리 시간(service)과 대기 시간을 포함한 응답 시간(response)을 따로 보고한다.
+- fragment 만이 아니라 페이지 전체를 다시 실행하므로 실제 브라우저보다 보수적(느린 쪽)인 값이다.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES_DIR = os.path.join(ROOT, 'app_pages')
+
+# 페이지를 옮길 때 넘겨 줄 세션 상태
+CARRIED_KEYS = ('portfolio', 'remaining_capital', 'selected_companies')
+
+_run_lock = threading.Lock()  # AppTest 재실행은 프로세스 안에서 한 번에 하나만
+
+
+def configure_environment(workdir, replay_dir=None):
+    """프로젝트 모듈을 import 하기 전에 오프라인/임시 저장소 설정을 한다 (모듈이 import 시점에 읽는다)."""
+    sys.path.insert(0, ROOT)
+    os.environ['SNU_DATA_PROVIDER'] = 'replay'
+    os.environ['SNU_REPLAY_DIR'] = replay_dir or os.path.join(workdir, 'replay')
+    os.environ['SNU_PRICE_STORE'] = os.path.join(workdir, 'price_store')
+    os.environ['SNU_LOGO_CACHE'] = os.path.join(workdir, 'logo_cache')
+    os.environ['SNU_LOGO_OFFLINE'] = '1'
+    os.environ['SNU_WARMUP'] = '0'
+
+
+def current_rss():
+    """현재 프로세스의 RSS (바이트). /proc 가 없으면 지금까지의 최대값으로 대신한다."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class RssSampler:
+    """백그라운드에서 RSS 를 주기적으로 읽어 최대값을 기록한다."""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+
+def counting_backend(inner):
+    """CoalescingProvider 안쪽 백엔드를 감싸 실제 호출 수를 센다."""
+    from data_provider import MarketDataProvider
+
+    class CountingProvider(MarketDataProvider):
+        def __init__(self):
+            self.inner = inner
+            self.name = inner.name
+            self.calls = 0
+            self._lock = threading.Lock()
+
+        def _count(self):
+            with self._lock:
+                self.calls += 1
+
+        def history(self, ticker, start=None, end=None, period=None):
+            self._count()
+            return self.inner.history(ticker, start=start, end=end, period=period)
+
+        def download(self, ticker, start=None, end=None):
+            self._count()
+            return self.inner.download(ticker, start=start, end=end)
+
+        def fred(self, series, start=None, end=None):
+            self._count()
+            return self.inner.fred(series, start=start, end=end)
+
+    return CountingProvider()
+
+
+class SessionError(Exception):
+    pass
+
+
+class Session:
+    """한 사용자의 흐름. 재실행 한 번마다 (단계 이름, 응답 초, 처리 초) 를 기록한다."""
+
+    def __init__(self, session_id, tickers, kings, aristocrats, timeout, think=0.0):
+        self.rng = random.Random(session_id)
+        self.tickers = tickers
+        self.kings = kings
+        self.aristocrats = aristocrats
+        self.timeout = timeout
+        self.think = think
+        self.state = {}
+        self.timings = []
+
+    def _open(self, page):
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_file(os.path.join(PAGES_DIR, page), default_timeout=self.timeout)
+        for key, value in self.state.items():
+            at.session_state[key] = value
+        return at
+
+    def _keep(self, at):
+        for key in CARRIED_KEYS:
+            if key in at.session_state:
+                self.state[key] = at.session_state[key]
+
+    def _step(self, name, action):
+        if self.think:
+            time.sleep(self.rng.expovariate(1 / self.think))  # 사용자가 다음 입력을 하기까지의 시간
+        requested = time.perf_counter()
+        with _run_lock:
+            started = time.perf_counter()
+            at = action()
+            finished = time.perf_counter()
+        if at.exception:
+            raise SessionError(f'{name}: {at.exception[0].value}')
+        self.timings.append((name, finished - requested, finished - started))
+        return at
+
+    def portfolio(self):
+        at = self._open('dividend_portfolio.py')
+        at = self._step('portfolio.open', at.run)
+        at = self._step('portfolio.capital', at.number_input[0].set_value(100000.0).run)
+        for ticker in self.rng.sample(self.tickers, 2):
+            at = self._step('portfolio.ticker', at.text_input[0].input(ticker).run)
+            at = self._step('portfolio.amount', at.number_input[1].set_value(1000.0).run)
+            at = self._step('portfolio.buy', at.button[0].click().run)
+        self._keep(at)
+
+    def reinvestment(self):
+        at = self._open('reinvestment.py')
+        at = self._step('reinvestment.open', at.run)
+        at = self._step('reinvestment.ticker', at.text_input[0].input(self.rng.choice(self.tickers)).run)
+        start, end = at.date_input[0].value, at.date_input[1].value
+        moved = start + timedelta(days=self.rng.randint(365, max(366, (end - start).days - 365)))
+        at = self._step('reinvestment.start_date', at.date_input[0].set_value(moved).run)
+        at = self._step('reinvestment.end_date', at.date_input[1].set_value(end - timedelta(days=self.rng.randint(1, 365))).run)
+
+    def reinvestment_difference(self):
+        at = self._open('reinvestment_difference.py')
+        self._step('reinvestment_difference.open', at.run)
+
+    def king_calendar(self):
+        at = self._open('king_calendar.py')
+        at = self._step('king_calendar.open', at.run)
+        at = self._step('king_calendar.select_king', at.selectbox(key='select_king').select(self.rng.choice(self.kings)).run)
+        at = self._step('king_calendar.add_king', at.button(key='add_king').click().run)
+        at = self._step('king_calendar.select_aristocrat', at.selectbox(key='select_aristocrat').select(self.rng.choice(self.aristocrats)).run)
+        at = self._step('king_calendar.add_aristocrat', at.button(key='add_aristocrat').click().run)
+        self._keep(at)
+
+    def run(self, flows=1):
+        for _ in range(flows):
+            self.portfolio()
+            self.reinvestment()
+            self.reinvestment_difference()
+            self.king_calendar()
+        return self.timings
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    if not ordered:
+        return float('nan')
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def latency_stats(seconds):
+    ms = [value * 1000 for value in seconds]
+    return {
+        'count': len(ms),
+        'p50_ms': percentile(ms, 50),
+        'p95_ms': percentile(ms, 95),
+        'p99_ms': percentile(ms, 99),
+        'max_ms': max(ms) if ms else float('nan'),
+        'mean_ms': statistics.fmean(ms) if ms else float('nan'),
+    }
+
+
+def run_wave(sessions, flows, first_id, backend, timeout, think=0.0):
+    from dividend_universe import dividend_aristocrat_stocks, dividend_king_stocks, universe_tickers
+
+    tickers = universe_tickers()
+    kings = [name for name, _, _ in dividend_king_stocks.values()]
+    aristocrats = [name for name, _, _ in dividend_aristocrat_stocks.values()]
+    calls_before = backend.calls
+    errors = []
+
+    def one(session_id):
+        try:
+            return Session(session_id, tickers, kings, aristocrats, timeout, think).run(flows)
+        except Exception as e:
+            errors.append(f'{type(e).__name__}: {e}')
+            return []
+
+    with RssSampler() as rss:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=sessions) as pool:
+            results = list(pool.map(one, range(first_id, first_id + sessions)))
+        wall = time.perf_counter() - started
+
+    timings = [timing for result in results for timing in result]
+    per_step = {}
+    for name, response, _ in timings:
+        per_step.setdefault(name, []).append(response)
+    return {
+        'sessions': sessions,
+        'wall_s': wall,
+        'reruns': len(timings),
+        'throughput_rps': len(timings) / wall if wall else 0.0,
+        'response': latency_stats([response for _, response, _ in timings]),
+        'service': latency_stats([service for _, _, service in timings]),
+        'steps': {name: latency_stats(values) for name, values in sorted(per_step.items())},
+        'provider_calls': backend.calls - calls_before,
+        'provider_calls_per_session': (backend.calls - calls_before) / sessions,
+        'peak_rss_mb': rss.peak / 1024 / 1024,
+        'errors': errors,
+    }
+
+
+def print_wave(result, show_steps):
+    response, service = result['response'], result['service']
+    print(f"[{result['sessions']:>3} 세션] 재실행 {result['reruns']:>4}회  {result['wall_s']:6.1f}s  {result['throughput_rps']:5.1f} rerun/s  "
+          f"공급자 {result['provider_calls_per_session']:5.1f}/세션  최대 RSS {result['peak_rss_mb']:6.1f} MB  오류 {len(result['errors'])}")
+    for label, stats in (('response', response), ('service', service)):
+        print(f"      {label:<9} p50 {stats['p50_ms']:7.1f}  p95 {stats['p95_ms']:7.1f}  p99 {stats['p99_ms']:7.1f}  max {stats['max_ms']:7.1f} ms")
+    if show_steps:
+        for name, stats in result['steps'].items():
+            print(f"      {name:<36}{stats['count']:>5}  p50 {stats['p50_ms']:7.1f}  p95 {stats['p95_ms']:7.1f} ms (response)")
+    for error in result['errors'][:5]:
+        print(f'      오류: {error}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='동시 세션 부하 테스트 (오프라인)')
+    parser.add_argument('--sessions', default='1,5,10', help='단계별 동시 세션 수 (쉼표로 구분)')
+    parser.add_argument('--flows', type=int, default=1, help='세션마다 전체 흐름을 반복할 횟수')
+    parser.add_argument('--replay-dir', help='녹화 데이터 폴더 (없으면 합성 시계열)')
+    parser.add_argument('--workdir', help='임시 저장소 위치 (기본: 새 임시 폴더)')
+    parser.add_argument('--think', type=float, default=0.0, help='재실행 사이 평균 사용자 대기 시간 (초, 지수 분포)')
+    parser.add_argument('--timeout', type=float, default=120, help='재실행 한 번의 제한 시간 (초)')
+    parser.add_argument('--steps', action='store_true', help='단계별 지연 시간도 출력')
+    parser.add_argument('--json', help='결과를 저장할 경로')
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='snu_load_')
+    configure_environment(workdir, args.replay_dir)
+
+    from data_provider import get_provider
+
+    provider = get_provider()
+    backend = provider.inner = counting_backend(provider.inner)
+
+    waves = [int(value) for value in args.sessions.split(',')]
+    print(f'작업 폴더: {workdir}  시작 RSS {current_rss() / 1024 / 1024:.1f} MB')
+    results, next_id = [], 0
+    for sessions in waves:
+        result = run_wave(sessions, args.flows, next_id, backend, args.timeout, args.think)
+        next_id += sessions
+        results.append(result)
+        print_wave(result, args.steps)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'workdir': workdir, 'flows': args.flows, 'waves': results}, f, indent=2)
+    return 1 if any(result['errors'] for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,33 @@
+import functools
+
+import pandas as pd
+
+from data_provider import synthetic_history
+
+# 벤치마크용 합성 시장 데이터 (일봉 + 분기 배당)
+# data_provider.synthetic_history 를 그대로 쓰므로 같은 (기간, 종목 수) 는 항상 같은 데이터다.
+
+END_DATE = '2024-12-31'  # 실행 날짜와 상관없이 같은 크기가 나오도록 고정
+YEARS = (1, 30, 60)
+TICKER_COUNTS = (1, 50, 500)
+
+
+def tickers(count):
+    return [f'SYN{i:03d}' for i in range(count)]
+
+
+@functools.lru_cache(maxsize=None)
+def market(years, count):
+    """{티커: 일봉 DataFrame} - years 년, count 종목."""
+    start = pd.Timestamp(END_DATE) - pd.DateOffset(years=years)
+    return {ticker: synthetic_history(ticker, start=start, end=END_DATE) for ticker in tickers(count)}
+
+
+def dividend_streams(years, count, shares=10.0):
+    """Portfolio.dividend_streams() 와 같은 모양의 (티커, 보유 주식 수를 곱한 배당 Series) 목록."""
+    return [(ticker, history['Dividends'][history['Dividends'] > 0] * shares) for ticker, history in market(years, count).items()]
+
+
+def long_frame(years, count):
+    """streamlit_graph_eunjeong 의 get_stock_data 처럼 'Ticker' 컬럼을 붙여 세로로 이은 DataFrame."""
+    return pd.concat([history.assign(Ticker=ticker) for ticker, history in market(years, count).items()])
@@ -0,0 +1,272 @@
+import os
+import re
+import zlib
+
+import numpy as np
+import pandas as pd
+
+import perf
+from frame_cache import frame_nbytes
+from singleflight import SingleFlight
+from timeutil import MARKET_TZ, local_dates, local_timestamp
+
+# 시세 데이터를 가져오는 백엔드 모음
+# live   : yfinance / FRED 에 직접 요청
+# replay : 녹화해 둔 파일(없으면 합성 시계열)을 로컬에서 재생 -> 네트워크 없이 측정 가능
+PROVIDER_ENV = 'SNU_DATA_PROVIDER'
+REPLAY_DIR_ENV = 'SNU_REPLAY_DIR'
+DEFAULT_REPLAY_DIR = 'replay_data'
+
+
+class MarketDataProvider:
+    """모든 탭이 거치는 시세 공급자 인터페이스."""
+
+    name = 'base'
+
+    def history(self, ticker, start=None, end=None, period=None):
+        """배당/분할 컬럼을 포함한 일봉 (yf.Ticker(...).history(actions=True) 와 같은 모양)."""
+        raise NotImplementedError
+
+    def download(self, ticker, start=None, end=None):
+        """'Adj Close' 가 포함된 일봉 (yf.download 와 같은 모양)."""
+        raise NotImplementedError
+
+    def fred(self, series, start=None, end=None):
+        """FRED 시계열 (pdr.get_data_fred 와 같은 모양)."""
+        raise NotImplementedError
+
+
+class YFinanceProvider(MarketDataProvider):
+    name = 'live'
+
+    def history(self, ticker, start=None, end=None, period=None):
+        import yfinance as yf
+
+        if start is None and period is None:
+            period = 'max'
+        return yf.Ticker(ticker).history(period=period, start=start, end=end, actions=True)
+
+    def download(self, ticker, start=None, end=None):
+        import yfinance as yf
+
+        return yf.download(ticker, start=start, end=end)
+
+    def fred(self, series, start=None, end=None):
+        from pandas_datareader import data as pdr
+
+        return pdr.get_data_fred(series, start=start, end=end)
+
+
+def _seed(name):
+    return zlib.crc32(name.upper().encode('utf-8'))
+
+
+def synthetic_history(ticker, start='1962-01-02', end=None, annual_yield=0.03):
+    """티커 이름으로 시드를 고정한 합성 일봉 (기하 브라운 운동 + 분기 배당).
+
+    같은 티커는 항상 같은 시계열을 돌려주므로 재현 가능한 벤치마크에 쓸 수 있다.
+    """
+    rng = np.random.default_rng(_seed(ticker))
+    end = end or pd.Timestamp.today().normalize()
+    index = pd.bdate_range(start, end, tz=MARKET_TZ.key, name='Date')
+    n = len(index)
+
+    returns = rng.normal(0.05 / 252, 0.2 / np.sqrt(252), n)
+    close = 20.0 * np.exp(np.cumsum(returns))
+    spread = np.abs(rng.normal(0, 0.01, n)) * close
+    frame = pd.DataFrame({
+        'Open': close + rng.normal(0, 0.5, n) * spread,
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': rng.integers(1_000_000, 20_000_000, n),
+        'Dividends': 0.0,
+        'Stock Splits': 0.0,
+    }, index=index)
+
+    # 티커마다 1/4/7/10, 2/5/8/11, 3/6/9/12 중 한 주기로 분기 배당
+    offset = _seed(ticker) % 3
+    month_key = index.year * 12 + index.month
+    month_start = np.r_[True, month_key[1:] != month_key[:-1]]
+    payment_days = month_start & ((index.month - 1) % 3 == offset)
+    frame.loc[payment_days, 'Dividends'] = np.round(close[payment_days] * annual_yield / 4, 4)
+    return frame
+
+
+def synthetic_fred(series, start='1960-01-01', end=None):
+    """월별 CPI 비슷한 합성 지수."""
+    rng = np.random.default_rng(_seed(series))
+    end = end or pd.Timestamp.today().normalize()
+    index = pd.date_range(start, end, freq='MS', name='DATE')
+    values = 30.0 * np.exp(np.cumsum(rng.normal(0.003, 0.003, len(index))))
+    return pd.DataFrame({series: values}, index=index)
+
+
+def _apply_period(frame, period):
+    # yfinance 의 period 문자열 ('1d', '5d', '1mo', '1y', 'ytd', 'max') 을 로컬에서 흉내낸다
+    if frame.empty or period in (None, 'max'):
+        return frame
+    if period == '1d':
+        return frame.tail(1)
+    last = frame.index[-1]
+    if period == 'ytd':
+        return frame[frame.index.year == last.year]
+    match = re.fullmatch(r'(\d+)(d|mo|y)', period)
+    if match is None:
+        raise ValueError(f'지원하지 않는 period: {period}')
+    amount, unit = int(match.group(1)), match.group(2)
+    if unit == 'd':
+        return frame.tail(amount)
+    offset = pd.DateOffset(months=amount) if unit == 'mo' else pd.DateOffset(years=amount)
+    return frame[frame.index > last - offset]
+
+
+def _slice(frame, start=None, end=None):
+    # yfinance 와 같이 start 는 포함, end 는 제외
+    index = local_dates(frame.index)
+    mask = np.ones(len(frame), dtype=bool)
+    if start is not None:
+        mask &= index >= local_timestamp(start)
+    if end is not None:
+        mask &= index < local_timestamp(end)
+    return frame[mask]
+
+
+class ReplayProvider(MarketDataProvider):
+    """녹화된 응답을 로컬 파일에서 재생한다.
+
+    파일 구조: ``<root>/history/<TICKER>.parquet``, ``<root>/fred/<SERIES>.csv``.
+    파일이 없고 ``synthetic`` 이면 합성 시계열을 대신 돌려준다.
+    """
+
+    name = 'replay'
+
+    def __init__(self, root=DEFAULT_REPLAY_DIR, synthetic=True):
+        self.root = root
+        self.synthetic = synthetic
+
+    def _history_path(self, ticker):
+        return os.path.join(self.root, 'history', f'{ticker.upper()}.parquet')
+
+    def _fred_path(self, series):
+        return os.path.join(self.root, 'fred', f'{series}.csv')
+
+    def _full_history(self, ticker):
+        path = self._history_path(ticker)
+        if os.path.exists(path):
+            return pd.read_parquet(path)
+        if self.synthetic:
+            return synthetic_history(ticker)
+        return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits'])
+
+    def history(self, ticker, start=None, end=None, period=None):
+        frame = self._full_history(ticker)
+        if start is not None or end is not None:
+            return _slice(frame, start, end)
+        return _apply_period(frame, period)
+
+    def download(self, ticker, start=None, end=None):
+        frame = _slice(self._full_history(ticker), start, end)
+        frame = frame[['Open', 'High', 'Low', 'Close', 'Volume']].copy()
+        frame.insert(4, 'Adj Close', frame['Close'])
+        frame.index = local_dates(frame.index)
+        return frame
+
+    def fred(self, series, start=None, end=None):
+        path = self._fred_path(series)
+        if os.path.exists(path):
+            frame = pd.read_csv(path, parse_dates=['DATE'], index_col='DATE')
+        elif self.synthetic:
+            frame = synthetic_fred(series)
+        else:
+            frame = pd.DataFrame(columns=[series])
+        return _slice(frame, start, end)
+
+
+class RecordingProvider(MarketDataProvider):
+    """다른 공급자의 응답을 그대로 돌려주면서 ReplayProvider 형식으로 녹화한다."""
+
+    name = 'record'
+
+    def __init__(self, inner, root=DEFAULT_REPLAY_DIR):
+        self.inner = inner
+        self.root = root
+
+    def history(self, ticker, start=None, end=None, period=None):
+        frame = self.inner.history(ticker, start=start, end=end, period=period)
+        if start is None and end is None and period in (None, 'max') and not frame.empty:
+            path = os.path.join(self.root, 'history', f'{ticker.upper()}.parquet')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            frame.to_parquet(path)
+        return frame
+
+    def download(self, ticker, start=None, end=None):
+        return self.inner.download(ticker, start=start, end=end)
+
+    def fred(self, series, start=None, end=None):
+        frame = self.inner.fred(series, start=start, end=end)
+        path = os.path.join(self.root, 'fred', f'{series}.csv')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        frame.rename_axis('DATE').to_csv(path)
+        return frame
+
+
+def _counted(fn):
+    # 실제로 백엔드를 호출한 쪽(SingleFlight 의 대표 호출)에서만 호출 수와 받은 바이트 수를 센다
+    def call(*args, **kwargs):
+        result = fn(*args, **kwargs)
+        perf.count('provider.calls')
+        perf.count('provider.bytes', frame_nbytes(result))
+        return result
+    return call
+
+
+class CoalescingProvider(MarketDataProvider):
+    """같은 (티커, 조회 조건) 요청이 동시에 들어오면 한 번만 보내고 결과를 나눠 준다."""
+
+    def __init__(self, inner, flight=None):
+        self.inner = inner
+        self.name = inner.name
+        self.flight = flight or SingleFlight()
+
+    def history(self, ticker, start=None, end=None, period=None):
+        key = ('history', ticker.upper(), str(start), str(end), period)
+        with perf.span('provider.history', 'fetch', ticker=ticker):
+            return self.flight.do(key, _counted(self.inner.history), ticker, start=start, end=end, period=period)
+
+    def download(self, ticker, start=None, end=None):
+        key = ('download', ticker.upper(), str(start), str(end))
+        with perf.span('provider.download', 'fetch', ticker=ticker):
+            return self.flight.do(key, _counted(self.inner.download), ticker, start=start, end=end)
+
+    def fred(self, series, start=None, end=None):
+        key = ('fred', series, str(start), str(end))
+        with perf.span('provider.fred', 'fetch', series=series):
+            return self.flight.do(key, _counted(self.inner.fred), series, start=start, end=end)
+
+
+_provider = None
+
+
+def get_provider():
+    """환경 변수 SNU_DATA_PROVIDER (live | replay | record) 로 고른 공급자를 돌려준다."""
+    global _provider
+    if _provider is None:
+        kind = os.environ.get(PROVIDER_ENV, 'live')
+        root = os.environ.get(REPLAY_DIR_ENV, DEFAULT_REPLAY_DIR)
+        if kind == 'live':
+            _provider = YFinanceProvider()
+        elif kind == 'replay':
+            _provider = ReplayProvider(root)
+        elif kind == 'record':
+            _provider = RecordingProvider(YFinanceProvider(), root)
+        else:
+            raise ValueError(f'알 수 없는 {PROVIDER_ENV}: {kind}')
+        _provider = CoalescingProvider(_provider)
+    return _provider
+
+
+def set_provider(provider):
+    """벤치마크나 부하 테스트에서 공급자를 직접 바꿔 끼울 때 쓴다."""
+    global _provider
+    _provider = provider
@@ -0,0 +1,52 @@
+import pandas as pd
+
+import perf
+from timeutil import local_timestamp, with_local_dates
+
+# 보유 종목별 배당 이력을 (티커 x 12개월) 행렬로 집계한다
+# 배당 이벤트마다 한 줄씩 차트에 넘기지 않고, 차트에는 항상 12 x N 값만 넘긴다.
+
+MONTHS = list(range(1, 13))
+
+MODES = {
+    'ttm': '최근 12개월',
+    'average': '연평균',
+    'all': '전체 기간',
+}
+
+
+@perf.timed('dividend_calendar.monthly_matrix')
+def monthly_dividend_matrix(holdings, mode='all', as_of=None):
+    """holdings: (티커, 배당 Series) 쌍의 목록 -> index=티커, columns=1..12 인 DataFrame.
+
+    mode
+      'ttm'     : as_of(기본 지금) 이전 12개월 동안 받은 배당
+      'average' : 월별 합계를 배당 이력이 걸친 연도 수로 나눈 평균적인 한 해
+      'all'     : 전체 이력의 월별 합계
+    같은 티커가 여러 번 들어 있으면 한 행으로 합친다.
+    """
+    if mode not in MODES:
+        raise ValueError(f'알 수 없는 집계 기준: {mode}')
+    holdings = [(ticker, series) for ticker, series in holdings if not series.empty]
+    if not holdings:
+        return pd.DataFrame(0.0, index=pd.Index([], name='ticker'), columns=MONTHS)
+
+    # 거래소마다 시간대가 다를 수 있으므로 현지 날짜 기준(tz 제거)으로 맞춘 뒤 한 번에 묶는다
+    combined = pd.concat([with_local_dates(series) for _, series in holdings], keys=[ticker for ticker, _ in holdings], names=['ticker', 'Date'])
+    dates = combined.index.get_level_values('Date')
+
+    if mode == 'ttm':
+        as_of = pd.Timestamp.now() if as_of is None else local_timestamp(as_of)
+        recent = (dates > as_of - pd.DateOffset(years=1)) & (dates <= as_of)
+        combined, dates = combined[recent], dates[recent]
+
+    tickers = combined.index.get_level_values('ticker')
+    matrix = combined.groupby([tickers, dates.month]).sum().unstack(fill_value=0.0)
+    matrix = matrix.reindex(index=pd.unique(pd.Index([ticker for ticker, _ in holdings])), columns=MONTHS, fill_value=0.0)
+    matrix.index.name = 'ticker'
+    matrix.columns.name = 'month'
+
+    if mode == 'average':
+        years = pd.Series(dates.year, index=tickers).groupby(level=0).nunique()
+        matrix = matrix.div(years.reindex(matrix.index).clip(lower=1), axis=0)
+    return matrix.astype(float)
@@ -0,0 +1,231 @@
+"""배당 지급 월 색인 (실제 배당 이력에서 계산).
+
+종목 CSV(king_data.csv, ticker_data.csv, etf_companies_info.csv)와 배당킹/귀족 목록의 티커마다
+최근 12개월 배당 지급 월(12비트 마스크), 지급 횟수, 최근 12개월 배당 합계, 마지막 배당일, 최근 종가를
+한 장의 작은 표로 만들어 price_store 옆에 Parquet 로 저장한다.
+갱신할 때는 색인을 만든 뒤 저장소 파일이 바뀐 티커만 시세를 읽어 다시 계산하고, 바뀐 것이 있을 때만 파일을 쓴다.
+메모리에는 달마다 배당을 주는 티커 목록을 미리 만들어 두어 "3월에 배당 주는 종목" 을 바로 돌려준다.
+
+    python dividend_index.py             # 전체 티커 색인 갱신 (저장소에 있는 시세로)
+    python dividend_index.py --refresh   # 시세 저장소부터 갱신한 뒤 색인
+    python dividend_index.py --month 3   # 3월에 배당을 주는 티커
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import analytics
+import price_store
+from dividend_universe import STOCK_CSVS, read_tickers, universe_tickers
+from timeutil import local_timestamp
+
+COLUMNS = ['mask', 'frequency', 'ttm_dividend', 'last_payment', 'last_close', 'as_of', 'store_mtime']
+
+
+def index_path():
+    return os.path.join(price_store.STORE_DIR, 'dividend_index.parquet')
+
+
+def index_tickers():
+    """색인에 넣을 티커 (배당킹/귀족 목록 + 종목 CSV 세 개, 중복 제거)."""
+    return list(dict.fromkeys(universe_tickers() + read_tickers([path for path in STOCK_CSVS if os.path.exists(path)])))
+
+
+def month_mask(months):
+    """지급 월 목록 (1..12) -> 12비트 마스크 (1월 = 1 << 0)."""
+    mask = 0
+    for month in months:
+        mask |= 1 << (month - 1)
+    return mask
+
+
+def mask_months(mask):
+    """12비트 마스크 -> 지급 월 목록 (1..12, 오름차순)."""
+    return [month for month in range(1, 13) if mask >> (month - 1) & 1]
+
+
+def summarize(history):
+    """한 종목 전체 시세 -> 색인 한 줄 (store_mtime 을 뺀 COLUMNS 키의 dict). 기준일은 마지막 봉 날짜."""
+    as_of = history.index[-1]
+    dividends = price_store.dividend_events(history)
+    ttm = analytics.trailing_dividends(dividends, as_of=as_of)
+    return {
+        'mask': month_mask(set(ttm.index.month)),
+        'frequency': len(ttm),
+        'ttm_dividend': float(ttm.sum()),
+        'last_payment': local_timestamp(dividends.index[-1]) if len(dividends) else pd.NaT,
+        'last_close': float(history['Close'].iloc[-1]),
+        'as_of': local_timestamp(as_of),
+    }
+
+
+class DividendIndex:
+    """티커별 배당 요약 표와 달별 티커 목록 (읽기 전용)."""
+
+    def __init__(self, frame):
+        self.frame = frame
+        masks = frame['mask'].to_numpy(dtype=np.int64)
+        tickers = frame.index.to_numpy()
+        self._masks = dict(zip(tickers, masks.tolist()))
+        self._by_month = [tuple(tickers[(masks >> month) & 1 == 1]) for month in range(12)]
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __contains__(self, ticker):
+        return ticker in self._masks
+
+    def mask(self, ticker):
+        """티커의 지급 월 12비트 마스크 (1월 = 1 << 0). 색인에 없으면 None."""
+        return self._masks.get(ticker)
+
+    def months(self, ticker):
+        """티커의 최근 12개월 지급 월 (1..12). 색인에 없으면 None."""
+        mask = self._masks.get(ticker)
+        return None if mask is None else mask_months(mask)
+
+    def pays_in(self, month):
+        """month(1..12)에 배당을 준 티커 튜플."""
+        return self._by_month[month - 1]
+
+    def row(self, ticker):
+        """티커의 색인 한 줄 (COLUMNS 키의 dict). 색인에 없으면 None."""
+        if ticker not in self._masks:
+            return None
+        return self.frame.loc[ticker].to_dict()
+
+
+def _empty_frame():
+    frame = pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in zip(COLUMNS, ['int16', 'int8', 'float64', 'datetime64[ns]', 'float64', 'datetime64[ns]', 'float64'])})
+    frame.index.name = 'ticker'
+    return frame
+
+
+def read_index(path=None):
+    """저장된 색인 표. 파일이 없으면 빈 표."""
+    path = path or index_path()
+    if not os.path.exists(path):
+        return _empty_frame()
+    return pd.read_parquet(path).reindex(columns=COLUMNS)  # 예전 형식(store_mtime 없음)은 모두 다시 계산된다
+
+
+def write_index(frame, path=None):
+    path = path or index_path()
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')  # 쓰는 쪽(스레드/프로세스)마다 다른 임시 파일
+    os.close(fd)
+    try:
+        frame.to_parquet(tmp_path)
+        os.replace(tmp_path, path)  # 읽는 쪽이 쓰다 만 파일을 보지 않도록 교체
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _store_mtime(ticker):
+    path = price_store.store_path(ticker)
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+_update_lock = threading.Lock()  # warm-up 스레드와 페이지가 같은 프로세스에서 동시에 읽고-고쳐-쓰지 않도록
+
+
+def update_index(tickers=None, path=None, max_workers=8, refresh=False):
+    """tickers(기본: index_tickers())의 색인을 갱신한다 -> {'updated': [...], 'unchanged': n, 'errors': {...}}.
+
+    색인을 만든 뒤 시세 저장소 파일이 바뀐(store_mtime 이 새로워진) 티커와 새 티커만 시세를 읽고,
+    그중 기준일(as_of)이 늦어진 티커만 다시 계산한다. 색인에 있던 다른 티커는 그대로 둔다.
+    refresh=True 면 먼저 모든 티커의 시세 저장소를 갱신한다 (price_store.load_histories).
+    """
+    tickers = index_tickers() if tickers is None else [ticker.upper() for ticker in tickers]
+    errors = {}
+    if refresh:
+        _, errors = price_store.load_histories(tickers, max_workers=max_workers)
+        tickers = [ticker for ticker in tickers if ticker not in errors]
+
+    with _update_lock:
+        frame = read_index(path)
+        stale = []
+        for ticker in tickers:
+            mtime = _store_mtime(ticker)
+            if ticker in frame.index and mtime is not None and frame.at[ticker, 'store_mtime'] >= mtime:
+                continue  # 저장소 파일이 색인을 만든 뒤로 그대로다
+            stale.append(ticker)
+        histories, failed = price_store.load_histories(stale, max_workers=max_workers)
+        errors.update(failed)
+
+        rows, touched = {}, {}
+        for ticker, history in histories.items():
+            mtime = _store_mtime(ticker)
+            if ticker in frame.index and frame.at[ticker, 'as_of'] >= local_timestamp(history.index[-1]):
+                touched[ticker] = mtime  # 파일만 다시 쓰였고 새 봉은 없다
+                continue
+            rows[ticker] = dict(summarize(history), store_mtime=mtime)
+
+        if rows or touched:
+            for ticker, mtime in touched.items():
+                frame.at[ticker, 'store_mtime'] = mtime
+            if rows:
+                changed = pd.DataFrame.from_dict(rows, orient='index')[COLUMNS].astype(_empty_frame().dtypes.to_dict())
+                frame = pd.concat([frame.drop(index=list(rows), errors='ignore'), changed]).sort_index()
+                frame.index.name = 'ticker'
+            write_index(frame, path)
+            _set_current(DividendIndex(frame), path)
+    return {'updated': sorted(rows), 'unchanged': len(tickers) - len(rows) - len(failed), 'errors': errors}
+
+
+_current = None  # (경로, 파일 수정 시각, DividendIndex)
+_current_lock = threading.Lock()
+
+
+def _set_current(index, path=None):
+    global _current
+    path = path or index_path()
+    with _current_lock:
+        _current = (path, os.path.getmtime(path), index)
+
+
+def get_index(path=None):
+    """프로세스에 하나뿐인 메모리 색인. 다른 프로세스(warm-up, CLI)가 파일을 바꾸면 다음 호출에서 다시 읽는다."""
+    global _current
+    path = path or index_path()
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    with _current_lock:
+        if _current is not None and _current[0] == path and _current[1] == mtime:
+            return _current[2]
+    index = DividendIndex(read_index(path))
+    with _current_lock:
+        _current = (path, mtime, index)
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='배당 지급 월 색인 갱신 / 조회')
+    parser.add_argument('--month', type=int, choices=range(1, 13), help='이 달에 배당을 주는 티커만 출력 (갱신하지 않음)')
+    parser.add_argument('--tickers', nargs='+', help='갱신할 티커 (기본: 종목 CSV 전체)')
+    parser.add_argument('--refresh', action='store_true', help='색인 전에 시세 저장소도 갱신 (기본: 저장소에 있는 시세로만 색인)')
+    parser.add_argument('-j', '--workers', type=int, default=8)
+    args = parser.parse_args(argv)
+
+    if args.month:
+        print(' '.join(get_index().pays_in(args.month)))
+        return 0
+
+    started = time.perf_counter()
+    result = update_index(args.tickers, max_workers=args.workers, refresh=args.refresh)
+    print(f"갱신 {len(result['updated'])}, 그대로 {result['unchanged']}, 실패 {len(result['errors'])} -> {index_path()} "
+          f'[{time.perf_counter() - started:.1f}s]')
+    for ticker, error in result['errors'].items():
+        print(f'  {ticker}: {error}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
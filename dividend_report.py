@@ -0,0 +1,74 @@
+"""전체 종목 배당/재투자 리포트 배치 생성.
+
+    python dividend_report.py king_data.csv etf_companies_info.csv -o report.parquet
+    python dividend_report.py --tickers KO PEP JNJ -o report.csv --start 2010-01-01
+
+티커 목록(CSV 의 ticker / Ticker 컬럼 또는 --tickers)의 DRIP CAGR, 배당수익률, 배당 지급 월, 총수익률을
+프로세스 풀에서 종목별로 나누어 계산하고 한 파일로 저장한다 (확장자가 .csv 면 CSV, 아니면 Parquet).
+시세는 price_store 를 거치므로 SNU_DATA_PROVIDER / SNU_PRICE_STORE 설정을 그대로 따른다.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from analytics import REPORT_COLUMNS, drip_report
+from dividend_universe import read_tickers
+
+
+def _report_row(ticker, start, end):
+    # 워커 프로세스에서 실행된다. 한 종목의 실패가 배치 전체를 멈추지 않도록 오류를 행에 남긴다.
+    try:
+        return drip_report(ticker, start=start, end=end)
+    except Exception as e:
+        row = dict.fromkeys(REPORT_COLUMNS)
+        row.update(ticker=ticker, error=f'{type(e).__name__}: {e}')
+        return row
+
+
+def build_report(tickers, start=None, end=None, max_workers=None):
+    """tickers 전체의 리포트 DataFrame (입력 순서 유지). max_workers=1 이면 현재 프로세스에서 계산한다."""
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    if max_workers == 1:
+        rows = [_report_row(ticker, start, end) for ticker in tickers]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            rows = list(pool.map(_report_row, tickers, [start] * len(tickers), [end] * len(tickers), chunksize=4))
+    return pd.DataFrame(rows, columns=REPORT_COLUMNS)
+
+
+def write_report(report, path):
+    if path.lower().endswith('.csv'):
+        report.to_csv(path, index=False)
+    else:
+        report.to_parquet(path, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='배당/재투자 리포트 배치 생성')
+    parser.add_argument('csv', nargs='*', help='티커 컬럼이 있는 CSV (예: king_data.csv etf_companies_info.csv)')
+    parser.add_argument('--tickers', nargs='+', default=[], help='직접 지정할 티커')
+    parser.add_argument('-o', '--output', default='dividend_report.parquet', help='저장 경로 (.parquet 또는 .csv)')
+    parser.add_argument('--start', help='계산 시작일 (포함)')
+    parser.add_argument('--end', help='계산 종료일 (제외)')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(), help='워커 프로세스 수')
+    args = parser.parse_args(argv)
+
+    tickers = read_tickers(args.csv) + [ticker.upper() for ticker in args.tickers]
+    if not tickers:
+        parser.error('CSV 파일이나 --tickers 로 티커를 하나 이상 지정하세요.')
+
+    started = time.perf_counter()
+    report = build_report(tickers, start=args.start, end=args.end, max_workers=args.workers)
+    write_report(report, args.output)
+
+    failed = report['error'].notna().sum()
+    print(f'{len(report)}개 종목 ({failed}개 실패) -> {args.output} [{time.perf_counter() - started:.1f}s]')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
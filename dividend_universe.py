@@ -0,0 +1,80 @@
+import csv
+import os
+
+# 배당킹주(50년 이상 연속 배당 증가)와 배당귀족주(25년 이상) 목록
+# 티커: (회사 이름, 로고 URL, 배당 지급 월)
+# 배당 지급 월은 손으로 적어 둔 값이라, 화면에서는 배당 이력으로 계산한 dividend_index 를 먼저 쓰고 색인에 없을 때만 쓴다.
+dividend_king_stocks = {
+    'MMM': ('3M', 'https://seeklogo.com/images/1/3M-logo-DCF26CFF14-seeklogo.com.png', [3, 6, 9, 12]),
+    'KO': ('Coca-Cola', 'https://seeklogo.com/images/C/coca-cola-circle-logo-A9EBD3B00A-seeklogo.com.png', [1, 4, 7, 10]),
+    'JNJ': ('Johnson & Johnson', 'https://seeklogo.com/images/J/johnson-johnson-logo-5912A7508E-seeklogo.com.png', [2, 5, 8, 11]),
+    'PG': ('Procter & Gamble', 'https://seeklogo.com/images/P/p-g-logo-14BC19B5E7-seeklogo.com.png', [3, 6, 9, 12]),
+    'CL': ('Colgate-Palmolive', 'https://seeklogo.com/images/C/colgate-palmolive-logo-63D53420E1-seeklogo.com.png', [1, 4, 7, 10]),
+    'PEP': ('PepsiCo', 'https://seeklogo.com/images/P/pepsi-vertical-logo-72846897FF-seeklogo.com.png', [3, 6, 9, 12]),
+    'GPC': ('Genuine Parts Company', 'https://seeklogo.com/images/G/genuine-parts-company-logo-23D67B3040-seeklogo.com.png', [3, 6, 9, 12]),
+    'ABT': ('Abbott', 'https://g.foolcdn.com/art/companylogos/mark/ABT.png', [2, 5, 8, 11]),
+    'PH': ('Parker Hannifin', 'https://seeklogo.com/images/P/Parker_Hannifin-logo-30D7790AEF-seeklogo.com.png', [2, 5, 8, 11]),
+    'WBA': ('Walgreens Boots Alliance', 'https://seeklogo.com/images/W/Walgreens-logo-38D42E4EC1-seeklogo.com.png', [1, 4, 7, 10]),
+    'LOW': ('Lowe’s', 'https://seeklogo.com/images/L/lowes-logo-BD8C045F2F-seeklogo.com.png', [2, 5, 8, 11]),
+    'CLX': ('Clorox', 'https://seeklogo.com/images/C/Clorox-logo-88E4ED3C26-seeklogo.com.png', [3, 6, 9, 12]),
+    'HRL': ('Hormel Foods', 'https://seeklogo.com/images/H/hormel-logo-2C9BC6463A-seeklogo.com.png', [1, 4, 7, 10]),
+    'CVX': ('Chevron', 'https://seeklogo.com/images/C/Chevron_Corporation-logo-FFAC2E8206-seeklogo.com.png', [2, 5, 8, 11]),
+    'EMR': ('Emerson Electric', 'https://seeklogo.com/images/E/Emerson_Electric-logo-CF7EACA482-seeklogo.com.png', [3, 6, 9, 12]),
+    'SYY': ('Sysco', 'https://seeklogo.com/images/S/sysco-logo-7B5B009D80-seeklogo.com.png', [1, 4, 7, 10]),
+    'SWK': ('Stanley Black & Decker', 'https://seeklogo.com/images/S/stanley-black-decker-logo-81E59F852A-seeklogo.com.png', [2, 5, 8, 11]),
+    'AFL': ('Aflac', 'https://seeklogo.com/images/A/AFLAC-logo-EDE6C89650-seeklogo.com.png', [3, 6, 9, 12]),
+    'SHW': ('Sherwin-Williams', 'https://seeklogo.com/images/S/Sherwin_Williams-logo-3FE71297BA-seeklogo.com.png', [1, 4, 7, 10]),
+    'LLY': ('Eli Lilly', 'https://seeklogo.com/images/L/Lilly-logo-6EF04E4361-seeklogo.com.png', [2, 5, 8, 11]),
+}
+
+dividend_aristocrat_stocks = {
+    'ADM': ('Archer Daniels Midland', 'https://seeklogo.com/images/A/archer-daniels-midland-company-logo-B4F247583E-seeklogo.com.png', [1, 4, 7, 10]),
+    'ABBV': ('AbbVie', 'https://seeklogo.com/images/A/abbvie-logo-BEB7C12577-seeklogo.com.png', [2, 5, 8, 11]),
+    'DOV': ('Dover', 'https://seeklogo.com/images/D/Dover-logo-2F344F6F42-seeklogo.com.png', [3, 6, 9, 12]),
+    'ITW': ('Illinois Tool Works', 'https://seeklogo.com/images/I/illinois-tool-works-logo-FCB6FE9266-seeklogo.com.png', [1, 4, 7, 10]),
+    'KMB': ('Kimberly-Clark', 'https://seeklogo.com/images/K/Kimberly-Clark_Sopalin-logo-8B40BD9217-seeklogo.com.png', [3, 6, 9, 12]),
+    'XOM': ('ExxonMobil', 'https://seeklogo.com/images/E/Exxon-logo-6F21C176C8-seeklogo.com.png', [1, 4, 7, 10]),
+    'MDT': ('Medtronic', 'https://seeklogo.com/images/M/medtronic-healthcare-logo-97942C1A14-seeklogo.com.png', [2, 5, 8, 11]),
+    'WMT': ('Walmart', 'https://seeklogo.com/images/W/walmart-spark-logo-57DC35C86C-seeklogo.com.png', [1, 4, 7, 10]),
+    'TROW': ('T. Rowe Price', 'https://seeklogo.com/images/T/trow-logo-5361227321-seeklogo.com.png', [2, 5, 8, 11]),
+    'APD': ('Air Products and Chemicals', 'https://seeklogo.com/images/A/Air_Products_and_Chemicals-logo-ACDA8A1C8B-seeklogo.com.png', [1, 4, 7, 10]),
+    'BF-B': ('Brown-Forman', 'https://seeklogo.com/images/B/brown-forman-logo-B919105D7B-seeklogo.com.png', [2, 5, 8, 11]),
+    'CINF': ('Cincinnati Financial', 'https://seeklogo.com/images/C/cincinnati-financial-logo-A2A7957DB1-seeklogo.com.png', [3, 6, 9, 12]),
+    'CTAS': ('Cintas', 'https://seeklogo.com/images/C/cintas-logo-0F4637C8B8-seeklogo.com.png', [1, 4, 7, 10]),
+    'ED': ('Consolidated Edison', 'https://seeklogo.com/images/C/consolidated-edison-logo-F23BE97D80-seeklogo.com.png', [2, 5, 8, 11]),
+    'GWW': ('Grainger', 'https://seeklogo.com/images/G/grainger-logo-C959D21C07-seeklogo.com.png', [1, 4, 7, 10]),
+    'MKC': ('McCormick', 'https://seeklogo.com/images/M/McCormick-logo-144428A8DB-seeklogo.com.png', [3, 6, 9, 12]),
+    'NUE': ('Nucor', 'https://seeklogo.com/images/N/Nucor-logo-E63140A596-seeklogo.com.png', [2, 5, 8, 11]),
+    'ROP': ('Roper Technologies', 'https://seeklogo.com/images/R/Roper-logo-73AE49CBF0-seeklogo.com.png', [3, 6, 9, 12]),
+    'SPGI': ('S&P Global', 'https://seeklogo.com/images/S/s-p-global-logo-62660CED63-seeklogo.com.png', [1, 4, 7, 10]),
+    'TGT': ('Target', 'https://seeklogo.com/images/T/Target-logo-9FE48EBE3B-seeklogo.com.png', [2, 5, 8, 11]),
+    'MCD': ('McDonald’s', 'https://seeklogo.com/images/M/mcdonald-s-golden-arches-logo-93483062BF-seeklogo.com.png', [3, 6, 9, 12]),
+}
+
+
+def universe_tickers():
+    return list(dividend_king_stocks) + list(dividend_aristocrat_stocks)
+
+
+def universe_logo_urls():
+    return [url for _, url, _ in list(dividend_king_stocks.values()) + list(dividend_aristocrat_stocks.values())]
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 종목 목록 CSV (배당 색인, 섹터, warm-up 이 같이 쓴다) 와 티커 컬럼 이름
+STOCK_CSVS = tuple(os.path.join(ROOT, name) for name in ('king_data.csv', 'ticker_data.csv', 'etf_companies_info.csv'))
+TICKER_COLUMNS = ('ticker', 'Ticker')
+
+
+def read_tickers(csv_paths):
+    """CSV 파일들의 티커 컬럼을 순서대로 합친 목록 (대문자, 중복 제거)."""
+    tickers = []
+    for path in csv_paths:
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            column = next((name for name in TICKER_COLUMNS if name in (reader.fieldnames or [])), None)
+            if column is None:
+                raise ValueError(f'{path} 에 티커 컬럼({", ".join(TICKER_COLUMNS)})이 없습니다.')
+            tickers.extend(row[column].strip().upper() for row in reader if row[column] and row[column].strip())
+    return list(dict.fromkeys(tickers))
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+import perf
+
+# 긴 일봉 차트를 브라우저로 보내기 전에 줄이는 LTTB(Largest-Triangle-Three-Buckets) 다운샘플링
+# 차트 폭보다 훨씬 많은 점은 화면에서 구분되지 않으므로, 모양(고점/저점)을 살리는 점만 남긴다.
+
+CHART_WIDTH_PX = 1000  # st.plotly_chart 기본 폭 근처
+POINTS_PER_PX = 1
+
+
+def point_budget(width_px=CHART_WIDTH_PX, points_per_px=POINTS_PER_PX):
+    return int(width_px * points_per_px)
+
+
+def lttb_indices(x, y, n_out):
+    """LTTB 로 고른 점들의 위치(정렬된 정수 배열). 첫 점과 마지막 점은 항상 포함한다."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # 첫/마지막 점을 뺀 나머지를 n_out - 2 개 버킷으로 나눈다
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    starts, ends = edges[:-1], edges[1:]
+    ends[-1] = n - 1
+
+    # 다음 버킷의 평균점은 선택 결과와 무관하므로 미리 한 번에 계산한다
+    csum_x = np.r_[0.0, np.cumsum(x)]
+    csum_y = np.r_[0.0, np.cumsum(y)]
+    next_starts = np.r_[starts[1:], n - 1]
+    next_ends = np.r_[ends[1:], n]
+    counts = next_ends - next_starts
+    avg_x = (csum_x[next_ends] - csum_x[next_starts]) / counts
+    avg_y = (csum_y[next_ends] - csum_y[next_starts]) / counts
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for b in range(n_out - 2):
+        lo, hi = starts[b], ends[b]
+        bx, by = x[lo:hi], y[lo:hi]
+        # 이전 선택점, 버킷 안의 후보, 다음 버킷 평균점이 이루는 삼각형 넓이가 가장 큰 점
+        area = np.abs((x[prev] - avg_x[b]) * (by - y[prev]) - (x[prev] - bx) * (avg_y[b] - y[prev]))
+        prev = lo + int(np.argmax(area))
+        selected[b + 1] = prev
+    return selected
+
+
+@perf.timed('downsample.positions')
+def downsample_positions(index, columns, n_out, keep=None):
+    """여러 시계열이 같은 x 를 쓰도록 각 열의 LTTB 결과와 keep 위치를 합친 위치 배열.
+
+    index: DatetimeIndex, columns: 같은 길이의 값 배열 목록, keep: 반드시 남길 날짜 (예: 배당일)
+    """
+    n = len(index)
+    if n <= n_out:
+        return np.arange(n)
+    x = index.asi8 if isinstance(index, pd.DatetimeIndex) else np.arange(n)
+    per_column = max(3, n_out // max(1, len(columns)))
+    positions = [lttb_indices(x, values, per_column) for values in columns]
+    if keep is not None and len(keep):
+        positions.append(np.flatnonzero(index.isin(keep)))
+    return np.unique(np.concatenate(positions))
@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+
+import perf
+from timeutil import DAYS_PER_YEAR, local_dates, local_timestamp
+
+# 배당 재투자(DRIP) 시뮬레이션 엔진
+# 하루하루 .iloc 로 주식 수를 갱신하던 루프를 누적곱 한 번으로 바꾼다:
+#   shares_t = shares_0 * prod_{k<=t} (1 + dividend_k * (1 - tax) / close_k)
+# 전체 이력의 누적곱을 한 번 만들어 두면(DripIndex) 임의의 구간은 두 값의 나눗셈으로 구할 수 있다.
+
+
+def reinvestment_factors(close, dividends, withholding_tax=0.0):
+    """일별 재투자 배수 (1 + 세후 배당 / 종가). 첫날 배당은 재투자하지 않는다."""
+    close = np.asarray(close, dtype=float)
+    dividends = np.nan_to_num(np.asarray(dividends, dtype=float))
+    factors = 1.0 + dividends * (1.0 - withholding_tax) / close
+    if len(factors):
+        factors[0] = 1.0
+    return factors
+
+
+def _simulate_events(close, dividends, initial_shares, whole_shares, withholding_tax, commission):
+    # 정수 주 매수나 수수료가 있으면 남는 현금이 다음 배당으로 이월되어 누적곱으로 풀 수 없다.
+    # 대신 배당이 있는 날(60년에 수백 번)만 순회하고, 그 사이 날짜는 배열 인덱싱으로 채운다.
+    events = np.flatnonzero(dividends > 0)
+    events = events[events > 0]
+    shares_after = np.empty(len(events))
+    cash_after = np.empty(len(events))
+
+    shares, cash = float(initial_shares), 0.0
+    for k, i in enumerate(events):
+        cash += shares * dividends[i] * (1.0 - withholding_tax)
+        spendable = cash - commission
+        if spendable > 0:
+            bought = spendable / close[i]
+            if whole_shares:
+                bought = np.floor(bought)
+            if bought > 0:
+                shares += bought
+                cash = spendable - bought * close[i]
+        shares_after[k] = shares
+        cash_after[k] = cash
+
+    segment = np.searchsorted(events, np.arange(len(close)), side='right')
+    shares_path = np.r_[float(initial_shares), shares_after][segment]
+    cash_path = np.r_[0.0, cash_after][segment]
+    return shares_path, cash_path
+
+
+@perf.timed('drip.simulate')
+def simulate_drip(close, dividends, initial_shares=1, whole_shares=False, withholding_tax=0.0, commission=0.0):
+    """배당을 받은 날 종가로 재투자했을 때의 보유 주식 수와 평가액.
+
+    close, dividends: 같은 인덱스를 가진 종가 / 배당 Series
+    whole_shares: True 면 정수 주만 사고 남는 돈은 현금으로 들고 간다
+    withholding_tax: 배당 원천징수 세율 (예: 0.15)
+    commission: 재투자 1회당 수수료 (달러)
+
+    반환: 'shares', 'cash', 'value' 컬럼의 DataFrame
+    """
+    index = close.index if isinstance(close, pd.Series) else None
+    close = np.asarray(close, dtype=float)
+    dividends = np.nan_to_num(np.asarray(dividends, dtype=float))
+
+    if whole_shares or commission > 0:
+        shares, cash = _simulate_events(close, dividends, initial_shares, whole_shares, withholding_tax, commission)
+    else:
+        shares = initial_shares * np.cumprod(reinvestment_factors(close, dividends, withholding_tax))
+        cash = np.zeros(len(close))
+
+    return pd.DataFrame({'shares': shares, 'cash': cash, 'value': shares * close + cash}, index=index)
+
+
+class DripIndex:
+    """한 종목 전체 이력의 재투자 누적곱 / 누적 배당 (prefix) 배열.
+
+    구간 [i, j] 의 재투자 결과는 growth[j] / growth[i] 로 바로 나온다 (simulate_drip 과 같이 시작일 배당은 재투자하지 않음).
+    날짜 구간은 price_store.slice_history 와 같은 [start, end) 기준이다.
+    """
+
+    COLUMNS = ['close', 'growth', 'received', 'dividends']
+
+    def __init__(self, frame):
+        self.frame = frame
+        self._dates = local_dates(frame.index)  # 시간대가 붙은 날짜(인덱스에서 꺼낸 값 등)도 현지 날짜 기준으로 비교한다
+        self._close = frame['close'].to_numpy()
+        self._growth = frame['growth'].to_numpy()
+        self._received = frame['received'].to_numpy()
+        self._dividends = frame['dividends'].to_numpy()
+
+    @classmethod
+    def build(cls, close, dividends, withholding_tax=0.0):
+        """종가 / 배당 Series (전체 이력) 로 prefix 배열을 만든다.
+
+        growth   : 1주를 첫날부터 재투자했을 때의 누적 주식 수 G[t]
+        received : 재투자로 늘어난 주식 수 기준 세후 배당 수령액의 누적합 (G[t-1] * d_t * (1 - tax))
+        dividends: 1주당 배당 누적합 (재투자하지 않을 때)
+        """
+        close_values = np.asarray(close, dtype=float)
+        dividend_values = np.nan_to_num(np.asarray(dividends, dtype=float))
+        net = dividend_values * (1.0 - withholding_tax)
+        growth = np.cumprod(1.0 + net / close_values)
+        received = np.cumsum(np.r_[1.0, growth[:-1]] * net) if len(growth) else growth
+        frame = pd.DataFrame({
+            'close': close_values,
+            'growth': growth,
+            'received': received,
+            'dividends': np.cumsum(dividend_values),
+        }, index=close.index)
+        return cls(frame)
+
+    def __len__(self):
+        return len(self.frame)
+
+    def positions(self, start=None, end=None):
+        """[start, end) 에 들어가는 첫 위치와 마지막 위치 (비어 있으면 j < i)."""
+        i = 0 if start is None else int(self._dates.searchsorted(local_timestamp(start), side='left'))
+        j = len(self._dates) - 1 if end is None else int(self._dates.searchsorted(local_timestamp(end), side='left')) - 1
+        return i, j
+
+    def query(self, start=None, end=None, initial_shares=1.0):
+        """구간의 재투자 결과 dict. 배열 몇 개를 읽는 것뿐이라 구간 길이와 상관없이 상수 시간이다.
+
+        shares / value: 종료일 보유 주식 수와 평가액, dividends_received: 재투자한 주식 수 기준 세후 배당 합계,
+        dividends_per_share: 재투자 없이 1주당 받은 배당 합계, price_return / total_return / cagr: 수익률
+        """
+        i, j = self.positions(start, end)
+        if j < i:
+            return None
+        scale = initial_shares / self._growth[i]
+        shares = self._growth[j] * scale
+        value = shares * self._close[j]
+        cost = initial_shares * self._close[i]
+        years = (self._dates[j] - self._dates[i]).days / DAYS_PER_YEAR
+        return {
+            'start': self._dates[i],
+            'end': self._dates[j],
+            'shares': shares,
+            'value': value,
+            'dividends_received': (self._received[j] - self._received[i]) * scale,
+            'dividends_per_share': self._dividends[j] - self._dividends[i],
+            'price_return': self._close[j] / self._close[i] - 1.0,
+            'total_return': value / cost - 1.0,
+            'cagr': (value / cost) ** (1.0 / years) - 1.0 if years > 0 else np.nan,
+        }
+
+    def value_path(self, start=None, end=None, initial_shares=1.0):
+        """구간의 일별 재투자 평가액 Series (simulate_drip(...)['value'] 와 같은 값, 시뮬레이션 없이 잘라서 계산)."""
+        i, j = self.positions(start, end)
+        growth = self._growth[i:j + 1]
+        values = initial_shares * growth / growth[0] * self._close[i:j + 1] if len(growth) else growth
+        return pd.Series(values, index=self.frame.index[i:j + 1], name='value')
+
+    def scan_starts(self, end=None, min_years=1.0):
+        """end 직전 거래일까지 보유했을 때 시작일별 연평균 수익률(재투자 포함) Series - 모든 시작일을 한 번에 계산.
+
+        보유 기간이 min_years 보다 짧은 시작일은 뺀다. 최고/최저 시작일은 idxmax() / idxmin().
+        """
+        _, j = self.positions(None, end)
+        if j < 1:
+            return pd.Series(dtype=float, name='cagr')
+        days = (self._dates[j] - self._dates[:j]).days.to_numpy()
+        years = days / DAYS_PER_YEAR
+        keep = years >= min_years
+        ratio = (self._growth[j] / self._growth[:j][keep]) * (self._close[j] / self._close[:j][keep])
+        return pd.Series(ratio ** (1.0 / years[keep]) - 1.0, index=self.frame.index[:j][keep], name='cagr')
@@ -0,0 +1,136 @@
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, time, timedelta
+
+import pandas as pd
+
+import perf
+from timeutil import MARKET_TZ
+
+# 세션 사이에서 공유하는 프로세스 메모리 캐시
+# 일봉과 배당은 장 마감 후에만 바뀌므로 고정 TTL 대신 다음 장 마감 시각에 만료시키고,
+# 바이트 예산을 넘으면 가장 오래 안 쓴 프레임부터 내보낸다.
+
+MARKET_CLOSE = time(16, 0)
+SETTLE_DELAY = timedelta(minutes=30)  # 장 마감 뒤 공급자에 당일 봉이 올라오기까지 기다리는 시간
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get('SNU_FRAME_CACHE_MB', '512')) * 1024 * 1024)
+
+
+def next_market_close(now=None):
+    """now 이후 처음 오는 평일 장 마감(+정산 지연) 시각.
+
+    공휴일은 따로 고려하지 않는다 - 휴장일에는 한 번 더 갱신할 뿐 데이터가 틀리지는 않는다.
+    """
+    now = (now or datetime.now(tz=MARKET_TZ)).astimezone(MARKET_TZ)
+    candidate = datetime.combine(now.date(), MARKET_CLOSE, tzinfo=MARKET_TZ) + SETTLE_DELAY
+    while candidate <= now or candidate.weekday() >= 5:
+        candidate = datetime.combine(candidate.date() + timedelta(days=1), MARKET_CLOSE, tzinfo=MARKET_TZ) + SETTLE_DELAY
+    return candidate
+
+
+def last_market_close(now=None):
+    """now 이전(같은 시각 포함) 마지막 평일 장 마감(+정산 지연) 시각. 이 시각 뒤에 받은 일봉은 다음 마감까지 그대로다."""
+    now = (now or datetime.now(tz=MARKET_TZ)).astimezone(MARKET_TZ)
+    candidate = datetime.combine(now.date(), MARKET_CLOSE, tzinfo=MARKET_TZ) + SETTLE_DELAY
+    while candidate > now or candidate.weekday() >= 5:
+        candidate = datetime.combine(candidate.date() - timedelta(days=1), MARKET_CLOSE, tzinfo=MARKET_TZ) + SETTLE_DELAY
+    return candidate
+
+
+def frame_nbytes(frame):
+    if isinstance(frame, pd.DataFrame):
+        return int(frame.memory_usage(index=True, deep=True).sum())
+    if isinstance(frame, pd.Series):
+        return int(frame.memory_usage(index=True, deep=True))
+    return 0
+
+
+class FrameCache:
+    """(티커, 조회) 키로 DataFrame/Series 를 보관하는 LRU 캐시.
+
+    돌려주는 프레임은 여러 세션이 같이 보는 객체이므로 읽기 전용으로 다뤄야 한다.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, clock=None):
+        self.max_bytes = max_bytes
+        self._clock = clock or (lambda: datetime.now(tz=MARKET_TZ))
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (frame, nbytes, expires_at)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                perf.count('cache.misses')
+                return None
+            frame, nbytes, expires_at = entry
+            if self._clock() >= expires_at:
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                perf.count('cache.misses')
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            perf.count('cache.hits')
+            return frame
+
+    def put(self, key, frame, expires_at=None):
+        nbytes = frame_nbytes(frame)
+        expires_at = expires_at or next_market_close(self._clock())
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if nbytes > self.max_bytes:
+                return frame  # 예산보다 큰 프레임은 보관하지 않는다
+            self._entries[key] = (frame, nbytes, expires_at)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+        return frame
+
+    def get_or_load(self, key, loader):
+        frame = self.get(key)
+        if frame is None:
+            frame = self.put(key, loader())
+        return frame
+
+    def invalidate(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self._bytes -= nbytes
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+
+# 앱 전체가 같이 쓰는 캐시
+shared_cache = FrameCache()
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import numpy as np
+
+import perf
+from singleflight import SingleFlight
+
+# 로고 이미지 관리
+# - 원본은 내용 해시(sha256) 이름으로 캐시 폴더에 한 번만 저장하고, 크기별 썸네일도 미리 만들어 둔다
+# - 디코딩한 RGBA 배열은 프로세스 메모리에 올려 두고 모든 세션이 같이 쓴다
+# - 다운로드는 제한 시간을 두고 여러 개를 동시에 받으며, 실패하면 자리표시 이미지를 돌려준다
+# - requests / PIL 은 실제로 파일을 받거나 읽을 때 가져온다 (메모리에 있는 로고만 쓰는 재실행은 import 비용이 없다)
+
+LOGO_CACHE_DIR = os.environ.get('SNU_LOGO_CACHE', '.logo_cache')
+THUMB_SIZE = (40, 40)
+REQUEST_TIMEOUT = 5  # 초
+RETRY_AFTER = 600  # 실패한 로고를 다시 시도하기까지 기다리는 시간 (초)
+OFFLINE_ENV = 'SNU_LOGO_OFFLINE'  # 1 이면 네트워크로 받지 않고 디스크에 있는 로고만 쓴다 (replay 공급자와 함께 오프라인 측정용)
+
+
+def placeholder(size=THUMB_SIZE):
+    """다운로드에 실패했을 때 쓰는 회색 원."""
+    h, w = size[1], size[0]
+    yy, xx = np.mgrid[:h, :w]
+    inside = (xx - (w - 1) / 2) ** 2 + (yy - (h - 1) / 2) ** 2 <= (min(w, h) / 2) ** 2
+    image = np.zeros((h, w, 4), dtype=np.uint8)
+    image[inside] = (200, 200, 200, 255)
+    return image
+
+
+_lock = threading.Lock()
+_memory = {}  # (url, size, fit) -> (RGBA 배열, 실패한 경우 다시 시도할 시각 또는 None)
+_prefetched = set()  # prefetch_once 로 이미 받은 (url 목록, size)
+_flight = SingleFlight()
+
+
+def _index_path():
+    return os.path.join(LOGO_CACHE_DIR, 'index.json')
+
+
+def _read_index():
+    try:
+        with open(_index_path(), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _remember_digest(url, digest):
+    with _lock:
+        index = _read_index()
+        index[url] = digest
+        tmp_path = f'{_index_path()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, _index_path())
+
+
+def _thumbnail_path(digest, size, fit=False):
+    return os.path.join(LOGO_CACHE_DIR, f"{digest}_{size[0]}x{size[1]}{'_fit' if fit else ''}.png")
+
+
+def _download(url, timeout):
+    if os.environ.get(OFFLINE_ENV) == '1':
+        raise ConnectionError(f'오프라인 모드라 로고를 받지 않음: {url}')
+    import requests
+    from PIL import Image
+
+    with perf.span('logos.download', 'fetch', url=url):
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+        content = response.content
+    perf.count('logos.downloads')
+    perf.count('logos.bytes', len(content))
+    digest = hashlib.sha256(content).hexdigest()
+    os.makedirs(LOGO_CACHE_DIR, exist_ok=True)
+    original_path = os.path.join(LOGO_CACHE_DIR, f'{digest}.png')
+    if not os.path.exists(original_path):
+        Image.open(BytesIO(content)).save(original_path)
+    _remember_digest(url, digest)
+    return digest
+
+
+def _load(url, size, timeout, fit=False):
+    from PIL import Image
+
+    digest = _read_index().get(url)
+    if digest is None or not os.path.exists(os.path.join(LOGO_CACHE_DIR, f'{digest}.png')):
+        digest = _download(url, timeout)
+
+    thumb_path = _thumbnail_path(digest, size, fit)
+    if not os.path.exists(thumb_path):
+        with Image.open(os.path.join(LOGO_CACHE_DIR, f'{digest}.png')) as original:
+            thumb = original.convert('RGBA')
+            if fit:
+                thumb.thumbnail(size)  # 비율을 지키며 size 상자 안에 맞춘다 (키우지는 않음)
+            else:
+                thumb = thumb.resize(size)
+            thumb.save(thumb_path)
+    with Image.open(thumb_path) as thumb:
+        return np.asarray(thumb.convert('RGBA'))
+
+
+def get_logo(url, size=THUMB_SIZE, timeout=REQUEST_TIMEOUT, fit=False):
+    """url 로고의 size 크기 RGBA 배열. 메모리 -> 썸네일 파일 -> 네트워크 순으로 찾는다.
+
+    fit=True 면 size 를 상자로 보고 원본 비율을 지킨 채 그 안에 맞춘다 (한 변이 size 보다 작을 수 있다).
+    """
+    key = (url, tuple(size), fit)
+    with _lock:
+        entry = _memory.get(key)
+    if entry is not None and (entry[1] is None or entry[1] > time.time()):
+        return entry[0]
+
+    try:
+        image = _flight.do(key, _load, url, tuple(size), timeout, fit)
+        retry_at = None
+    except Exception:
+        image = placeholder(size)
+        retry_at = time.time() + RETRY_AFTER
+    image.setflags(write=False)  # 세션끼리 공유하므로 읽기 전용
+    with _lock:
+        _memory[key] = (image, retry_at)
+    return image
+
+
+def is_placeholder(image):
+    return np.array_equal(image, placeholder((image.shape[1], image.shape[0])))
+
+
+def prefetch(urls, size=THUMB_SIZE, max_workers=8, timeout=REQUEST_TIMEOUT):
+    """여러 로고를 제한된 스레드 풀에서 동시에 받아 메모리/디스크 캐시를 채운다."""
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+        images = pool.map(perf.bind(lambda url: get_logo(url, size, timeout)), urls)
+        return dict(zip(urls, images))
+
+
+def prefetch_once(urls, size=THUMB_SIZE, **kwargs):
+    """같은 (urls, size) 의 prefetch 를 프로세스에서 한 번만 한다 (페이지 재실행마다 불러도 된다). 처음 부른 경우 True.
+
+    실패한 로고는 get_logo 가 RETRY_AFTER 뒤에 다시 받으므로 여기서는 다시 시도하지 않는다.
+    """
+    key = (tuple(dict.fromkeys(urls)), tuple(size))
+    with _lock:
+        if key in _prefetched:
+            return False
+        _prefetched.add(key)
+    prefetch(key[0], size=size, **kwargs)
+    return True
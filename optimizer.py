@@ -0,0 +1,173 @@
+import csv
+import os
+from collections import Counter, namedtuple
+
+import numpy as np
+
+import dividend_index
+from dividend_index import mask_months
+from dividend_universe import STOCK_CSVS, universe_tickers
+
+# 배당킹/배당귀족 중에서 12개월 모두 배당이 나오고 월 소득이 가장 고른 조합 찾기
+# 종목마다 최근 12개월 배당 지급 월을 12비트 마스크(1월 = 1 << 0, dividend_index 와 같은 형식)로 두고, 지급 월이 같은 종목끼리 묶어
+# "묶음마다 몇 종목씩" 만 나열한다. 커버 여부는 마스크 OR 로, 가지치기는 남은 묶음 마스크의 OR 로 본다.
+
+FULL_YEAR = (1 << 12) - 1
+
+Candidate = namedtuple('Candidate', ['ticker', 'mask', 'dividend_yield', 'price', 'sector'])
+
+
+def read_sectors(paths=STOCK_CSVS):
+    """종목 CSV 들의 티커 -> 섹터. 여러 파일에 있으면 앞 파일의 값을 쓴다."""
+    sectors = {}
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                ticker = (row.get('ticker') or row.get('Ticker') or '').strip().upper()
+                sector = (row.get('Sector') or '').strip()
+                if ticker and sector:
+                    sectors.setdefault(ticker, sector)
+    return sectors
+
+
+def load_candidates(tickers=None, sectors=None):
+    """티커(기본: 배당킹/귀족 41종목)의 지급 월 마스크, 배당수익률, 현재가 -> (후보 목록, {티커: 제외 이유}).
+
+    배당 색인(dividend_index)의 값을 쓰고, 색인에 없는 티커만 시세를 읽어 색인에 더한다.
+    섹터를 모르는 종목(종목 CSV 어디에도 섹터가 없는 종목)은 sector=None 으로 두고 섹터 상한을 적용하지 않는다.
+    """
+    tickers = universe_tickers() if tickers is None else [ticker.upper() for ticker in tickers]
+    index = dividend_index.get_index()
+    errors = {}
+    missing = [ticker for ticker in tickers if ticker not in index]
+    if missing:
+        errors = dividend_index.update_index(missing)['errors']
+        index = dividend_index.get_index()
+    candidates, skipped = candidates_from_index(index, [ticker for ticker in tickers if ticker in index],
+                                                read_sectors() if sectors is None else sectors)
+    errors.update(skipped)
+    return candidates, errors
+
+
+def candidates_from_index(index, tickers, sectors):
+    """배당 색인의 티커들 -> (후보 목록, {티커: 제외 이유})."""
+    candidates, errors = [], {}
+    for ticker in tickers:
+        row = index.row(ticker)
+        if not row['mask'] or row['ttm_dividend'] <= 0 or row['last_close'] <= 0:
+            errors[ticker] = '최근 12개월 배당 없음'
+            continue
+        candidates.append(Candidate(ticker, int(row['mask']), row['ttm_dividend'] / row['last_close'], row['last_close'], sectors.get(ticker)))
+    return candidates, errors
+
+
+def mask_bits(masks):
+    """마스크 목록 -> (마스크 x 12) 0/1 배열."""
+    return (np.asarray(masks, dtype=np.int64)[:, None] >> np.arange(12)) & 1
+
+
+def smoothness(month_counts):
+    """달별 배당 횟수 (... x 12) 의 변동계수 (0 이면 매달 같은 금액)."""
+    month_counts = np.asarray(month_counts, dtype=float)
+    return month_counts.std(axis=-1) / month_counts.mean(axis=-1)
+
+
+def count_vectors(masks, sizes, max_names):
+    """12개월을 모두 덮는 (묶음별 종목 수) 조합 전체 -> (조합 x 묶음) 배열.
+
+    묶음을 하나씩 붙이며 가능한 종목 수를 펼치고, 그때마다 종목 수 합계가 max_names 를 넘거나
+    지금까지 덮은 달 | 남은 묶음 마스크의 OR 로도 12개월이 안 되는 조합은 바로 버린다.
+    """
+    remaining = [0] * (len(masks) + 1)
+    for i in range(len(masks) - 1, -1, -1):
+        remaining[i] = remaining[i + 1] | masks[i]
+
+    if remaining[0] != FULL_YEAR:
+        return np.zeros((0, len(masks)), dtype=np.int64)
+    counts = np.zeros((1, 0), dtype=np.int64)
+    used = np.zeros(1, dtype=np.int64)
+    covered = np.zeros(1, dtype=np.int64)
+    for i, (mask, size) in enumerate(zip(masks, sizes)):
+        options = np.arange(min(size, max_names) + 1)
+        count = np.tile(options, len(counts))
+        counts = np.column_stack([np.repeat(counts, len(options), axis=0), count])
+        used = np.repeat(used, len(options)) + count
+        covered = np.repeat(covered, len(options)) | np.where(count > 0, mask, 0)
+        keep = (used <= max_names) & ((covered | remaining[i + 1]) == FULL_YEAR)
+        counts, used, covered = counts[keep], used[keep], covered[keep]
+    return counts
+
+
+def _pick(groups, counts, max_per_sector):
+    # 묶음마다 배당수익률이 높은 종목부터 고르되 섹터 상한을 넘지 않게 한다 (여유가 적은 묶음부터)
+    order = sorted((i for i, count in enumerate(counts) if count), key=lambda i: len(groups[i]) - counts[i])
+    per_sector = Counter()
+    picks = []
+    for i in order:
+        chosen = []
+        for candidate in groups[i]:
+            if len(chosen) == counts[i]:
+                break
+            if max_per_sector is not None and candidate.sector is not None and per_sector[candidate.sector] >= max_per_sector:
+                continue
+            chosen.append(candidate)
+            per_sector[candidate.sector] += 1
+        if len(chosen) < counts[i]:
+            return None
+        picks.extend(chosen)
+    return picks
+
+
+def allocate(picks, capital):
+    """배당 1회당 받는 금액이 모든 종목에서 같도록 자본을 나눈다 -> 결과 dict.
+
+    종목 i 의 연 배당 = 금액_i x 수익률_i = 1회 금액 x 지급 횟수_i 이므로 금액_i 는 지급 횟수_i / 수익률_i 에 비례한다.
+    이렇게 하면 달마다 받는 소득은 그 달에 배당을 주는 종목 수에 비례한다.
+    """
+    payments = [bin(candidate.mask).count('1') for candidate in picks]
+    per_payment = capital / sum(count / candidate.dividend_yield for count, candidate in zip(payments, picks))
+    month_counts = mask_bits([candidate.mask for candidate in picks]).sum(axis=0)
+    annual_income = per_payment * sum(payments)
+    return {
+        'tickers': [candidate.ticker for candidate in picks],
+        'allocations': {candidate.ticker: per_payment * count / candidate.dividend_yield for count, candidate in zip(payments, picks)},
+        'months': {candidate.ticker: mask_months(candidate.mask) for candidate in picks},
+        'monthly_income': (per_payment * month_counts).tolist(),
+        'annual_income': annual_income,
+        'dividend_yield': annual_income / capital,
+        'smoothness': float(smoothness(month_counts)),
+    }
+
+
+def optimize(candidates, capital, max_names=8, max_per_sector=None, min_yield=0.0, limit=5):
+    """12개월을 모두 덮는 조합 중 월 소득이 가장 고른 순(같으면 배당수익률 높은 순)으로 limit 개.
+
+    max_names: 최대 종목 수, max_per_sector: 섹터당 최대 종목 수 (None 이면 제한 없음), min_yield: 종목별 최소 배당수익률
+    """
+    groups = {}
+    for candidate in sorted(candidates, key=lambda candidate: -candidate.dividend_yield):
+        if candidate.mask and candidate.dividend_yield >= min_yield:
+            groups.setdefault(candidate.mask, []).append(candidate)
+    masks = list(groups)
+    groups = [groups[mask] for mask in masks]
+
+    if not masks:
+        return []
+
+    # 고른 정도는 묶음별 종목 수만으로 정해지므로 종목을 고르기 전에 모든 조합을 한 번에 줄 세운다
+    counts = count_vectors(masks, [len(group) for group in groups], max_names)
+    scores = smoothness(counts @ mask_bits(masks))
+    order = np.argsort(scores, kind='stable')
+
+    results = []
+    for row in order:
+        # 같은 고른 정도의 조합은 끝까지 보고 멈춘다 (그 안에서는 배당수익률로 줄 세운다)
+        if len(results) >= limit and scores[row] > results[-1]['smoothness'] + 1e-9:
+            break
+        picks = _pick(groups, counts[row], max_per_sector)
+        if picks is not None:
+            results.append(allocate(picks, capital))
+    results.sort(key=lambda result: (round(result['smoothness'], 9), -result['dividend_yield']))
+    return results[:limit]
@@ -0,0 +1,151 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+
+# 재실행(rerun) 한 번 동안의 시간 구간(span)과 카운터를 모으는 가벼운 계측
+# - 시세 조회, 계산, 차트 렌더링을 이름 붙은 span 으로 감싸고, 공급자 호출 수 / 캐시 적중 / 바이트 수를 센다
+# - 현재 스레드에 활성화된 Trace 가 없으면 아무 것도 기록하지 않는다 (스레드 로컬 조회 한 번)
+# - Chrome trace(chrome://tracing, Perfetto) 형식 JSON 으로 내보낼 수 있다
+# Streamlit 에 의존하지 않는다. 사이드바 패널은 perf_panel.py.
+
+TRACE_DIR_ENV = 'SNU_PERF_DIR'  # 지정하면 계측한 재실행마다 Chrome trace 파일을 이 폴더에 남긴다
+
+_local = threading.local()
+
+
+class Trace:
+    """한 번의 재실행에서 기록한 span 과 카운터."""
+
+    def __init__(self, name='rerun'):
+        self.name = name
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        self.spans = []  # (이름, 분류, 시작 초, 길이 초, 스레드 id, 깊이, args)
+        self.counters = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def add_span(self, name, category, start, duration, depth=0, args=None):
+        with self._lock:
+            self.spans.append((name, category, start - self.start, duration, threading.get_ident(), depth, args or {}))
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def summary(self):
+        """span 이름별 호출 수 / 합계 / 최대 (ms), 합계가 큰 순서. 겹쳐 있는 span 은 각각 센다."""
+        rows = {}
+        for name, category, _, duration, _, _, _ in self.spans:
+            row = rows.setdefault(name, {'span': name, 'category': category, 'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            row['calls'] += 1
+            row['total_ms'] += duration * 1000
+            row['max_ms'] = max(row['max_ms'], duration * 1000)
+        return sorted(rows.values(), key=lambda row: row['total_ms'], reverse=True)
+
+    def category_totals(self):
+        """분류별 합계 (ms). 바깥쪽(깊이 0) span 만 더해 중첩된 시간을 두 번 세지 않는다."""
+        totals = defaultdict(float)
+        for _, category, _, duration, _, depth, _ in self.spans:
+            if depth == 0:
+                totals[category] += duration * 1000
+        return dict(totals)
+
+    def to_chrome_trace(self):
+        """Chrome trace 이벤트 형식 dict (시간 단위 us)."""
+        pid = os.getpid()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': self.name}}]
+        for name, category, start, duration, tid, _, args in self.spans:
+            events.append({
+                'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': tid,
+                'ts': round(start * 1e6, 1), 'dur': round(duration * 1e6, 1),
+                'args': {key: str(value) for key, value in args.items()},
+            })
+        end = round(self.elapsed() * 1e6, 1)
+        for name, value in sorted(self.counters.items()):
+            events.append({'name': name, 'ph': 'C', 'pid': pid, 'ts': end, 'args': {name: value}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': {'wall_start': self.wall_start}}
+
+    def dump(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
+
+
+def current():
+    """현재 스레드에 활성화된 Trace (없으면 None)."""
+    return getattr(_local, 'trace', None)
+
+
+@contextmanager
+def activate(trace, depth=0):
+    """with 블록 동안 현재 스레드의 기록 대상을 trace 로 바꾼다."""
+    previous, previous_depth = current(), getattr(_local, 'depth', 0)
+    _local.trace, _local.depth = trace, depth
+    try:
+        yield trace
+    finally:
+        _local.trace, _local.depth = previous, previous_depth
+
+
+@contextmanager
+def span(name, category='compute', **args):
+    """이름 붙은 시간 구간. category 는 'fetch' / 'compute' / 'render' 처럼 나눠 쓴다."""
+    trace = current()
+    if trace is None:
+        yield
+        return
+    depth = getattr(_local, 'depth', 0)
+    _local.depth = depth + 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _local.depth = depth
+        trace.add_span(name, category, start, time.perf_counter() - start, depth, args)
+
+
+def timed(name, category='compute'):
+    """함수 전체를 span 으로 감싸는 데코레이터."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name, category):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, value=1):
+    trace = current()
+    if trace is not None:
+        trace.count(name, value)
+
+
+def bind(fn):
+    """스레드 풀에 넘길 함수가 호출한 스레드의 Trace 에 (호출한 span 안쪽 깊이로) 기록하도록 묶는다."""
+    trace = current()
+    if trace is None:
+        return fn
+    depth = getattr(_local, 'depth', 0)
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with activate(trace, depth):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def save_trace(trace, directory=None):
+    """SNU_PERF_DIR(또는 directory) 이 있으면 trace 를 파일로 남기고 경로를 돌려준다."""
+    directory = directory or os.environ.get(TRACE_DIR_ENV)
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    return trace.dump(os.path.join(directory, f'{trace.name}-{int(trace.wall_start * 1000)}-{threading.get_ident()}.json'))
@@ -0,0 +1,57 @@
+import json
+import os
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+import perf
+from frame_cache import shared_cache
+
+# 사이드바 성능 패널 (선택해서 켠다)
+#   SNU_PERF_PANEL=1 streamlit run app_2.py   또는   주소 뒤에 ?perf=1
+# 켜져 있을 때만 재실행마다 perf.Trace 를 활성화하고, 페이지 실행이 끝난 뒤 사이드바에 구간별 시간을 보여 준다.
+
+PANEL_ENV = 'SNU_PERF_PANEL'
+
+
+def enabled():
+    return os.environ.get(PANEL_ENV) == '1' or st.query_params.get('perf') == '1'
+
+
+@contextmanager
+def traced_rerun(name='rerun'):
+    """with 블록(페이지 실행)을 계측하고 끝나면 패널을 그린다. st.rerun / st.stop 으로 끊기면 그리지 않는다."""
+    if not enabled():
+        yield None
+        return
+    trace = perf.Trace(name)
+    with perf.activate(trace):
+        yield trace
+    perf.save_trace(trace)
+    render(trace)
+
+
+def render(trace):
+    with st.sidebar.expander('성능 (이번 재실행)', expanded=True):
+        st.metric('재실행 시간', f'{trace.elapsed() * 1000:.0f} ms')
+        totals = trace.category_totals()
+        if totals:
+            st.caption(' / '.join(f'{category} {ms:.0f} ms' for category, ms in sorted(totals.items(), key=lambda item: -item[1])))
+
+        summary = trace.summary()
+        if summary:
+            st.dataframe(pd.DataFrame(summary).round(1), hide_index=True, use_container_width=True)
+
+        counters = dict(trace.counters)
+        stats = shared_cache.stats()
+        counters['shared_cache.entries'] = stats['entries']
+        counters['shared_cache.mb'] = round(stats['bytes'] / 1024 / 1024, 1)
+        st.dataframe(pd.Series(counters, name='value').rename_axis('counter').reset_index(), hide_index=True, use_container_width=True)
+
+        st.download_button(
+            'Chrome trace 내려받기',
+            json.dumps(trace.to_chrome_trace()),
+            file_name=f'{trace.name}-{int(trace.wall_start)}.json',
+            mime='application/json',
+        )
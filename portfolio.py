@@ -0,0 +1,74 @@
+import sys
+
+import numpy as np
+
+import price_store
+
+# 세션에 저장하는 포트폴리오
+# 종목마다 배당 Series 복사본을 들고 있지 않고 (티커 번호, 주식 수, 매수 금액) 한 줄(20바이트)만 배열에 쌓는다.
+# 배당 이력은 필요할 때 공유 캐시(price_store.load_dividends)에서 읽어 온다.
+
+HOLDING_DTYPE = np.dtype([('ticker_id', '<i4'), ('shares', '<f8'), ('cost', '<f8')])
+
+
+class Portfolio:
+    __slots__ = ('_symbols', '_records', 'version')
+
+    def __init__(self):
+        self._symbols = []  # 티커 문자열 (sys.intern 으로 세션끼리 같은 객체 공유)
+        self._records = np.empty(0, dtype=HOLDING_DTYPE)
+        self.version = 0  # 보유 내역이 바뀔 때마다 증가 -> 집계 결과 메모이제이션 키로 쓴다
+
+    def __len__(self):
+        return len(self._records)
+
+    def __bool__(self):
+        return len(self._records) > 0
+
+    def __iter__(self):
+        """(티커, 주식 수, 매수 금액) 튜플을 매수한 순서대로 돌려준다."""
+        for ticker_id, shares, cost in self._records.tolist():
+            yield self._symbols[ticker_id], shares, cost
+
+    def _ticker_id(self, ticker):
+        ticker = sys.intern(ticker.upper())
+        try:
+            return self._symbols.index(ticker)
+        except ValueError:
+            self._symbols.append(ticker)
+            return len(self._symbols) - 1
+
+    def add(self, ticker, shares, cost):
+        record = np.array([(self._ticker_id(ticker), shares, cost)], dtype=HOLDING_DTYPE)
+        self._records = np.concatenate([self._records, record])
+        self.version += 1
+
+    def remove(self, ticker):
+        """티커의 보유 내역을 모두 지우고, 돌려받을 매수 금액 합계를 반환한다."""
+        ticker = ticker.upper()
+        if ticker not in self._symbols:
+            return 0.0
+        mask = self._records['ticker_id'] == self._symbols.index(ticker)
+        freed = float(self._records['cost'][mask].sum())
+        self._records = self._records[~mask]
+        self.version += 1
+        return freed
+
+    @property
+    def tickers(self):
+        return [self._symbols[ticker_id] for ticker_id in self._records['ticker_id']]
+
+    @property
+    def shares(self):
+        return self._records['shares']
+
+    @property
+    def total_investment(self):
+        return float(self._records['cost'].sum())
+
+    def dividend_streams(self):
+        """종목별 (티커, 보유 주식 수를 곱한 배당 Series) - 공유 캐시에서 그때그때 계산한다."""
+        return [(ticker, price_store.load_dividends(ticker) * shares) for ticker, shares, _ in self]
+
+    def nbytes(self):
+        return self._records.nbytes + sys.getsizeof(self._symbols)
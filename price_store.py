@@ -0,0 +1,177 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import perf
+from data_provider import get_provider
+from drip import DripIndex
+from frame_cache import last_market_close, shared_cache
+from singleflight import SingleFlight
+from timeutil import local_dates
+
+# 티커별 전체 시세(OHLC + 배당 + 분할)를 로컬 Parquet 파일로 보관하는 저장소
+STORE_DIR = os.environ.get('SNU_PRICE_STORE', '.price_store')
+
+HISTORY_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits']
+
+# 같은 티커를 여러 세션이 동시에 열 때 저장소 갱신(네트워크 + 파일 쓰기)을 한 번만 하도록 묶는다
+_flight = SingleFlight()
+
+
+def store_path(ticker):
+    return os.path.join(STORE_DIR, f'{ticker.upper()}.parquet')
+
+
+def _normalize(frame):
+    # 저장 형식을 일정하게 맞춘다 (컬럼 순서, 정렬, 중복 날짜 제거)
+    frame = frame.reindex(columns=HISTORY_COLUMNS)
+    frame[['Dividends', 'Stock Splits']] = frame[['Dividends', 'Stock Splits']].fillna(0.0)
+    frame = frame[~frame.index.duplicated(keep='last')].sort_index()
+    frame.index.name = 'Date'
+    return frame
+
+
+def read_history(ticker):
+    """저장된 시세를 읽는다. 파일이 없으면 None."""
+    path = store_path(ticker)
+    if not os.path.exists(path):
+        return None
+    with perf.span('price_store.read_parquet', 'fetch', ticker=ticker):
+        perf.count('store.bytes_read', os.path.getsize(path))
+        return pd.read_parquet(path)
+
+
+def write_history(ticker, frame):
+    os.makedirs(STORE_DIR, exist_ok=True)
+    path = store_path(ticker)
+    # 서버/warm-up/배치 리포트가 같은 티커를 동시에 쓸 수 있으므로 쓰는 쪽마다 다른 임시 파일을 쓴다
+    fd, tmp_path = tempfile.mkstemp(dir=STORE_DIR, prefix=f'{ticker.upper()}.', suffix='.tmp')
+    os.close(fd)
+    with perf.span('price_store.write_parquet', 'fetch', ticker=ticker):
+        try:
+            frame.to_parquet(tmp_path)
+            os.replace(tmp_path, path)  # 쓰는 도중 다른 세션이 깨진 파일을 읽지 않도록 교체
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        perf.count('store.bytes_written', os.path.getsize(path))
+
+
+def _is_fresh(ticker):
+    # 마지막 장 마감(+정산 지연) 뒤에 저장(확인)한 파일이면 네트워크를 타지 않고 로컬 파일만 읽는다.
+    # 공유 캐시도 같은 시각에 만료되므로, 캐시가 만료된 뒤에는 마감 전에 받은 봉을 다시 돌려주지 않는다.
+    return os.path.getmtime(store_path(ticker)) >= last_market_close().timestamp()
+
+
+def _fetch_full(ticker):
+    return get_provider().history(ticker, period='max')
+
+
+def _fetch_since(ticker, last_date):
+    # 마지막 저장 봉도 다시 받는다 (장중에 저장된 미완성 봉을 확정 봉으로 바꾸기 위해)
+    return get_provider().history(ticker, start=last_date.date())
+
+
+def load_history(ticker):
+    """티커의 전체 기간 시세를 돌려준다.
+
+    저장소에 있으면 마지막 저장일부터의 봉만 받아 덮어쓰거나 뒤에 붙이고, 없으면 전체를 받아 저장한다.
+    한 번 읽은 프레임은 다음 장 마감까지 공유 메모리 캐시에서 바로 돌려준다 (읽기 전용).
+    """
+    ticker = ticker.upper()
+    with perf.span('price_store.load_history', 'fetch', ticker=ticker):
+        return shared_cache.get_or_load((ticker, 'history'), lambda: _flight.do(ticker, _load_history, ticker))
+
+
+def _load_history(ticker):
+    stored = read_history(ticker)
+
+    if stored is None or stored.empty:
+        full = _normalize(_fetch_full(ticker))
+        if full.empty:
+            return full
+        write_history(ticker, full)
+        return full
+
+    if _is_fresh(ticker):
+        return stored
+
+    delta = _fetch_since(ticker, stored.index[-1])
+    if not delta.empty:
+        delta = _normalize(delta)
+        delta = delta[delta.index >= stored.index[-1]]
+
+    if delta.empty or (delta.index[-1] == stored.index[-1] and delta.equals(stored.iloc[-1:])):
+        os.utime(store_path(ticker))  # 바뀐 것이 없으면 파일을 다시 쓰지 않고 갱신 시각만 남긴다
+        return stored
+
+    # 새로 생긴 배당/분할 (마지막 저장 봉에 이미 있던 것은 빼고 본다)
+    events = delta[['Dividends', 'Stock Splits']]
+    known = stored[['Dividends', 'Stock Splits']].reindex(events.index, fill_value=0.0)
+    if ((events > 0) & (events != known)).any().any():
+        # 새 배당/분할이 생기면 과거 수정주가가 모두 바뀌므로 전체를 다시 받는다
+        full = _normalize(_fetch_full(ticker))
+        write_history(ticker, full)
+        return full
+
+    merged = _normalize(pd.concat([stored, delta]))  # 같은 날짜는 새로 받은 봉이 남는다 (keep='last')
+    write_history(ticker, merged)
+    return merged
+
+
+def load_histories(tickers, max_workers=8):
+    """여러 티커의 전체 시세를 제한된 스레드 풀에서 동시에 불러온다.
+
+    반환: (histories, errors) - 성공한 티커의 시세(입력 순서 유지)와 실패했거나 시세가 비어 있는 티커의 오류 메시지.
+    """
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    histories, errors = {}, {}
+    if not tickers:
+        return histories, errors
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as pool:
+        futures = {ticker: pool.submit(perf.bind(load_history), ticker) for ticker in tickers}
+        for ticker, future in futures.items():
+            try:
+                history = future.result()
+            except Exception as e:
+                errors[ticker] = str(e)
+                continue
+            if history.empty:
+                errors[ticker] = '시세 데이터 없음'
+            else:
+                histories[ticker] = history
+    return histories, errors
+
+
+def dividend_events(history):
+    """시세에서 배당 이벤트만 뽑는다 (yf.Ticker(...).dividends 와 같은 모양)."""
+    dividends = history['Dividends']
+    return dividends[dividends > 0]
+
+
+def load_dividends(ticker):
+    """티커의 배당 이벤트 (공유 캐시, 읽기 전용)."""
+    ticker = ticker.upper()
+    return shared_cache.get_or_load((ticker, 'dividends'), lambda: dividend_events(load_history(ticker)))
+
+
+def load_drip_index(ticker):
+    """티커 전체 이력의 DRIP prefix 배열 (공유 캐시, 읽기 전용). 날짜 구간을 바꿔도 다시 시뮬레이션하지 않는다."""
+    ticker = ticker.upper()
+    frame = shared_cache.get_or_load((ticker, 'drip_index'), lambda: _build_drip_index(ticker))
+    return DripIndex(frame)
+
+
+def _build_drip_index(ticker):
+    history = load_history(ticker)
+    return DripIndex.build(history['Close'], history['Dividends']).frame
+
+
+def slice_history(history, start=None, end=None):
+    """메모리에 있는 전체 시세에서 [start, end) 구간만 잘라낸다 (history(start=, end=) 재요청 대신)."""
+    index = local_dates(history.index)
+    lo = 0 if start is None else index.searchsorted(pd.Timestamp(start), side='left')
+    hi = len(index) if end is None else index.searchsorted(pd.Timestamp(end), side='left')
+    return history.iloc[lo:hi]
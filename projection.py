@@ -0,0 +1,164 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import perf
+import price_store
+from backtest import align_histories
+
+# 포트폴리오 배당 소득 몬테카를로 전망
+# 보유 종목의 과거 12개월 구간을 통째로 부트스트랩해서 (그 구간의 월 수익률과 배당 성장률을 모든 종목에 함께 써서
+# 종목 간 상관과 주가/배당의 관계를 유지) (경로 x 월 x 종목) 배열로 앞으로의 월 배당 소득과 평가액을 한 번에 계산한다.
+
+PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_CHUNK = 100  # 한 번에 계산할 경로 수 (월 x 경로 x 종목 float32 배열 몇 개가 캐시에 들어갈 만큼)
+
+
+class ProjectionInputs:
+    """부트스트랩 재료.
+
+    기준일에서 거꾸로 자른 12개월 구간마다 월 수익률 (구간 x 12 x 종목) 과 직전 구간 대비 배당 성장률 (구간 x 종목),
+    마지막 12개월의 월별 주당 배당 (12 x 종목), 현재가 (종목). 월 순서는 모두 기준일 다음 달부터 센다.
+    """
+
+    def __init__(self, tickers, returns, dividend_growth, monthly_dividends, prices, as_of):
+        self.tickers = tickers
+        self.returns = returns
+        self.dividend_growth = dividend_growth
+        self.monthly_dividends = monthly_dividends
+        self.prices = prices
+        self.as_of = as_of
+
+    @classmethod
+    def from_histories(cls, histories, lookback_years=None):
+        """{티커: 일봉} 에서 재료를 만든다. 모든 종목에 가격이 있는 기간(lookback_years 가 있으면 최근 그만큼)만 쓴다."""
+        index, close, dividends = align_histories(histories)
+        if lookback_years is not None:
+            index, close, dividends = _tail_years(index, close, dividends, lookback_years)
+
+        # 월말 종가와 월별 배당 합계 (마지막 달은 기준일까지)
+        month = (index.year * 12 + index.month).to_numpy()
+        month_end = np.flatnonzero(np.r_[month[1:] != month[:-1], True])
+        month_close = close[month_end]
+        month_dividends = np.add.reduceat(dividends, np.r_[0, month_end[:-1] + 1], axis=0)
+
+        # 기준일에서 거꾸로 12개월씩 자른 구간. 첫 구간은 배당 성장률을 잴 직전 구간이 없어 재료에서 뺀다
+        n_windows, n_holdings = (len(month_close) - 1) // 12, close.shape[1]
+        returns = (month_close[1:] / month_close[:-1] - 1)[len(month_close) - 1 - 12 * n_windows:]
+        returns = returns.reshape(n_windows, 12, n_holdings)
+        yearly = month_dividends[len(month_close) - 12 * n_windows:].reshape(n_windows, 12, n_holdings).sum(axis=1)
+        # 앞뒤 구간 중 하나라도 배당이 없으면 성장률 0 으로 본다
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = np.where((yearly[1:] > 0) & (yearly[:-1] > 0), yearly[1:] / yearly[:-1] - 1, 0.0)
+
+        return cls(list(histories), returns[1:], growth, month_dividends[-12:], close[-1], index[-1])
+
+
+def _tail_years(index, close, dividends, years):
+    lo = index.searchsorted(index[-1] - pd.DateOffset(years=years), side='left')
+    return index[lo:], close[lo:], dividends[lo:]
+
+
+def _cumprod_months(values):
+    """(월, ...) 배열의 월 방향 누적곱을 제자리에서. 한 달씩 (경로 x 종목) 면을 곱하는 편이 np.cumprod(axis=0) 보다 훨씬 빠르다."""
+    for month in range(1, len(values)):
+        np.multiply(values[month - 1], values[month], out=values[month])
+    return values
+
+
+def _simulate_chunk(inputs, shares, n_paths, years, reinvest, seed):
+    """경로 n_paths 개의 월 배당 소득과 월말 평가액 -> ((경로 x 월), (경로 x 월)).
+
+    큰 배열은 (월, 경로, 종목) 순서로 두어 월 방향 누적곱이 연속된 (경로 x 종목) 면 단위로 돌게 하고,
+    메모리 대역폭이 병목이라 float32 와 제자리(out=) 연산을 쓴다.
+    """
+    rng = np.random.default_rng(seed)
+    weights = (shares * inputs.prices).astype(np.float32)  # 종목별 현재 평가액
+
+    # 전망 연도마다 과거 12개월 구간 하나를 뽑는다 (첫 해 배당은 최근 12개월 그대로)
+    picks = rng.integers(0, len(inputs.returns), size=(years, n_paths))
+    gross = 1.0 + inputs.returns.astype(np.float32)
+    price = gross[picks[:, None, :], np.arange(12)[None, :, None]].reshape(years * 12, n_paths, -1)
+    _cumprod_months(price)  # 현재가 대비 월말 가격 (월, 경로, 종목)
+
+    growth = 1.0 + inputs.dividend_growth[picks]
+    growth[0] = 1.0
+    level = np.cumprod(growth, axis=0).astype(np.float32)  # 연도별 배당 수준 (연도, 경로, 종목)
+
+    if not reinvest:
+        # 주식 수가 그대로면 소득은 연도별 수준 x 월별 배당만으로 계산된다
+        income = (level * shares.astype(np.float32)) @ inputs.monthly_dividends.T.astype(np.float32)  # (연도, 경로, 12)
+        return income.transpose(1, 0, 2).reshape(n_paths, -1), (price @ weights).T
+
+    # 현재가 대비 배당 (배당수익률) 을 월마다 펼친다
+    yields = level[:, None] * (inputs.monthly_dividends / inputs.prices).astype(np.float32)[None, :, None]
+    yields = yields.reshape(years * 12, n_paths, -1)
+
+    # 받은 달 월말 가격으로 그 종목을 다시 산다: 보유 배율 = 누적곱(1 + 배당 / 가격)
+    held = np.divide(yields, price)
+    held += 1.0
+    _cumprod_months(held)
+    yields[1:] *= held[:-1]  # 배당은 전달까지 늘어난 주식 수만큼 받는다
+    income = yields @ weights
+    held *= price
+    return income.T, (held @ weights).T
+
+
+@perf.timed('projection.simulate')
+def simulate(inputs, shares, years=20, n_paths=10000, reinvest=True, seed=None, chunk_size=DEFAULT_CHUNK, max_workers=None):
+    """경로별 월 배당 소득과 월말 평가액 -> ((n_paths x 월), (n_paths x 월)).
+
+    경로를 chunk_size 개씩 나눠 계산해 메모리를 묶어 두고, 청크를 스레드 풀에서 나눠 돌린다
+    (NumPy 연산은 GIL 을 놓으므로 코어를 나눠 쓴다. max_workers=None 이면 CPU 수, 1 이면 현재 스레드에서).
+    청크마다 시드를 나눠 주므로 결과는 워커 수와 상관없이 같다.
+    """
+    shares = np.asarray(shares, dtype=float)
+    sizes = [min(chunk_size, n_paths - offset) for offset in range(0, n_paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    def run(args):
+        size, child = args
+        return _simulate_chunk(inputs, shares, size, years, reinvest, child)
+
+    if max_workers is None or max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            chunks = list(pool.map(perf.bind(run), zip(sizes, seeds)))
+    else:
+        chunks = [run(args) for args in zip(sizes, seeds)]
+    return np.concatenate([income for income, _ in chunks]), np.concatenate([value for _, value in chunks])
+
+
+def fan(paths, index, percentiles=PERCENTILES):
+    """(경로 x 시점) 배열 -> 시점별 분위수 DataFrame (컬럼 p5, p25, ...)."""
+    return pd.DataFrame(np.percentile(paths, percentiles, axis=0).T, index=index, columns=[f'p{p}' for p in percentiles])
+
+
+def project_portfolio(holdings, years=20, n_paths=10000, reinvest=True, lookback_years=None, seed=None, max_workers=None):
+    """holdings: (티커, 주식 수, 매수 금액) 목록 -> 전망 결과 dict.
+
+    'monthly_income' / 'annual_income' / 'value': 분위수 DataFrame (월별 배당 소득, 전망 연도별 배당 소득 합계, 월말 평가액)
+    'errors': 시세를 받지 못해 뺀 티커와 오류
+    """
+    shares = {}
+    for ticker, count, _ in holdings:
+        shares[ticker.upper()] = shares.get(ticker.upper(), 0.0) + count
+    histories, errors = price_store.load_histories(list(shares))
+    if not histories:
+        return {'errors': errors}
+
+    inputs = ProjectionInputs.from_histories(histories, lookback_years=lookback_years)
+    if len(inputs.returns) == 0:
+        return {'errors': errors}
+    income, value = simulate(inputs, [shares[ticker] for ticker in inputs.tickers], years, n_paths, reinvest, seed, max_workers=max_workers)
+
+    months = pd.date_range(inputs.as_of.to_period('M').to_timestamp() + pd.DateOffset(months=1), periods=income.shape[1], freq='MS')
+    annual = income.reshape(n_paths, years, 12).sum(axis=2)
+    return {
+        'monthly_income': fan(income, months),
+        'annual_income': fan(annual, pd.RangeIndex(1, annual.shape[1] + 1, name='year')),
+        'value': fan(value, months),
+        'start_value': float(inputs.prices @ np.array([shares[ticker] for ticker in inputs.tickers])),
+        'errors': errors,
+    }
@@ -0,0 +1,58 @@
+import threading
+
+import pandas as pd
+
+# 프로세스 전체에서 같은 키의 요청을 하나로 합치는 single-flight 계층
+# 여러 세션이 동시에 같은 티커를 조회하면 첫 요청만 실제로 실행되고 나머지는 그 결과를 기다려 받는다.
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0  # 실제로 실행된 요청 수
+        self.coalesced = 0  # 진행 중인 요청에 합류한 요청 수
+
+    def do(self, key, fn, *args, **kwargs):
+        """key 에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn 을 실행한다.
+
+        DataFrame/Series 결과는 합류한 호출자에게 복사본으로 건네 세션끼리 같은 객체를 고치지 않게 한다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            if isinstance(call.result, (pd.DataFrame, pd.Series)):
+                return call.result.copy()
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,25 @@
+import os
+import sys
+
+# 저장소 최상위 모듈(drip, backtest, ...)을 패키지 설치 없이 가져온다 (benchmarks/ 와 같은 방식)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytest  # noqa: E402
+
+import data_provider  # noqa: E402
+import dividend_index  # noqa: E402
+import price_store  # noqa: E402
+from frame_cache import shared_cache  # noqa: E402
+
+
+@pytest.fixture
+def replay_store(tmp_path, monkeypatch):
+    """합성 시계열을 돌려주는 replay 공급자와 빈 임시 시세 저장소. 저장소 폴더 경로를 돌려준다."""
+    store = tmp_path / 'store'
+    monkeypatch.setattr(data_provider, '_provider', data_provider.ReplayProvider(str(tmp_path / 'replay')))
+    monkeypatch.setattr(price_store, 'STORE_DIR', str(store))
+    monkeypatch.setattr(dividend_index, '_current', None)
+    shared_cache.clear()
+    yield store
+    shared_cache.clear()
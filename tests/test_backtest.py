@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from backtest import align_histories, run_backtest
+from data_provider import synthetic_history
+from drip import simulate_drip
+
+
+@pytest.fixture(scope='module')
+def histories():
+    # 시작일이 다른 종목을 섞어 정렬(모든 종목에 가격이 있는 첫날부터)도 함께 본다
+    return {
+        'KO': synthetic_history('KO', start='2000-01-03', end='2012-12-31'),
+        'PEP': synthetic_history('PEP', start='2003-06-02', end='2012-12-31'),
+        'JNJ': synthetic_history('JNJ', start='2001-03-01', end='2012-12-31'),
+    }
+
+
+@pytest.fixture(scope='module')
+def aligned(histories):
+    return align_histories(histories)
+
+
+def test_align_starts_when_every_ticker_has_a_price(histories, aligned):
+    index, close, dividends = aligned
+    assert index[0] == histories['PEP'].index[0].tz_localize(None)
+    assert close.shape == dividends.shape == (len(index), len(histories))
+    assert not np.isnan(close).any()
+
+
+def test_per_holding_matches_simulate_drip(histories, aligned):
+    index, close, dividends = aligned
+    amounts = [1000.0, 2000.0, 500.0]
+    result = run_backtest(index, close, dividends, amounts, mode='per_holding', withholding_tax=0.15)
+
+    expected = 0.0
+    for column, amount in enumerate(amounts):
+        shares = amount / close[0, column]
+        drip = simulate_drip(close[:, column], dividends[:, column], initial_shares=shares, withholding_tax=0.15)
+        expected = expected + drip['value'].to_numpy()
+    np.testing.assert_allclose(result['total'].to_numpy(), expected, rtol=1e-10)
+    assert result['total'].iloc[0] == pytest.approx(sum(amounts))
+
+
+def test_pooled_matches_day_loop(aligned):
+    index, close, dividends = aligned
+    amounts = [1000.0, 2000.0, 500.0]
+    result = run_backtest(index, close, dividends, amounts, mode='pooled')
+
+    # 배당을 모두 모아 그날 평가액 비중대로 다시 사는 하루 단위 루프
+    shares = np.asarray(amounts) / close[0]
+    received, values, totals = 0.0, [], []
+    for i in range(len(index)):
+        if i > 0:
+            cash = shares @ dividends[i]
+            received += cash
+            value = shares @ close[i]
+            shares = shares + cash * (shares * close[i] / value) / close[i]
+        values.append(shares @ close[i])
+        totals.append(received)
+    np.testing.assert_allclose(result['value'].to_numpy(), values, rtol=1e-9)
+    np.testing.assert_allclose(result['dividends'].to_numpy(), totals, rtol=1e-9)
+
+
+def test_none_keeps_dividends_as_cash(aligned):
+    index, close, dividends = aligned
+    amounts = [1000.0, 2000.0, 500.0]
+    result = run_backtest(index, close, dividends, amounts, mode='none')
+    shares = np.asarray(amounts) / close[0]
+    np.testing.assert_allclose(result['value'].to_numpy(), close @ shares)
+    assert result['cash'].iloc[-1] == pytest.approx((dividends[1:] @ shares).sum())
+    np.testing.assert_allclose(result['total'].to_numpy(), result['value'].to_numpy() + result['cash'].to_numpy())
+
+
+def test_unknown_mode(aligned):
+    index, close, dividends = aligned
+    with pytest.raises(ValueError):
+        run_backtest(index, close, dividends, [1.0, 1.0, 1.0], mode='weekly')
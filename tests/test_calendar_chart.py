@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import calendar_chart
+import dividend_index
+import logos
+from calendar_chart import CELL_H, CELL_W, LOGO_SIZE
+from dividend_index import DividendIndex, month_mask
+
+
+@pytest.fixture
+def renders(monkeypatch, tmp_path):
+    # 실제로 그리지 않고 _render 호출만 센다. 색인은 빈 임시 파일, PNG 캐시는 비운다
+    calls = []
+
+    def render(key):
+        calls.append(key)
+        return repr(key).encode(), True
+
+    monkeypatch.setattr(calendar_chart, '_render', render)
+    monkeypatch.setattr(calendar_chart, '_png_cache', type(calendar_chart._png_cache)())
+    monkeypatch.setattr(dividend_index, 'get_index', lambda path=None: DividendIndex(dividend_index._empty_frame()))
+    return calls
+
+
+def test_same_selection_is_rendered_once(renders):
+    selected = [('KO', 'king'), ('JNJ', 'king')]
+    first = calendar_chart.render_calendar_png(selected)
+    assert calendar_chart.render_calendar_png(list(selected)) is first
+    assert len(renders) == 1
+    # 순서가 바뀌면 y 축 순서가 달라지므로 다른 그림이다
+    calendar_chart.render_calendar_png(selected[::-1])
+    assert len(renders) == 2
+    # 키에는 표에 적어 둔 지급 월이 들어간다
+    assert renders[0][0] == ('KO', 'king', tuple(calendar_chart._company('KO', 'king')[2]))
+
+
+def test_changed_payment_months_redraw(renders, monkeypatch):
+    calendar_chart.render_calendar_png([('KO', 'king')])
+    frame = pd.DataFrame({'mask': [month_mask([1, 7])]}, index=['KO'])
+    monkeypatch.setattr(dividend_index, 'get_index', lambda path=None: DividendIndex(frame))
+    calendar_chart.render_calendar_png([('KO', 'king')])
+    assert len(renders) == 2
+    assert renders[1] == (('KO', 'king', (1, 7)),)
+
+
+def test_incomplete_logos_are_not_cached(renders, monkeypatch):
+    monkeypatch.setattr(calendar_chart, '_render', lambda key: (renders.append(key), (b'png', False))[1])
+    calendar_chart.render_calendar_png([('KO', 'king')])
+    calendar_chart.render_calendar_png([('KO', 'king')])
+    assert len(renders) == 2
+
+
+def test_logo_canvas_places_logo_in_each_payment_month(monkeypatch):
+    logo = np.full((LOGO_SIZE[1], LOGO_SIZE[0], 4), 255, dtype=np.uint8)
+    monkeypatch.setattr(logos, 'get_logo', lambda url, size=None: logo)
+    monkeypatch.setattr(logos, 'is_placeholder', lambda image: False)
+    canvas, complete = calendar_chart.logo_canvas([('KO', 'king', [2, 5]), ('JNJ', 'king', [12])])
+    assert complete
+    assert canvas.shape == (2 * CELL_H, 12 * CELL_W, 4)
+    filled = canvas[..., 3].reshape(2, CELL_H, 12, CELL_W).any(axis=(1, 3))
+    # 첫 종목이 아래 줄 (y 축 0)
+    assert np.flatnonzero(filled[1]).tolist() == [1, 4]
+    assert np.flatnonzero(filled[0]).tolist() == [11]
+    assert canvas[..., 3].sum() == 3 * 255 * LOGO_SIZE[0] * LOGO_SIZE[1]
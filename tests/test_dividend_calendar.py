@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_provider import synthetic_history
+from dividend_calendar import MONTHS, monthly_dividend_matrix
+
+AS_OF = pd.Timestamp('2012-06-15')
+
+
+@pytest.fixture(scope='module')
+def holdings():
+    # 같은 티커가 두 번 들어간 경우와 시간대가 없는 Series 도 섞는다
+    streams = []
+    buys = [('KO', 10, '2000-01-03'), ('PEP', 3, '2005-03-01'), ('KO', 5, '2000-01-03'), ('JNJ', 2, '2008-01-02')]
+    for ticker, shares, start in buys:
+        history = synthetic_history(ticker, start=start, end='2012-12-31')
+        dividends = history['Dividends'][history['Dividends'] > 0] * shares
+        streams.append((ticker, dividends))
+    streams[-1] = (streams[-1][0], streams[-1][1].tz_localize(None))
+    return streams
+
+
+def loop_matrix(holdings, mode, as_of=AS_OF):
+    # 원래 탭1 방식: 배당 이벤트마다 한 줄씩 (티커, 월, 배당) 을 만들어 더한다
+    rows = {}
+    years = {}
+    for ticker, dividends in holdings:
+        for date, dividend in dividends.items():
+            date = pd.Timestamp(date).tz_localize(None) if pd.Timestamp(date).tz is not None else pd.Timestamp(date)
+            if mode == 'ttm' and not (as_of - pd.DateOffset(years=1) < date <= as_of):
+                continue
+            rows.setdefault(ticker, np.zeros(12))[date.month - 1] += dividend
+            years.setdefault(ticker, set()).add(date.year)
+    tickers = list(dict.fromkeys(ticker for ticker, _ in holdings))
+    matrix = pd.DataFrame([rows.get(ticker, np.zeros(12)) for ticker in tickers], index=tickers, columns=MONTHS)
+    if mode == 'average':
+        matrix = matrix.div([max(1, len(years.get(ticker, ()))) for ticker in tickers], axis=0)
+    return matrix
+
+
+@pytest.mark.parametrize('mode', ['all', 'ttm', 'average'])
+def test_matches_event_loop(holdings, mode):
+    matrix = monthly_dividend_matrix(holdings, mode=mode, as_of=AS_OF)
+    expected = loop_matrix(holdings, mode)
+    assert list(matrix.index) == ['KO', 'PEP', 'JNJ']
+    assert list(matrix.columns) == MONTHS
+    np.testing.assert_allclose(matrix.to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+def test_empty_holdings():
+    matrix = monthly_dividend_matrix([('KO', pd.Series(dtype=float))])
+    assert matrix.shape == (0, 12)
+
+
+def test_unknown_mode(holdings):
+    with pytest.raises(ValueError):
+        monthly_dividend_matrix(holdings, mode='weekly')
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+import dividend_index
+import price_store
+from analytics import payment_months
+from dividend_index import DividendIndex, mask_months, month_mask, summarize
+from frame_cache import shared_cache
+
+TICKERS = ['KO', 'PEP', 'JNJ', 'MMM']
+
+
+def test_month_mask_round_trip():
+    for months in ([], [1], [3, 6, 9, 12], list(range(1, 13))):
+        assert mask_months(month_mask(months)) == months
+
+
+def test_summarize_matches_trailing_year(replay_store):
+    history = price_store.load_history('KO')
+    row = summarize(history)
+    dividends = price_store.dividend_events(history)
+    assert mask_months(row['mask']) == payment_months(dividends, as_of=history.index[-1])
+    assert row['frequency'] == len(mask_months(row['mask']))
+    assert row['last_close'] == history['Close'].iloc[-1]
+    assert row['as_of'] == history.index[-1].tz_localize(None)
+
+
+def test_pays_in_lists_every_ticker_paying_that_month():
+    frame = pd.DataFrame({'mask': [month_mask([1, 4, 7, 10]), month_mask([3, 6, 9, 12]), month_mask(range(1, 13))]},
+                         index=['A', 'B', 'C'])
+    index = DividendIndex(frame)
+    assert index.pays_in(1) == ('A', 'C')
+    assert index.pays_in(3) == ('B', 'C')
+    assert index.pays_in(2) == ('C',)
+    assert index.months('B') == [3, 6, 9, 12]
+    assert index.months('Z') is None and 'Z' not in index
+
+
+def test_update_index_builds_and_skips_unchanged_rows(replay_store, monkeypatch):
+    result = dividend_index.update_index(TICKERS)
+    assert result['updated'] == sorted(TICKERS) and result['errors'] == {}
+    index = dividend_index.get_index()
+    assert len(index) == len(TICKERS)
+    for month in range(1, 13):
+        expected = [ticker for ticker in TICKERS if month in index.months(ticker)]
+        assert list(index.pays_in(month)) == sorted(expected)
+
+    # 저장소 파일이 그대로면 시세를 다시 읽지 않는다
+    loaded = []
+    load_histories = price_store.load_histories
+
+    def counting(tickers, **kwargs):
+        loaded.extend(tickers)
+        return load_histories(tickers, **kwargs)
+
+    monkeypatch.setattr(price_store, 'load_histories', counting)
+    written = dividend_index.read_index()
+    assert dividend_index.update_index(TICKERS) == {'updated': [], 'unchanged': len(TICKERS), 'errors': {}}
+    assert loaded == []
+    pd.testing.assert_frame_equal(dividend_index.read_index(), written)
+
+
+def test_update_index_recomputes_ticker_with_new_bars(replay_store):
+    # KO 는 최근 반년을 뺀 시세로 색인한 뒤, 전체 시세로 저장소를 바꾼다
+    full = price_store.load_history('KO')
+    price_store.write_history('KO', full.iloc[:-120])
+    shared_cache.clear()
+    dividend_index.update_index(['KO', 'PEP'])
+    old_as_of = dividend_index.get_index().row('KO')['as_of']
+
+    price_store.write_history('KO', full)
+    shared_cache.clear()
+    result = dividend_index.update_index(['KO', 'PEP'])
+    assert result['updated'] == ['KO'] and result['unchanged'] == 1
+    row = dividend_index.get_index().row('KO')
+    assert row['as_of'] > old_as_of
+    assert row['as_of'] == full.index[-1].tz_localize(None)
+    assert np.isclose(row['ttm_dividend'], summarize(full)['ttm_dividend'])
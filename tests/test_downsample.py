@@ -0,0 +1,55 @@
+import numpy as np
+
+from data_provider import synthetic_history
+from downsample import downsample_positions, lttb_indices
+
+
+def lttb_loop(x, y, n_out):
+    # 버킷마다 점을 하나씩 돌며 삼각형 넓이를 재는 LTTB (lttb_indices 와 같은 버킷 경계)
+    n = len(x)
+    edges = [int(edge) for edge in np.linspace(1, n - 1, n_out - 1)]
+    edges[-1] = n - 1
+    selected = [0]
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        next_lo, next_hi = (edges[b + 1], edges[b + 2]) if b + 2 < len(edges) else (n - 1, n)
+        avg_x = sum(x[next_lo:next_hi]) / (next_hi - next_lo)
+        avg_y = sum(y[next_lo:next_hi]) / (next_hi - next_lo)
+        px, py = x[selected[-1]], y[selected[-1]]
+        best, best_area = lo, -1.0
+        for i in range(lo, hi):
+            area = abs((px - avg_x) * (y[i] - py) - (px - x[i]) * (avg_y - py))
+            if area > best_area:
+                best, best_area = i, area
+        selected.append(best)
+    selected.append(n - 1)
+    return selected
+
+
+def test_lttb_matches_loop_and_keeps_endpoints():
+    history = synthetic_history('KO', start='1990-01-02', end='2010-12-31')
+    x = history.index.asi8.astype(float)
+    y = history['Close'].to_numpy()
+    for n_out in (3, 10, 500):
+        picked = lttb_indices(x, y, n_out)
+        assert picked.tolist() == lttb_loop(x.tolist(), y.tolist(), n_out)
+        assert picked[0] == 0 and picked[-1] == len(x) - 1
+        assert (np.diff(picked) > 0).all()
+
+
+def test_short_series_is_kept_whole():
+    assert lttb_indices([0, 1, 2], [1, 2, 3], 10).tolist() == [0, 1, 2]
+
+
+def test_downsample_keeps_dividend_dates_and_extremes():
+    history = synthetic_history('KO', start='1970-01-02', end='2010-12-31')
+    index = history.index
+    close = history['Close'].to_numpy()
+    dividend_dates = index[history['Dividends'] > 0]
+    positions = downsample_positions(index, [close, close * 1.5], 1000, keep=dividend_dates)
+
+    assert len(positions) < len(index) // 5
+    assert positions[0] == 0 and positions[-1] == len(index) - 1
+    assert set(np.flatnonzero(index.isin(dividend_dates))) <= set(positions.tolist())
+    assert int(np.argmax(close)) in positions and int(np.argmin(close)) in positions
+    assert downsample_positions(index[:50], [close[:50]], 1000).tolist() == list(range(50))
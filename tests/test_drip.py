@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from data_provider import synthetic_history
+from drip import DripIndex, simulate_drip
+
+
+@pytest.fixture(scope='module')
+def history():
+    return synthetic_history('KO', start='1990-01-02', end='2010-12-31')
+
+
+def day_loop(close, dividends, initial_shares=1.0, withholding_tax=0.0):
+    # 하루씩 주식 수를 갱신하던 원래 방식 (첫날 배당은 재투자하지 않음)
+    shares, values = initial_shares, []
+    for i in range(len(close)):
+        if i > 0 and dividends[i] > 0:
+            shares += shares * dividends[i] * (1.0 - withholding_tax) / close[i]
+        values.append(shares * close[i])
+    return np.array(values)
+
+
+def test_simulate_drip_matches_day_loop(history):
+    result = simulate_drip(history['Close'], history['Dividends'], initial_shares=3, withholding_tax=0.15)
+    expected = day_loop(history['Close'].to_numpy(), history['Dividends'].to_numpy(), 3, 0.15)
+    np.testing.assert_allclose(result['value'].to_numpy(), expected, rtol=1e-10)
+
+
+def test_simulate_drip_whole_shares_keeps_cash(history):
+    result = simulate_drip(history['Close'], history['Dividends'], initial_shares=10, whole_shares=True, commission=1.0)
+    assert (result['shares'] == np.floor(result['shares'])).all()
+    assert (result['cash'] >= 0).all()
+    assert result['shares'].is_monotonic_increasing
+
+
+def test_drip_index_matches_simulation_on_random_ranges(history):
+    index = DripIndex.build(history['Close'], history['Dividends'])
+    dates = history.index.tz_localize(None)
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        lo, hi = sorted(rng.choice(len(dates), size=2, replace=False))
+        start, end = dates[lo], dates[hi]
+        part = history.iloc[lo:hi]
+        simulated = simulate_drip(part['Close'], part['Dividends'], initial_shares=2.0)
+
+        path = index.value_path(start, end, initial_shares=2.0)
+        np.testing.assert_allclose(path.to_numpy(), simulated['value'].to_numpy(), rtol=1e-9)
+
+        summary = index.query(start, end, initial_shares=2.0)
+        assert summary['shares'] == pytest.approx(simulated['shares'].iloc[-1], rel=1e-9)
+        assert summary['value'] == pytest.approx(simulated['value'].iloc[-1], rel=1e-9)
+        assert summary['dividends_per_share'] == pytest.approx(part['Dividends'].iloc[1:].sum(), abs=1e-9)
+
+
+def test_drip_index_empty_range(history):
+    index = DripIndex.build(history['Close'], history['Dividends'])
+    day = history.index[100].tz_localize(None)
+    assert index.query(day, day) is None
+    assert index.value_path(day, day).empty
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from frame_cache import MARKET_TZ, FrameCache, frame_nbytes, last_market_close, next_market_close
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def at(text):
+    return datetime.fromisoformat(text).replace(tzinfo=MARKET_TZ)
+
+
+def frame(n):
+    return pd.DataFrame({'Close': [1.0] * n})
+
+
+def test_market_close_times():
+    # 금요일 장 마감(+30분) 전/후, 주말
+    assert next_market_close(at('2026-10-16 15:50')) == at('2026-10-16 16:30')
+    assert next_market_close(at('2026-10-16 16:40')) == at('2026-10-19 16:30')
+    assert next_market_close(at('2026-10-18 12:00')) == at('2026-10-19 16:30')
+    assert last_market_close(at('2026-10-16 16:40')) == at('2026-10-16 16:30')
+    assert last_market_close(at('2026-10-19 09:00')) == at('2026-10-16 16:30')
+    assert last_market_close(at('2026-10-16 16:30')) == at('2026-10-16 16:30')
+
+
+def test_entries_expire_at_next_close():
+    clock = Clock(at('2026-10-16 15:50'))
+    cache = FrameCache(clock=clock)
+    cache.put('KO', frame(3))
+    clock.now = at('2026-10-16 16:29')
+    assert cache.get('KO') is not None
+    clock.now = at('2026-10-16 16:30')
+    assert cache.get('KO') is None
+    assert cache.stats()['expirations'] == 1
+    assert cache.stats()['entries'] == 0 and cache.stats()['bytes'] == 0
+
+
+def test_least_recently_used_frame_is_evicted():
+    size = frame_nbytes(frame(100))
+    cache = FrameCache(max_bytes=size * 2, clock=Clock(at('2026-10-16 10:00')))
+    cache.put('a', frame(100))
+    cache.put('b', frame(100))
+    cache.get('a')  # a 를 최근에 쓴 것으로
+    cache.put('c', frame(100))
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['bytes'] == size * 2
+
+
+def test_frame_larger_than_budget_is_not_kept():
+    cache = FrameCache(max_bytes=10, clock=Clock(at('2026-10-16 10:00')))
+    big = frame(100)
+    assert cache.put('big', big) is big
+    assert cache.get('big') is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_get_or_load_loads_once():
+    cache = FrameCache(clock=Clock(at('2026-10-16 10:00')))
+    calls = []
+
+    def load():
+        calls.append(1)
+        return frame(5)
+
+    first = cache.get_or_load('KO', load)
+    assert cache.get_or_load('KO', load) is first
+    assert len(calls) == 1
+    cache.invalidate('KO')
+    cache.get_or_load('KO', load)
+    assert len(calls) == 2
+
+
+def test_put_replaces_existing_entry():
+    clock = Clock(at('2026-10-16 10:00'))
+    cache = FrameCache(clock=clock)
+    cache.put('KO', frame(10))
+    cache.put('KO', frame(20), expires_at=clock.now + timedelta(minutes=1))
+    assert cache.stats()['bytes'] == frame_nbytes(frame(20))
+    clock.now += timedelta(minutes=2)
+    assert cache.get('KO') is None
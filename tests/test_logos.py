@@ -0,0 +1,47 @@
+import json
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import logos
+
+URL = 'https://example.com/wide.png'
+
+
+@pytest.fixture
+def logo_cache(tmp_path, monkeypatch):
+    # 네트워크 없이 디스크 캐시에 200x100 원본 하나를 넣어 둔다
+    monkeypatch.setattr(logos, 'LOGO_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(logos, '_memory', {})
+    monkeypatch.setattr(logos, '_prefetched', set())
+    monkeypatch.setenv(logos.OFFLINE_ENV, '1')
+    Image.new('RGBA', (200, 100), (255, 0, 0, 255)).save(tmp_path / 'wide.png')
+    (tmp_path / 'index.json').write_text(json.dumps({URL: 'wide'}), encoding='utf-8')
+    return tmp_path
+
+
+def test_fit_keeps_the_aspect_ratio(logo_cache):
+    assert logos.get_logo(URL, size=(80, 80)).shape == (80, 80, 4)
+    assert logos.get_logo(URL, size=(80, 80), fit=True).shape == (40, 80, 4)
+    assert (logo_cache / 'wide_80x80.png').exists() and (logo_cache / 'wide_80x80_fit.png').exists()
+
+
+def test_fit_does_not_upscale(logo_cache):
+    assert logos.get_logo(URL, size=(400, 400), fit=True).shape == (100, 200, 4)
+
+
+def test_prefetch_once_runs_once_per_urls_and_size(logo_cache, monkeypatch):
+    calls = []
+    monkeypatch.setattr(logos, 'prefetch', lambda urls, size, **kwargs: calls.append((urls, size)))
+
+    assert logos.prefetch_once([URL, URL], size=(35, 40))
+    assert not logos.prefetch_once([URL], size=(35, 40))
+    assert logos.prefetch_once([URL], size=(40, 40))
+    assert calls == [((URL,), (35, 40)), ((URL,), (40, 40))]
+
+
+def test_placeholder_when_offline_and_not_cached(logo_cache):
+    image = logos.get_logo('https://example.com/missing.png', size=(20, 20))
+    assert logos.is_placeholder(image)
+    assert not np.asarray(image).flags.writeable
@@ -0,0 +1,68 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from dividend_index import mask_months, month_mask
+from optimizer import FULL_YEAR, Candidate, count_vectors, optimize, read_sectors
+
+QUARTERS = [month_mask([1, 4, 7, 10]), month_mask([2, 5, 8, 11]), month_mask([3, 6, 9, 12])]
+
+
+def brute_force(masks, sizes, max_names):
+    rows = []
+    for counts in product(*(range(min(size, max_names) + 1) for size in sizes)):
+        covered = 0
+        for mask, count in zip(masks, counts):
+            if count:
+                covered |= mask
+        if sum(counts) <= max_names and covered == FULL_YEAR:
+            rows.append(counts)
+    return sorted(rows)
+
+
+def test_month_mask_round_trip():
+    assert month_mask([1, 12]) == 1 | 1 << 11
+    assert mask_months(month_mask([3, 6, 9, 12])) == [3, 6, 9, 12]
+    assert month_mask(range(1, 13)) == FULL_YEAR
+
+
+def test_count_vectors_matches_brute_force():
+    masks = QUARTERS + [month_mask([6, 12]), month_mask(range(1, 13)), month_mask([1, 2, 3])]
+    sizes = [3, 2, 4, 2, 1, 2]
+    for max_names in (1, 3, 5, 8):
+        counts = count_vectors(masks, sizes, max_names)
+        assert sorted(map(tuple, counts.tolist())) == brute_force(masks, sizes, max_names)
+
+
+def test_count_vectors_without_full_coverage():
+    counts = count_vectors(QUARTERS[:2], [3, 3], 6)
+    assert counts.shape == (0, 2)
+
+
+def test_optimize_covers_every_month_with_equal_payments():
+    candidates = [
+        Candidate('A', QUARTERS[0], 0.03, 50.0, 'Tech'),
+        Candidate('B', QUARTERS[0], 0.05, 20.0, 'Tech'),
+        Candidate('C', QUARTERS[1], 0.04, 30.0, 'Tech'),
+        Candidate('D', QUARTERS[2], 0.02, 80.0, 'Energy'),
+        Candidate('E', QUARTERS[2], 0.06, 10.0, 'Energy'),
+    ]
+    results = optimize(candidates, 12000.0, max_names=3, max_per_sector=2)
+    best = results[0]
+    assert sorted(best['tickers']) == ['B', 'C', 'E']
+    assert best['smoothness'] == 0
+    np.testing.assert_allclose(best['monthly_income'], [best['annual_income'] / 12] * 12)
+    assert sum(best['allocations'].values()) == pytest.approx(12000.0)
+    # 2/5/8/11월은 Tech 인 C 뿐이라 섹터당 1종목이면 1/4/7/10월(A, B 모두 Tech)을 채울 수 없다
+    assert optimize(candidates, 12000.0, max_names=3, max_per_sector=1) == []
+
+
+def test_read_sectors_merges_every_stock_csv(tmp_path):
+    first = tmp_path / 'king_data.csv'
+    first.write_text('Name,Sector,MarketCap,ticker\nCoca-Cola,Consumer Defensive,1,KO\n', encoding='utf-8')
+    second = tmp_path / 'etf_companies_info.csv'
+    second.write_text('Ticker,Company Name,Sector\nko,Coca-Cola,Beverages\nXOM,Exxon,Energy\nABC,No sector,\n',
+                      encoding='utf-8')
+    sectors = read_sectors([str(first), str(second), str(tmp_path / 'missing.csv')])
+    assert sectors == {'KO': 'Consumer Defensive', 'XOM': 'Energy'}
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+import price_store
+from portfolio import HOLDING_DTYPE, Portfolio
+
+BUYS = [('KO', 10.0, 600.0), ('pep', 3.0, 450.0), ('KO', 5.0, 310.0), ('JNJ', 2.0, 300.0)]
+
+
+def test_record_layout():
+    assert HOLDING_DTYPE.itemsize == 20
+    portfolio = Portfolio()
+    for buy in BUYS:
+        portfolio.add(*buy)
+    assert portfolio._records.dtype == HOLDING_DTYPE
+    assert portfolio._symbols == ['KO', 'PEP', 'JNJ']  # 같은 티커는 번호 하나를 같이 쓴다
+    assert portfolio.nbytes() < 20 * len(BUYS) + 200
+
+
+def test_matches_list_of_dicts():
+    # 원래 세션 포트폴리오: 매수마다 dict 한 개 (배당 Series 는 여기서 빼고 비교)
+    baseline = []
+    portfolio = Portfolio()
+    for ticker, shares, cost in BUYS:
+        baseline.append({'ticker': ticker.upper(), 'num_shares': shares, 'total_investment': cost})
+        portfolio.add(ticker, shares, cost)
+
+    assert len(portfolio) == len(baseline) and bool(portfolio)
+    assert portfolio.version == len(BUYS)
+    assert list(portfolio) == [(stock['ticker'], stock['num_shares'], stock['total_investment']) for stock in baseline]
+    assert portfolio.tickers == [stock['ticker'] for stock in baseline]
+    np.testing.assert_array_equal(portfolio.shares, [stock['num_shares'] for stock in baseline])
+    assert portfolio.total_investment == sum(stock['total_investment'] for stock in baseline)
+
+
+def test_remove_frees_every_lot_of_the_ticker():
+    portfolio = Portfolio()
+    for buy in BUYS:
+        portfolio.add(*buy)
+    version = portfolio.version
+    assert portfolio.remove('ko') == 910.0
+    assert portfolio.tickers == ['PEP', 'JNJ']
+    assert portfolio.total_investment == 750.0
+    assert portfolio.version == version + 1
+    assert portfolio.remove('XOM') == 0.0
+    assert portfolio.remove('PEP') + portfolio.remove('JNJ') == 750.0
+    assert not portfolio
+
+
+def test_dividend_streams_scale_shared_dividends(replay_store):
+    portfolio = Portfolio()
+    for buy in BUYS:
+        portfolio.add(*buy)
+    streams = portfolio.dividend_streams()
+    assert [ticker for ticker, _ in streams] == portfolio.tickers
+    for (ticker, stream), shares in zip(streams, portfolio.shares):
+        pd.testing.assert_series_equal(stream, price_store.load_dividends(ticker) * shares)
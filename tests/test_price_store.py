@@ -0,0 +1,115 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+import data_provider
+import price_store
+from data_provider import MarketDataProvider, synthetic_history
+
+
+class FakeProvider(MarketDataProvider):
+    """고정된 일봉을 돌려주고 요청한 시작일을 기록한다 (None 이면 전체 요청)."""
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.starts = []
+
+    def history(self, ticker, start=None, end=None, period=None):
+        self.starts.append(start)
+        if start is None:
+            return self.frame
+        return self.frame[self.frame.index.tz_localize(None) >= pd.Timestamp(start)]
+
+
+@pytest.fixture
+def provider(replay_store, monkeypatch):
+    frame = price_store._normalize(synthetic_history('KO', start='2015-01-02', end='2016-12-30'))
+    frame.index = pd.DatetimeIndex(frame.index, freq=None)  # Parquet 에서 읽은 인덱스처럼 freq 없이
+    fake = FakeProvider(frame)
+    monkeypatch.setattr(data_provider, '_provider', fake)
+    return fake
+
+
+def store_stale(ticker, history):
+    # 마지막 장 마감 전에 저장된 것처럼 파일 시각을 되돌린다
+    price_store.write_history(ticker, history)
+    stale = time.time() - 10 * 24 * 3600
+    os.utime(price_store.store_path(ticker), (stale, stale))
+
+
+def cut_without_dividends(frame):
+    # 마지막 배당일 바로 다음 봉까지 (남은 꼬리에는 배당이 없다)
+    last = frame.index.get_loc(frame.index[frame['Dividends'] > 0][-1])
+    assert last + 2 < len(frame)
+    return last + 2
+
+
+def test_first_load_stores_full_history(provider):
+    history = price_store._load_history('KO')
+    pd.testing.assert_frame_equal(history, provider.frame)
+    pd.testing.assert_frame_equal(price_store.read_history('KO'), provider.frame)
+    assert provider.starts == [None]
+
+
+def test_fresh_store_is_read_without_fetching(provider):
+    price_store.write_history('KO', provider.frame)
+    price_store._load_history('KO')
+    assert provider.starts == []
+
+
+def test_delta_merges_tail_and_replaces_last_bar(provider):
+    full = provider.frame
+    cut = cut_without_dividends(full)
+    stored = full.iloc[:cut].copy()
+    stored.iloc[-1, stored.columns.get_loc('Close')] = -1.0  # 장중에 저장된 미완성 봉
+    store_stale('KO', stored)
+
+    history = price_store._load_history('KO')
+    assert provider.starts == [stored.index[-1].date()]  # 마지막 저장 봉부터 다시 받는다
+    pd.testing.assert_frame_equal(history, full)
+    pd.testing.assert_frame_equal(price_store.read_history('KO'), full)
+
+
+def test_unchanged_store_is_touched_not_rewritten(provider, monkeypatch):
+    store_stale('KO', provider.frame)
+    writes = []
+    monkeypatch.setattr(price_store, 'write_history', lambda ticker, frame: writes.append(ticker))
+    before = os.path.getmtime(price_store.store_path('KO'))
+
+    history = price_store._load_history('KO')
+    pd.testing.assert_frame_equal(history, provider.frame)
+    assert writes == []
+    assert os.path.getmtime(price_store.store_path('KO')) > before
+    assert price_store._is_fresh('KO')
+
+
+def test_dividend_on_last_stored_bar_is_not_new(provider):
+    full = provider.frame
+    last_dividend = full.index.get_loc(full.index[full['Dividends'] > 0][-1])
+    store_stale('KO', full.iloc[:last_dividend + 1])
+    price_store._load_history('KO')
+    assert None not in provider.starts
+
+
+@pytest.mark.parametrize('column, value', [('Dividends', 0.25), ('Stock Splits', 2.0)])
+def test_new_dividend_or_split_refetches_everything(provider, column, value):
+    full = provider.frame.copy()
+    cut = cut_without_dividends(full)
+    full.iloc[-1, full.columns.get_loc(column)] = value
+    full['Close'] *= 0.9  # 수정주가가 과거까지 모두 바뀐다
+    store_stale('KO', provider.frame.iloc[:cut])
+    provider.frame = full
+
+    history = price_store._load_history('KO')
+    assert provider.starts[-1] is None
+    pd.testing.assert_frame_equal(history, full)
+    pd.testing.assert_frame_equal(price_store.read_history('KO'), full)
+
+
+def test_write_leaves_no_temp_files(replay_store):
+    frame = price_store._normalize(synthetic_history('KO', start='2020-01-02', end='2020-03-31'))
+    price_store.write_history('KO', frame)
+    price_store.write_history('KO', frame)
+    assert sorted(os.listdir(replay_store)) == ['KO.parquet']
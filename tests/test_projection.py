@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import align_histories
+from data_provider import synthetic_history
+from projection import ProjectionInputs, project_portfolio, simulate
+
+HOLDINGS = [('KO', 10.0, 600.0), ('PEP', 4.0, 500.0), ('JNJ', 6.0, 900.0)]
+
+
+@pytest.fixture(scope='module')
+def inputs():
+    histories = {ticker: synthetic_history(ticker, start='1995-01-03', end='2015-06-30') for ticker, _, _ in HOLDINGS}
+    return ProjectionInputs.from_histories(histories)
+
+
+def path_loop(inputs, shares, years, n_paths, reinvest, seed):
+    # 경로 하나씩, 한 달씩 주식 수와 배당을 갱신한다 (simulate 와 같은 부트스트랩 표본)
+    rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(1)[0])
+    picks = rng.integers(0, len(inputs.returns), size=(years, n_paths))
+    income = np.zeros((n_paths, years * 12))
+    value = np.zeros((n_paths, years * 12))
+    for path in range(n_paths):
+        held = np.array(shares, dtype=float)
+        price = inputs.prices.astype(float).copy()
+        level = np.ones(len(held))
+        for year in range(years):
+            window = picks[year, path]
+            if year > 0:
+                level = level * (1.0 + inputs.dividend_growth[window])
+            for month in range(12):
+                price = price * (1.0 + inputs.returns[window, month])
+                dividend = level * inputs.monthly_dividends[month]
+                income[path, year * 12 + month] = held @ dividend
+                if reinvest:
+                    held = held + held * dividend / price
+                value[path, year * 12 + month] = held @ price
+    return income, value
+
+
+def test_from_histories_shapes(inputs):
+    assert inputs.returns.shape[1:] == (12, 3)
+    assert inputs.dividend_growth.shape == (len(inputs.returns), 3)
+    assert inputs.monthly_dividends.shape == (12, 3)
+    index, close, _ = align_histories({ticker: synthetic_history(ticker, start='1995-01-03', end='2015-06-30')
+                                       for ticker, _, _ in HOLDINGS})
+    np.testing.assert_allclose(inputs.prices, close[-1])
+    assert inputs.as_of == index[-1]
+
+
+@pytest.mark.parametrize('reinvest', [True, False])
+def test_simulate_matches_path_loop(inputs, reinvest):
+    shares = [10.0, 4.0, 6.0]
+    income, value = simulate(inputs, shares, years=3, n_paths=20, reinvest=reinvest, seed=7, chunk_size=20, max_workers=1)
+    expected_income, expected_value = path_loop(inputs, shares, 3, 20, reinvest, seed=7)
+    np.testing.assert_allclose(income, expected_income, rtol=1e-4)
+    np.testing.assert_allclose(value, expected_value, rtol=1e-4)
+
+
+def test_simulate_does_not_depend_on_workers(inputs):
+    single = simulate(inputs, [1.0, 2.0, 3.0], years=5, n_paths=250, seed=3, chunk_size=40, max_workers=1)
+    pooled = simulate(inputs, [1.0, 2.0, 3.0], years=5, n_paths=250, seed=3, chunk_size=40, max_workers=4)
+    for a, b in zip(single, pooled):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_project_portfolio_is_deterministic_for_a_seed(replay_store):
+    first = project_portfolio(HOLDINGS, years=5, n_paths=300, seed=11)
+    second = project_portfolio(HOLDINGS, years=5, n_paths=300, seed=11)
+    other = project_portfolio(HOLDINGS, years=5, n_paths=300, seed=12)
+    assert first['errors'] == {}
+    for key in ('monthly_income', 'annual_income', 'value'):
+        pd.testing.assert_frame_equal(first[key], second[key])
+    assert not first['value'].equals(other['value'])
+    assert list(first['annual_income'].columns) == ['p5', 'p25', 'p50', 'p75', 'p95']
+    assert len(first['monthly_income']) == 5 * 12
+    assert (first['annual_income'].diff(axis=1).iloc[:, 1:] >= 0).all().all()  # 분위수는 커지는 순서
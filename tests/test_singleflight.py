@@ -0,0 +1,84 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return pd.DataFrame({'Close': [1.0, 2.0]})
+
+    results = [None] * 5
+
+    def worker(slot):
+        results[slot] = flight.do('KO', load)
+
+    leader = threading.Thread(target=worker, args=(0,))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=worker, args=(slot,)) for slot in range(1, 5)]
+    for thread in followers:
+        thread.start()
+    while flight.coalesced < 4:  # 모두 진행 중인 호출에 합류할 때까지
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert flight.executed == 1 and flight.coalesced == 4
+    assert flight.in_flight() == 0
+    # 합류한 호출자는 복사본을 받는다
+    assert all(result.equals(results[0]) for result in results)
+    assert len({id(result) for result in results}) == 5
+
+
+def test_error_reaches_every_waiter_and_key_is_released():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise LookupError('no data')
+
+    errors = []
+
+    def worker():
+        try:
+            flight.do('KO', fail)
+        except LookupError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker)]
+    threads[0].start()
+    started.wait(5)
+    threads.append(threading.Thread(target=worker))
+    threads[1].start()
+    while flight.coalesced < 1:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 2
+    assert flight.do('KO', lambda: 42) == 42  # 실패한 키는 다음 호출에서 다시 실행된다
+    assert flight.executed == 2
+
+
+def test_sequential_calls_run_again():
+    flight = SingleFlight()
+    assert flight.do('a', lambda: 1) == 1
+    assert flight.do('a', lambda: 2) == 2
+    with pytest.raises(ZeroDivisionError):
+        flight.do('b', lambda: 1 / 0)
+    assert flight.coalesced == 0
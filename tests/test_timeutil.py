@@ -0,0 +1,22 @@
+import pandas as pd
+
+from timeutil import MARKET_TZ, local_dates, local_timestamp, with_local_dates
+
+
+def test_local_dates_keep_the_market_wall_clock():
+    index = pd.DatetimeIndex(['2024-03-01', '2024-03-04'], tz=MARKET_TZ.key)
+    assert list(local_dates(index)) == [pd.Timestamp('2024-03-01'), pd.Timestamp('2024-03-04')]
+    naive = pd.DatetimeIndex(['2024-03-01'])
+    assert local_dates(naive) is naive
+
+
+def test_with_local_dates_does_not_copy_naive_frames():
+    series = pd.Series([1.0], index=pd.DatetimeIndex(['2024-03-01']))
+    assert with_local_dates(series) is series
+    aware = series.tz_localize(MARKET_TZ.key)
+    assert with_local_dates(aware).index.equals(series.index)
+
+
+def test_local_timestamp():
+    assert local_timestamp('2024-03-01') == pd.Timestamp('2024-03-01')
+    assert local_timestamp(pd.Timestamp('2024-03-01 09:30', tz=MARKET_TZ.key)) == pd.Timestamp('2024-03-01 09:30')
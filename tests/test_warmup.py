@@ -0,0 +1,30 @@
+import json
+import threading
+
+import warmup
+
+
+def test_loop_survives_a_failed_run(tmp_path, monkeypatch):
+    status_file = tmp_path / 'warmup.json'
+    job = warmup.Warmup(max_workers=1, status_file=str(status_file))
+    monkeypatch.setattr(warmup, 'RETRY_DELAY', 0.01)
+    calls = []
+    second = threading.Event()
+
+    def run_once():
+        calls.append(1)
+        if len(calls) == 1:
+            raise OSError('깨진 Parquet')
+        second.set()
+        job.stop()
+        return job.status()
+
+    monkeypatch.setattr(job, 'run_once', run_once)
+    assert job.start()
+    assert second.wait(5)
+    job._thread.join(5)
+
+    assert len(calls) == 2  # 실패한 뒤에도 스레드가 살아서 다시 돌았다
+    status = json.loads(status_file.read_text(encoding='utf-8'))  # (가짜 run_once 는 상태 파일을 쓰지 않는다)
+    assert status['state'] == 'failed'
+    assert status['errors'] == {'warmup': 'OSError: 깨진 Parquet'}
@@ -0,0 +1,27 @@
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+# 시장 시간대와 날짜 도우미
+# 공급자 시세의 인덱스는 거래소 시간대가 붙어 오고, 사용자가 고르는 날짜와 저장된 색인은 시간대가 없다.
+# 둘을 비교할 때는 시간대를 떼어 거래소 현지 날짜(벽시계 시각 그대로)로 맞춘다.
+
+MARKET_TZ = ZoneInfo('America/New_York')
+DAYS_PER_YEAR = 365.25
+
+
+def local_dates(index):
+    """시간대가 붙은 DatetimeIndex -> 시간대를 뗀 현지 날짜. 이미 없으면 같은 객체를 돌려준다."""
+    return index.tz_localize(None) if getattr(index, 'tz', None) is not None else index
+
+
+def with_local_dates(frame):
+    """Series/DataFrame 의 인덱스를 local_dates 로 바꾼 것. 이미 시간대가 없으면 복사하지 않고 그대로 돌려준다."""
+    index = local_dates(frame.index)
+    return frame if index is frame.index else frame.set_axis(index)
+
+
+def local_timestamp(value):
+    """날짜 하나 (문자열, datetime, 인덱스에서 꺼낸 값 등) -> 시간대를 뗀 현지 pd.Timestamp."""
+    value = pd.Timestamp(value)
+    return value.tz_localize(None) if value.tz is not None else value
@@ -0,0 +1,237 @@
+"""배당킹/배당귀족 종목 미리 불러오기 (warm-up).
+
+서버 프로세스가 뜨면 백그라운드 스레드가 배당 색인과 같은 종목(dividend_index.index_tickers())의
+시세/배당 이력과 로고를 제한된 스레드 풀에서 공유 캐시에 올려 두고 배당 지급 월 색인(dividend_index)을 갱신한 뒤, 이후 매 거래일 장 마감 뒤에 다시 채운다.
+진행 상황은 status() 와 상태 파일(SNU_WARMUP_STATUS)로 알 수 있다.
+
+    python warmup.py           # 지금 프로세스에서 한 번 채우기 (배포 전 디스크 저장소 미리 채우기)
+    python warmup.py --check   # 상태 파일 기준 준비 완료면 0, 아니면 1 (트래픽 연결 전 readiness 검사)
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import dividend_index
+import logos
+import price_store
+from calendar_chart import LOGO_SIZE
+from dividend_universe import universe_logo_urls
+from frame_cache import next_market_close
+from timeutil import MARKET_TZ
+
+ENABLED_ENV = 'SNU_WARMUP'  # 0 이면 서버에서 자동으로 시작하지 않는다
+WORKERS_ENV = 'SNU_WARMUP_WORKERS'
+STATUS_ENV = 'SNU_WARMUP_STATUS'
+
+DEFAULT_WORKERS = 4  # 사용자 요청이 밀리지 않도록 작게 둔다
+STATUS_WRITE_EVERY = 10  # 몇 건마다 상태 파일을 갱신할지
+RETRY_DELAY = 300  # 회차가 통째로 실패하면 몇 초 뒤에 다시 시도할지
+
+logger = logging.getLogger(__name__)
+
+
+def status_path():
+    return os.environ.get(STATUS_ENV, os.path.join(price_store.STORE_DIR, 'warmup.json'))
+
+
+def _warm_ticker(ticker):
+    price_store.load_history(ticker)
+    price_store.load_dividends(ticker)
+
+
+def _warm_logo(url):
+    if logos.is_placeholder(logos.get_logo(url, size=LOGO_SIZE)):  # 배당 달력에 그릴 크기
+        raise LookupError('로고를 받지 못해 자리표시 이미지를 사용')
+
+
+class Warmup:
+    """한 번 채우기(run_once)와 거래일마다 반복하는 백그라운드 스레드(start)."""
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, status_file=None):
+        self.max_workers = max_workers
+        self.status_file = status_file
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._state = 'idle'  # idle -> running -> done|failed -> running ... (ready 는 첫 회차가 끝난 뒤 계속 True)
+        self._total = 0
+        self._done = 0
+        self._errors = {}
+        self._started_at = None
+        self._finished_at = None
+        self._runs = 0
+
+    @property
+    def ready(self):
+        """첫 회차가 끝났는지 (일부 종목 실패는 errors 에 남고 준비 완료로 본다)."""
+        with self._lock:
+            return self._runs > 0
+
+    def status(self):
+        with self._lock:
+            return {
+                'state': self._state,
+                'ready': self._runs > 0,
+                'done': self._done,
+                'total': self._total,
+                'progress': self._done / self._total if self._total else 0.0,
+                'errors': dict(self._errors),
+                'runs': self._runs,
+                'started_at': self._started_at,
+                'finished_at': self._finished_at,
+                'pid': os.getpid(),
+            }
+
+    def _write_status(self):
+        if not self.status_file:
+            return
+        directory = os.path.dirname(self.status_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{self.status_file}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.status(), f)
+        os.replace(tmp_path, self.status_file)
+
+    def run_once(self, tickers=None, logo_urls=None):
+        """tickers 의 시세/배당과 logo_urls 의 로고를 제한된 스레드 풀에서 불러온다."""
+        tickers = dividend_index.index_tickers() if tickers is None else tickers
+        logo_urls = universe_logo_urls() if logo_urls is None else logo_urls
+        jobs = [(_warm_ticker, ticker) for ticker in tickers] + [(_warm_logo, url) for url in dict.fromkeys(logo_urls)]
+        with self._lock:
+            self._state = 'running'
+            self._total, self._done, self._errors = len(jobs), 0, {}
+            self._started_at, self._finished_at = time.time(), None
+        self._write_status()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='warmup') as pool:
+            futures = {pool.submit(fn, item): item for fn, item in jobs}
+            for future in as_completed(futures):
+                error = future.exception()
+                with self._lock:
+                    self._done += 1
+                    if error is not None:
+                        self._errors[futures[future]] = f'{type(error).__name__}: {error}'
+                    write = self._done % STATUS_WRITE_EVERY == 0
+                if write:
+                    self._write_status()
+                if self._stop.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+        if not self._stop.is_set():
+            # 배당 지급 월 색인도 갱신한다 (위에서 저장소를 채웠으므로 저장소가 바뀐 티커만 다시 계산)
+            try:
+                dividend_index.update_index(tickers, max_workers=self.max_workers)
+            except Exception as error:
+                with self._lock:
+                    self._errors['dividend_index'] = f'{type(error).__name__}: {error}'
+
+        with self._lock:
+            if not self._stop.is_set():  # 중간에 멈춘 회차는 준비 완료로 치지 않는다
+                self._runs += 1
+            self._state = 'done'
+            self._finished_at = time.time()
+        self._write_status()
+        return self.status()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+                # 캐시가 만료되는 다음 장 마감 뒤에 다시 채운다
+                wait = max((next_market_close() - datetime.now(tz=MARKET_TZ)).total_seconds(), 60)
+            except Exception as error:
+                # 공급자 오류, 깨진 Parquet 등으로 회차가 통째로 실패해도 스레드는 살려 두고 잠시 뒤 다시 시도한다
+                logger.exception('warm-up 회차 실패')
+                with self._lock:
+                    self._state = 'failed'
+                    self._errors['warmup'] = f'{type(error).__name__}: {error}'
+                    self._finished_at = time.time()
+                try:
+                    self._write_status()
+                except OSError:
+                    logger.exception('warm-up 상태 파일 쓰기 실패')
+                wait = RETRY_DELAY
+            self._stop.wait(wait)
+
+    def start(self):
+        """백그라운드 스레드를 한 번만 시작한다 (이미 돌고 있으면 아무 것도 하지 않는다)."""
+        with self._lock:
+            if self._thread is not None:
+                return False
+            self._thread = threading.Thread(target=self._loop, name='warmup', daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+
+
+_warmup = None
+_warmup_lock = threading.Lock()
+
+
+def get_warmup():
+    """프로세스에 하나뿐인 Warmup."""
+    global _warmup
+    with _warmup_lock:
+        if _warmup is None:
+            _warmup = Warmup(int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS)), status_path())
+        return _warmup
+
+
+def ensure_started():
+    """서버에서 처음 실행될 때 백그라운드 채우기를 시작한다 (SNU_WARMUP=0 이면 끈다). 재실행마다 불러도 된다."""
+    if os.environ.get(ENABLED_ENV, '1') == '0':
+        return None
+    warmup = get_warmup()
+    warmup.start()
+    return warmup
+
+
+def check(path=None, max_age=None):
+    """상태 파일 기준 준비 완료 여부. max_age(초)를 주면 마지막 완료가 그보다 오래되면 준비 안 됨으로 본다."""
+    try:
+        with open(path or status_path(), encoding='utf-8') as f:
+            status = json.load(f)
+    except (OSError, ValueError):
+        return False, None
+    ready = status.get('ready', False)
+    if ready and max_age is not None:
+        ready = status.get('finished_at') is not None and time.time() - status['finished_at'] <= max_age
+    return ready, status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='배당킹/배당귀족 종목 미리 불러오기')
+    parser.add_argument('--check', action='store_true', help='상태 파일로 준비 완료 여부만 검사')
+    parser.add_argument('--max-age', type=float, help='--check: 마지막 완료 후 허용할 시간 (초)')
+    parser.add_argument('-j', '--workers', type=int, default=int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS)))
+    args = parser.parse_args(argv)
+
+    if args.check:
+        ready, status = check(max_age=args.max_age)
+        if status is None:
+            print(f'상태 파일 없음: {status_path()}')
+        else:
+            print(f"{status['state']} {status['done']}/{status['total']} (실패 {len(status['errors'])})")
+        return 0 if ready else 1
+
+    started = time.perf_counter()
+    status = Warmup(args.workers, status_path()).run_once()
+    print(f"{status['done']}/{status['total']} 완료, 실패 {len(status['errors'])} [{time.perf_counter() - started:.1f}s]")
+    for item, error in status['errors'].items():
+        print(f'  {item}: {error}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())